@@ -0,0 +1,205 @@
+"""
+Tool latency benchmarks against the QtServer stand-in.
+工具延迟基准测试（基于桥通服务端替身）
+
+Drives the registered MCP tools through FastMCP exactly as a client would,
+at several model sizes, and records per tool:
+    p50 / p95 / mean latency, backend call count, bytes sent to and received
+    from the backend, and the size of the text returned to the LLM.
+
+The report is JSON so two releases can be compared:
+
+    uv run python benchmarks/run_benchmarks.py --output bench_report.json
+    uv run python benchmarks/run_benchmarks.py --compare old.json --output new.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from bridge_mcp.standin import StandInServer
+from bridge_mcp.tools import is_error_reply
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _text(result: Any) -> str:
+    # FastMCP returns (content, structured) for tools with an output schema.
+    content = result[0] if isinstance(result, tuple) else result
+    return "".join(getattr(c, "text", "") for c in content)
+
+
+def _scenarios(size: int, repeat: int) -> list[tuple[str, str, dict, int]]:
+    """(label, tool, arguments, repetitions) for one model size."""
+    last = size
+    subset = f"1to{min(size, 100)}"
+    return [
+        ("initialize_model", "initialize_model", {"confirm": True}, 1),
+        ("create_material", "create_material", {"name": "C50", "mat_type": 1, "database": "C50"}, 1),
+        ("create_rectangle_section", "create_rectangle_section", {"name": "R", "width": 2.0, "height": 1.5}, 1),
+        ("create_nodes_linear", "create_nodes_linear", {"count": size, "spacing_x": 1.0}, 1),
+        ("create_beam_elements_linear", "create_beam_elements_linear",
+         {"node_id_start": 1, "count": size - 1, "mat_id": 1, "sec_id": 1}, 1),
+        # Pinned and roller ends (torsion restrained) so the analysis pre-check passes.
+        ("set_support[pin]", "set_support", {"node_id": 1, "rx": True}, 1),
+        ("set_support[roller]", "set_support", {"node_id": last, "dx": False, "rx": True}, 1),
+        ("get_model_info", "get_model_info", {}, repeat),
+        ("get_nodes[all]", "get_nodes", {}, repeat),
+        ("get_nodes[100]", "get_nodes", {"ids": subset}, repeat),
+        ("get_elements[all]", "get_elements", {}, repeat),
+        ("get_elements[100]", "get_elements", {"ids": subset}, repeat),
+        ("move_nodes[1]", "move_nodes", {"ids": last, "offset_z": 0.001}, repeat),
+        ("run_analysis", "run_analysis", {}, 1),
+        ("get_analysis_results[deformation,100]", "get_analysis_results",
+         {"result_type": "deformation", "ids": subset, "stage_id": 1}, repeat),
+        ("get_analysis_results[deformation,all]", "get_analysis_results",
+         {"result_type": "deformation", "ids": f"1to{size}", "stage_id": 1}, repeat),
+        ("get_analysis_results[force,all]", "get_analysis_results",
+         {"result_type": "force", "ids": f"1to{size - 1}", "stage_id": 1}, repeat),
+        ("create_continuous_beam_bridge", "create_continuous_beam_bridge", {}, 1),
+    ]
+
+
+async def _measure(mcp, server: StandInServer, tool: str, arguments: dict, repetitions: int) -> dict:
+    latencies, calls, sent, received, response = [], 0, 0, 0, 0
+    errors, first_error = 0, None
+    for _ in range(repetitions):
+        before = server.stats()["by_command"]
+        start = time.perf_counter()
+        text = _text(await mcp.call_tool(tool, arguments))
+        latencies.append((time.perf_counter() - start) * 1000)
+        after = server.stats()["by_command"]
+        for header, entry in after.items():
+            prev = before.get(header, {"calls": 0, "bytes_in": 0, "bytes_out": 0})
+            calls += entry["calls"] - prev["calls"]
+            sent += entry["bytes_in"] - prev["bytes_in"]
+            received += entry["bytes_out"] - prev["bytes_out"]
+        response += len(text.encode("utf-8"))
+        if is_error_reply(text):
+            errors += 1
+            first_error = first_error or text.strip()[:300]
+    n = len(latencies)
+    return {
+        "samples": n,
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p95_ms": round(_percentile(latencies, 95), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "backend_calls": calls / n,
+        "backend_bytes_sent": sent / n,
+        "backend_bytes_received": received / n,
+        "response_bytes": response / n,
+        "errors": errors,
+        "first_error": first_error,
+    }
+
+
+async def _run(mcp, server: StandInServer, sizes: list[int], repeat: int) -> list[dict]:
+    rows = []
+    for size in sizes:
+        for label, tool, arguments, repetitions in _scenarios(size, repeat):
+            row = {"size": size, "label": label, "tool": tool}
+            row.update(await _measure(mcp, server, tool, arguments, repetitions))
+            rows.append(row)
+            print(
+                f"{size:>7} {label:<42} p50 {row['p50_ms']:>10.2f} ms  p95 {row['p95_ms']:>10.2f} ms  "
+                f"calls {row['backend_calls']:>6.1f}  resp {row['response_bytes'] / 1024:>9.1f} KB"
+                + (f"  errors {row['errors']}" if row["errors"] else ""),
+                file=sys.stderr,
+            )
+    return rows
+
+
+def _compare(rows: list[dict], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["size"], r["label"]): r for r in json.load(f)["results"]}
+    print(f"\nComparison with {baseline_path} (p50 and response size new/old):", file=sys.stderr)
+    for row in rows:
+        old = baseline.get((row["size"], row["label"]))
+        if old and old["p50_ms"] > 0:
+            ratio = row["p50_ms"] / old["p50_ms"]
+            size = row["response_bytes"] / old["response_bytes"] if old["response_bytes"] else 1.0
+            print(f"{row['size']:>7} {row['label']:<42} {ratio:6.2f}x  size {size:5.2f}x  "
+                  f"calls {old['backend_calls']:.1f} → {row['backend_calls']:.1f}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bridge-MCP tool benchmarks (工具基准测试)")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated node counts")
+    parser.add_argument("--repeat", type=int, default=10, help="samples per read/query tool")
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="stand-in latency per command")
+    parser.add_argument("--latency-ms-per-kb", type=float, default=0.0)
+    parser.add_argument("--solve-seconds", type=float, default=0.0)
+    parser.add_argument("--reply-format", choices=("json", "python"), default="json")
+    parser.add_argument("--provider-config", default="{}", help="extra provider_config as JSON")
+    parser.add_argument("--output-format", default="auto",
+                        choices=("auto", "pretty", "json", "csv", "columns"),
+                        help="server-wide output format of query/result tools")
+    parser.add_argument("--output", default="bench_report.json")
+    parser.add_argument("--compare", help="previous report to compare against")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(
+        port=0,
+        latency_ms=args.latency_ms,
+        latency_ms_per_kb=args.latency_ms_per_kb,
+        solve_seconds=args.solve_seconds,
+        reply_format=args.reply_format,
+    ).start()
+    provider_config = {**json.loads(args.provider_config), "server_url": server.url}
+    os.environ["BRIDGE_MCP_PROVIDER_CONFIG"] = json.dumps(provider_config)
+    os.environ["BRIDGE_MCP_OUTPUT_FORMAT"] = args.output_format
+
+    # The server module builds the provider from the environment at import time.
+    from bridge_mcp.server import mcp
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    try:
+        rows = asyncio.run(_run(mcp, server, sizes, args.repeat))
+    finally:
+        server.stop()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": args.repeat,
+            "standin": {
+                "latency_ms": args.latency_ms,
+                "latency_ms_per_kb": args.latency_ms_per_kb,
+                "solve_seconds": args.solve_seconds,
+                "reply_format": args.reply_format,
+            },
+            "provider_config": {k: v for k, v in provider_config.items() if k != "server_url"},
+            "output_format": args.output_format,
+        },
+        "results": rows,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Report written to {args.output}", file=sys.stderr)
+    if args.compare:
+        _compare(rows, args.compare)
+    # A failing or refused scenario no longer times the code it is named after.
+    failed = [row for row in rows if row["errors"]]
+    if failed:
+        for row in failed:
+            print(f"{row['size']:>7} {row['label']:<42} errors {row['errors']}/{row['samples']}: "
+                  f"{row['first_error']}", file=sys.stderr)
+        sys.exit(f"{len(failed)} benchmark scenarios failed (基准测试场景失败)")
+
+
+if __name__ == "__main__":
+    main()
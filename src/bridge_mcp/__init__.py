@@ -3,4 +3,9 @@ Bridge-MCP: MCP server for intelligent bridge structural design and analysis.
 桥梁智能设计 MCP 服务器
 """
 
+import time
+
 __version__ = "0.1.0"
+
+# Taken before any submodule loads, so server startup can report import time.
+_import_started = time.perf_counter()
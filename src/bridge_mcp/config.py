@@ -3,6 +3,8 @@ Configuration management for bridge-mcp.
 配置管理
 """
 
+import json
+import os
 from dataclasses import dataclass, field
 
 
@@ -25,6 +27,24 @@ class BridgeMCPConfig:
     log_level: str = "INFO"
     """Logging level"""
 
+    # Metrics
+    metrics_enabled: bool = True
+    """Time and count tool and backend calls (bridge://server/metrics)"""
+
+    metrics_file: str = ""
+    """If set, dump the metrics snapshot to this JSON file periodically"""
+
+    metrics_interval: float = 60.0
+    """Seconds between metrics dumps"""
+
+    # Output
+    output_format: str = "auto"
+    """Serialisation of tables and results: auto, pretty, json, csv or columns (see formatting.py)"""
+
+    # Startup
+    startup_budget_ms: float = 2000.0
+    """Server start (imports + tool registration) should finish within this; logged at boot"""
+
     # Result image settings
     result_image_dir: str = ""
     """Directory to store result images (结果图片保存目录)"""
@@ -32,3 +52,25 @@ class BridgeMCPConfig:
     # Provider-specific settings
     provider_config: dict = field(default_factory=dict)
     """Provider-specific configuration options"""
+
+    @classmethod
+    def from_env(cls) -> "BridgeMCPConfig":
+        """
+        Build a config from environment variables.
+        BRIDGE_MCP_PROVIDER_CONFIG holds provider options as a JSON object,
+        e.g. '{"model_mirror": true}'.
+        BRIDGE_MCP_METRICS=0 disables metrics; BRIDGE_MCP_METRICS_FILE and
+        BRIDGE_MCP_METRICS_INTERVAL enable the periodic dump.
+        BRIDGE_MCP_STARTUP_BUDGET_MS sets the startup time budget.
+        BRIDGE_MCP_OUTPUT_FORMAT selects the output format.
+        """
+        config = cls()
+        raw = os.environ.get("BRIDGE_MCP_PROVIDER_CONFIG", "").strip()
+        if raw:
+            config.provider_config = json.loads(raw)
+        config.metrics_enabled = os.environ.get("BRIDGE_MCP_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+        config.metrics_file = os.environ.get("BRIDGE_MCP_METRICS_FILE", config.metrics_file)
+        config.metrics_interval = float(os.environ.get("BRIDGE_MCP_METRICS_INTERVAL", config.metrics_interval))
+        config.output_format = os.environ.get("BRIDGE_MCP_OUTPUT_FORMAT", config.output_format).strip().lower()
+        config.startup_budget_ms = float(os.environ.get("BRIDGE_MCP_STARTUP_BUDGET_MS", config.startup_budget_ms))
+        return config
@@ -0,0 +1,103 @@
+"""
+Output formatting for tool and resource responses.
+工具与资源输出格式
+
+One server-wide option (BridgeMCPConfig.output_format) decides how tables
+and results are serialised:
+
+    auto     pretty JSON for model tables, compact JSON for analysis results
+    pretty   indented JSON (easiest to read, largest)
+    json     compact JSON without whitespace
+    csv      header line plus one row per record; nested dicts become
+             dotted columns, lists are space-joined
+    columns  column-oriented JSON: {"id": [...], "x": [...], ...}
+
+csv and columns only apply to lists of records; anything else (summaries,
+name lists) falls back to compact JSON.
+"""
+
+import csv
+import io
+import json
+from typing import Any
+
+OUTPUT_FORMATS = ("auto", "pretty", "json", "csv", "columns")
+
+_output_format = "auto"
+
+
+def set_output_format(fmt: str) -> None:
+    global _output_format
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{fmt}'; choose from {', '.join(OUTPUT_FORMATS)}")
+    _output_format = fmt
+
+
+def get_output_format() -> str:
+    return _output_format
+
+
+def _is_table(obj: Any) -> bool:
+    return isinstance(obj, list) and bool(obj) and all(isinstance(r, dict) for r in obj)
+
+
+def _flatten(record: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _flat_table(rows: list[dict]) -> tuple[list[str], list[dict]]:
+    flat = [_flatten(r) for r in rows]
+    keys: dict[str, None] = {}
+    for row in flat:
+        keys.update(dict.fromkeys(row))
+    return list(keys), flat
+
+
+def to_csv(rows: list[dict]) -> str:
+    """Records as CSV text; list values are joined with spaces."""
+    names, flat = _flat_table(rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(names)
+    for row in flat:
+        writer.writerow(
+            " ".join(str(x) for x in v) if isinstance(v, (list, tuple)) else ("" if v is None else v)
+            for v in (row.get(n) for n in names)
+        )
+    return buffer.getvalue().rstrip("\n")
+
+
+def to_column_json(rows: list[dict]) -> str:
+    """Records as one compact JSON object of equal-length columns."""
+    names, flat = _flat_table(rows)
+    columns = {n: [row.get(n) for row in flat] for n in names}
+    return json.dumps(columns, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def format_data(obj: Any, result: bool = False, fmt: str | None = None) -> str:
+    """
+    Serialise `obj` in the server-wide output format (or `fmt` if given).
+    `result=True` marks analysis results, which "auto" renders compactly.
+    """
+    if isinstance(obj, str):
+        return obj
+    fmt = fmt or _output_format
+    if fmt == "auto":
+        fmt = "json" if result else "pretty"
+    try:
+        if fmt == "csv" and _is_table(obj):
+            return to_csv(obj)
+        if fmt == "columns" and _is_table(obj):
+            return to_column_json(obj)
+        if fmt == "pretty":
+            return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+    except Exception:
+        return str(obj)
@@ -0,0 +1,200 @@
+"""
+Background analysis jobs.
+后台分析任务
+
+A solve can take most of an hour. submit() returns a job ID at once and
+runs the pre-check and solve on the backend worker thread, so the solve is
+serialised with every other backend call and a second job simply waits its
+turn in the queue. Jobs report their phase and elapsed time, can be awaited
+with progress callbacks, and can be cancelled while queued or between
+phases. A solve in progress cannot be interrupted: the backend offers no
+command for it. The solve is bounded by the transport's solve_timeout, not
+its read_timeout, so the job holds the backend slot until the GUI finishes.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.tools import analysis_precheck
+from bridge_mcp.worker import BackendWorker
+
+logger = logging.getLogger("bridge-mcp.jobs")
+
+FINAL_STATES = ("completed", "skipped", "blocked", "failed", "cancelled")
+
+
+class AnalysisJob:
+    """State of one submitted analysis."""
+
+    __slots__ = (
+        "id", "skip_check", "force", "state", "phase", "submitted_at", "started_at",
+        "finished_at", "message", "errors", "cancel_requested", "task",
+    )
+
+    def __init__(self, job_id: str, skip_check: bool, force: bool):
+        self.id = job_id
+        self.skip_check = skip_check
+        self.force = force
+        self.state = "queued"
+        self.phase = "waiting for the backend"
+        self.submitted_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.message = ""
+        self.errors: list[str] = []
+        self.cancel_requested = False
+        self.task: asyncio.Task | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in FINAL_STATES
+
+    def elapsed(self) -> float:
+        """Seconds since the job started running (0 while queued)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "state": self.state,
+            "phase": self.phase,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "elapsed_s": round(self.elapsed(), 1),
+            "waited_s": round((self.started_at or time.time()) - self.submitted_at, 1),
+            "message": self.message,
+            "errors": list(self.errors),
+            "cancel_requested": self.cancel_requested,
+        }
+
+
+class AnalysisJobs:
+    """
+    FIFO of analysis jobs executed through the backend worker.
+
+    Args:
+        worker: the backend worker every provider call goes through
+        provider: the active provider
+        keep: finished jobs kept for status queries
+    """
+
+    def __init__(self, worker: BackendWorker, provider: BridgeProvider, keep: int = 20):
+        self.worker = worker
+        self.provider = provider
+        self.keep = keep
+        self._jobs: OrderedDict[str, AnalysisJob] = OrderedDict()
+        self._ids = itertools.count(1)
+
+    def submit(self, skip_check: bool = False, force: bool = False) -> AnalysisJob:
+        """Queue a solve; must be called from the event loop."""
+        job = AnalysisJob(f"job-{next(self._ids)}", skip_check, force)
+        self._jobs[job.id] = job
+        job.task = asyncio.get_running_loop().create_task(self._run(job))
+        self._prune()
+        return job
+
+    async def _run(self, job: AnalysisJob) -> None:
+        try:
+            await self.worker.submit("analysis_job", self._execute, {"job": job})
+        except Exception as e:
+            job.state, job.message = "failed", str(e)
+        finally:
+            job.finished_at = job.finished_at or time.time()
+            logger.info(f"Analysis {job.id} {job.state} after {job.elapsed():.1f}s")
+
+    def _execute(self, job: AnalysisJob) -> None:
+        """Runs on the backend thread; checks for cancellation between phases."""
+        if job.cancel_requested:
+            return  # Cancelled while queued.
+        job.state, job.started_at = "running", time.time()
+        if not job.skip_check:
+            job.phase = "pre-check"
+            job.errors = analysis_precheck(self.provider)
+            if job.errors:
+                job.state, job.phase = "blocked", "pre-check failed"
+                job.message = "Pre-check found problems; fix them or resubmit with skip_check=True"
+                return
+            if job.cancel_requested:
+                job.state, job.phase = "cancelled", "cancelled after pre-check"
+                return
+        job.phase = "solving"
+        try:
+            result = self.provider.run_analysis(force=job.force)
+        except Exception as e:
+            job.state, job.phase, job.message = "failed", "solve failed", str(e)
+            return
+        if result["skipped"]:
+            job.state, job.phase = "skipped", "model unchanged"
+            job.message = "Model and analysis settings unchanged since the last solve; results are current"
+        else:
+            job.state, job.phase = "completed", "done"
+            job.message = f"Solved in {result['seconds']:.1f} s"
+        if job.cancel_requested:
+            job.message += " (cancel arrived while solving; the backend cannot interrupt a solve)"
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if j.done]
+        for job in finished[:max(len(finished) - self.keep, 0)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: str = "") -> AnalysisJob:
+        """A job by ID; the most recent job when job_id is empty."""
+        if not self._jobs:
+            raise ValueError("No analysis job has been submitted (尚未提交分析任务)")
+        if not job_id:
+            return next(reversed(self._jobs.values()))
+        if job_id not in self._jobs:
+            raise ValueError(f"Unknown job '{job_id}' (未知任务)")
+        return self._jobs[job_id]
+
+    def queue_position(self, job: AnalysisJob) -> int:
+        """1 for the next job to run, 0 when the job is not queued."""
+        if job.state != "queued":
+            return 0
+        queued = [j for j in self._jobs.values() if j.state == "queued"]
+        return queued.index(job) + 1
+
+    def jobs(self) -> list[AnalysisJob]:
+        return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> AnalysisJob:
+        job = self.get(job_id)
+        if not job.done:
+            job.cancel_requested = True
+            if job.state == "queued":
+                job.state, job.phase, job.finished_at = "cancelled", "cancelled while queued", time.time()
+        return job
+
+    def estimate_seconds(self) -> float | None:
+        """Mean duration of recent successful solves, used as the progress total."""
+        try:
+            solves = [e["seconds"] for e in self.provider.get_analysis_history()["solves"] if e["ok"]]
+        except Exception:
+            return None
+        return sum(solves[-5:]) / len(solves[-5:]) if solves else None
+
+    async def wait(
+        self,
+        job: AnalysisJob,
+        timeout: float,
+        on_progress: Callable[[AnalysisJob], Awaitable[None]] | None = None,
+        interval: float = 2.0,
+    ) -> bool:
+        """Wait up to `timeout` seconds for the job to finish; True when it did."""
+        deadline = time.monotonic() + timeout
+        while not job.done:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if on_progress is not None:
+                await on_progress(job)
+            await asyncio.wait({job.task}, timeout=min(interval, remaining))
+        return True
@@ -0,0 +1,194 @@
+"""
+Runtime metrics for tools and backend calls.
+运行指标：工具调用与后端请求统计
+
+Every MCP tool invocation and every backend command is timed and counted:
+latency histograms, error counts and payload bytes, plus the provider's own
+counters (model refreshes, parser and mirror statistics). The snapshot is
+served as the `bridge://server/metrics` resource and can be written to a
+local JSON file periodically.
+
+When disabled, the record_* methods return on the first line and no
+background thread is started.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable
+
+logger = logging.getLogger("bridge-mcp.metrics")
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended.
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with count, sum and max."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(min(BUCKETS_MS[i], self.max_ms)) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": {
+                (f"le_{b}" if i < len(BUCKETS_MS) else "inf"): n
+                for i, (b, n) in enumerate(zip((*BUCKETS_MS, None), self.counts))
+                if n
+            },
+        }
+
+
+class _Series:
+    __slots__ = ("latency", "errors", "bytes_in", "bytes_out")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.latency.to_dict(),
+            "errors": self.errors,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class Metrics:
+    """
+    Thread-safe registry of tool and backend-call metrics.
+
+    Args:
+        enabled: record anything at all (默认开启)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._tools: dict[str, _Series] = {}
+        self._backend: dict[str, _Series] = {}
+        self._sources: dict[str, Callable[[], Any]] = {}
+        self._dump_thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    # ── Recording ──────────────────────────────────────────────────────
+
+    def record_tool(self, name: str, seconds: float, error: bool = False,
+                    bytes_in: int = 0, bytes_out: int = 0) -> None:
+        if not self.enabled:
+            return
+        self._record(self._tools, name, seconds, error, bytes_in, bytes_out)
+
+    def record_backend(self, command: str, seconds: float, bytes_sent: int = 0,
+                       bytes_received: int = 0, error: bool = False) -> None:
+        if not self.enabled:
+            return
+        self._record(self._backend, command, seconds, error, bytes_sent, bytes_received)
+
+    def _record(self, table: dict, key: str, seconds: float, error: bool,
+                bytes_in: int, bytes_out: int) -> None:
+        with self._lock:
+            series = table.get(key)
+            if series is None:
+                series = table[key] = _Series()
+            series.latency.observe(seconds * 1000)
+            series.errors += int(error)
+            series.bytes_in += bytes_in
+            series.bytes_out += bytes_out
+
+    def add_source(self, name: str, fn: Callable[[], Any]) -> None:
+        """Include `fn()` under `name` in every snapshot (e.g. provider counters)."""
+        self._sources[name] = fn
+
+    # ── Reporting ──────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict[str, Any]:
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            tools = {k: s.to_dict() for k, s in sorted(self._tools.items())}
+            backend = {k: s.to_dict() for k, s in sorted(self._backend.items())}
+        snapshot: dict[str, Any] = {
+            "enabled": True,
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "tool_calls": sum(t["count"] for t in tools.values()),
+            "backend_calls": sum(b["count"] for b in backend.values()),
+            "tools": tools,
+            "backend": backend,
+        }
+        for name, fn in self._sources.items():
+            try:
+                snapshot[name] = fn()
+            except Exception as e:
+                snapshot[name] = {"error": str(e)}
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self._backend.clear()
+        self.started_at = time.time()
+
+    # ── Periodic dump ──────────────────────────────────────────────────
+
+    def dump(self, path: str) -> None:
+        """Write the snapshot to `path` atomically."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp, path)
+
+    def start_dump(self, path: str, interval: float = 60.0) -> None:
+        """Dump the snapshot to `path` every `interval` seconds on a daemon thread."""
+        if not self.enabled or not path or self._dump_thread is not None:
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.dump(path)
+                except OSError as e:
+                    logger.warning(f"Metrics dump to {path} failed: {e}")
+
+        self._dump_thread = threading.Thread(target=loop, name="bridge-metrics", daemon=True)
+        self._dump_thread.start()
+        logger.info(f"Dumping metrics to {path} every {interval:g}s")
+
+    def stop_dump(self) -> None:
+        self._stop.set()
@@ -5,7 +5,8 @@ Defines the interface that backend software adapters must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
 
 
 class BridgeProvider(ABC):
@@ -50,12 +51,109 @@ class BridgeProvider(ABC):
         """
         ...
 
+    # ── Edit Sessions ──────────────────────────────────────────────────
+
+    @abstractmethod
+    def begin_edit_session(self, name: str = "", idle_timeout: float | None = None) -> dict[str, Any]:
+        """
+        Open an edit session: per-write model refreshes are deferred until commit.
+        Sessions nest; only the outermost commit refreshes the model. An
+        outermost session left without writes for `idle_timeout` seconds
+        (None: the provider default, 0: never) is closed automatically.
+        开始编辑会话，期间暂停每次写入后的模型刷新
+        """
+        ...
+
+    @abstractmethod
+    def commit_edit_session(self) -> dict[str, Any]:
+        """
+        Close the current edit session and refresh the model once.
+        Returns session statistics (suppressed_refreshes, duration_s, ...).
+        提交编辑会话，统一刷新一次模型
+        """
+        ...
+
+    @abstractmethod
+    def abort_edit_session(self) -> dict[str, Any]:
+        """
+        Force-close the edit session at every nesting level and issue the
+        deferred refresh. Writes already made are kept.
+        强制关闭编辑会话
+        """
+        ...
+
+    @abstractmethod
+    def get_edit_session_status(self) -> dict[str, Any]:
+        """
+        Return the state of the open edit session, if any. Read-only: a
+        session idle past its timeout is reported, not closed.
+        获取编辑会话状态
+        """
+        ...
+
+    @contextmanager
+    def edit_session(self, name: str = "") -> Iterator[dict[str, Any]]:
+        """
+        Context manager around begin/commit_edit_session. The session is
+        committed even if the body raises, so the GUI reflects partial writes.
+        编辑会话上下文管理器
+        """
+        # Closed by the finally below, so it never needs the idle timeout.
+        self.begin_edit_session(name, idle_timeout=0)
+        try:
+            yield self.get_edit_session_status()
+        finally:
+            self.commit_edit_session()
+
+    @contextmanager
+    def cache_only(self) -> Iterator[None]:
+        """
+        Serve calls made inside this block from local caches only; anything
+        that would reach the backend raises instead of waiting for it.
+        Used to answer read-only requests while a long operation is running.
+        仅使用本地缓存应答（后端忙时的只读请求）
+        """
+        yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """
+        Give the calling thread sole use of the provider's local state
+        (mirror, caches, indexes) for the block. cache_only() takes the same
+        guard, so a reader never sees that state in the middle of an update.
+        独占提供者本地状态
+        """
+        yield
+
+
+    # ── Model Revision ─────────────────────────────────────────────────
+
+    @abstractmethod
+    def get_model_revision(self) -> int:
+        """
+        Monotonic counter bumped by every model write (and analysis run) made
+        through this provider. Equal revisions mean no write in between.
+        模型修改版本号
+        """
+        ...
+
+    @abstractmethod
+    def get_model_fingerprint(self, verify: bool = False) -> dict[str, Any]:
+        """
+        Content hash of the node/element/material/section/boundary/load tables,
+        kept per table. Tables written since their last hash are re-read;
+        `verify=True` re-reads all of them, which also detects (and invalidates
+        caches for) edits made directly in the GUI.
+        Returns {"fingerprint", "revision", "tables", "rehashed", "external_changes", "seconds"}.
+        模型内容指纹
+        """
+        ...
 
     # ── Model Information ──────────────────────────────────────────────
 
     @abstractmethod
     def update_model(self) -> None:
-        """Refresh the model view in the software. 刷新模型界面"""
+        """Refresh the model view in the software now, even inside an edit session. 刷新模型界面"""
         ...
 
     @abstractmethod
@@ -77,6 +175,17 @@ class BridgeProvider(ABC):
         """Get element information. 获取单元信息"""
         ...
 
+    @abstractmethod
+    def get_table_page(self, table: str, ids: Any = None, offset: int = 0, limit: int = 0,
+                       after: int | None = None) -> dict[str, Any]:
+        """
+        Page through 'nodes' or 'elements' in ascending ID order.
+        Start at `offset`, or just past ID `after` (cursor); limit=0 means no limit.
+        Returns {"rows", "total", "offset", "next_after"}; next_after is None on the last page.
+        分页获取节点/单元
+        """
+        ...
+
     @abstractmethod
     def get_material_data(self) -> list[dict]:
         """Get material information. 获取材料信息"""
@@ -112,6 +221,77 @@ class BridgeProvider(ABC):
         """Get structure group names. 获取结构组名称"""
         ...
 
+    # ── Model Mirror ───────────────────────────────────────────────────
+
+    @abstractmethod
+    def resync_model_mirror(self, enable: bool = True) -> dict[str, Any]:
+        """
+        Drop the local model mirror and reload every mirrored table from the
+        backend (use after editing the model directly in the GUI).
+        重新同步本地模型镜像
+        """
+        ...
+
+    @abstractmethod
+    def get_model_mirror_status(self) -> dict[str, Any]:
+        """Return mirror state: enabled flag, per-table row counts, hits/misses. 获取模型镜像状态"""
+        ...
+
+    # ── Spatial Queries ────────────────────────────────────────────────
+
+    @abstractmethod
+    def find_nearest_nodes(self, x: float, y: float, z: float, count: int = 1) -> list[dict]:
+        """The `count` nodes closest to (x, y, z), nearest first, with their distance. 最近节点"""
+        ...
+
+    @abstractmethod
+    def find_nodes_within(self, x: float, y: float, z: float, radius: float) -> list[dict]:
+        """Nodes within `radius` of (x, y, z), nearest first. 半径范围内节点"""
+        ...
+
+    @abstractmethod
+    def find_nodes_in_box(self, lo: list[float], hi: list[float]) -> list[dict]:
+        """Nodes inside the axis-aligned box lo..hi, in ID order. 包围盒内节点"""
+        ...
+
+    @abstractmethod
+    def find_elements_at_point(self, x: float, y: float, z: float, tolerance: float = 1e-3) -> list[dict]:
+        """Elements passing within `tolerance` of (x, y, z), nearest first. 点所在单元"""
+        ...
+
+    @abstractmethod
+    def find_duplicates(
+        self, tolerance: float = 1e-4, incremental: bool = False, update_baseline: bool = False
+    ) -> dict[str, Any]:
+        """
+        Find coincident nodes and duplicate/overlapping elements locally.
+        Returns {"coincident_nodes": [[ids]], "overlapping_elements": [{"ids", "kind"}],
+        "incremental", "checked", "seconds"}. With incremental=True only entities
+        added since the last check run with update_baseline=True are compared
+        against the model.
+        查找重合节点与重叠单元
+        """
+        ...
+
+    @abstractmethod
+    def get_spatial_index_status(self) -> dict[str, Any]:
+        """Return spatial index size, build count/time and query count. 获取空间索引状态"""
+        ...
+
+    # ── Diagnostics ────────────────────────────────────────────────────
+
+    def set_call_observer(self, observer: Callable[..., None] | None) -> None:
+        """
+        Register a callback invoked after every backend call as
+        observer(command, seconds, bytes_sent, bytes_received, error).
+        Providers without a wire protocol may ignore it.
+        后端调用观察者（用于运行指标）
+        """
+
+    def get_performance_stats(self) -> dict[str, Any]:
+        """Provider-side counters (refreshes, caches, parsing). 性能统计"""
+        return {}
+
     # ── Modeling Operations ────────────────────────────────────────────
 
     @abstractmethod
@@ -134,6 +314,18 @@ class BridgeProvider(ABC):
         """Renumber nodes. 节点重新编号"""
         ...
 
+    @abstractmethod
+    def renumber_nodes_rcm(self, apply: bool = True) -> dict[str, Any]:
+        """
+        Reverse Cuthill–McKee renumbering over the existing node IDs, computed
+        locally from the element table and links. Returns "before"/"after"
+        {"bandwidth", "profile"}, "ids"/"new_ids" (changed nodes only),
+        "changed", "applied" and "seconds"; applied in one renumber call only
+        when it improves the profile.
+        带宽优化节点重编号（逆 Cuthill–McKee）
+        """
+        ...
+
     @abstractmethod
     def add_elements(self, ele_data: list[list], **kwargs) -> None:
         """Add elements to the model. 添加单元"""
@@ -149,6 +341,22 @@ class BridgeProvider(ABC):
         """Renumber elements. 单元编号重排序"""
         ...
 
+    @abstractmethod
+    def subdivide_elements(self, ids: Any, segments: int = 2, ratio: float = 1.0) -> dict[str, Any]:
+        """
+        Split beam/truss elements into `segments` pieces (`ratio` = last/first
+        segment length) carrying material, section, beta angle and structure
+        group membership; the first piece keeps the parent ID. Elements
+        referenced by element loads, end constraints, effective widths or
+        pre-stress/tension/deviation loads are not split. The plan is checked
+        before the first write and the parents are restored if a write fails.
+        Returns "elements", "new_nodes", "new_elements", "groups", "skipped"
+        (not beams or trusses), "refused" ({element ID: [data labels]}) and
+        "seconds".
+        单元细分
+        """
+        ...
+
     @abstractmethod
     def revert_local_orientation(self, ids: Any) -> None:
         """Revert local orientation of frame elements. 反转杆系单元局部方向"""
@@ -250,8 +458,21 @@ class BridgeProvider(ABC):
         ...
 
     @abstractmethod
-    def run_analysis(self) -> None:
-        """Run structural analysis (执行计算/分析)."""
+    def run_analysis(self, force: bool = False) -> dict[str, Any]:
+        """
+        Run structural analysis (执行计算/分析).
+
+        The solve is skipped when no model write, analysis-settings change or
+        GUI edit (per the model fingerprint) happened since the last successful
+        solve; `force=True` solves regardless. Returns {"skipped": True,
+        "last_solve": {...}} or the solve record {"skipped": False, "seconds",
+        "ok", "forced", "reasons", "started_at"}.
+        """
+        ...
+
+    @abstractmethod
+    def get_analysis_history(self) -> dict[str, Any]:
+        """Last successful solve and the duration of recent solves. 计算历史"""
         ...
 
     # ── Result Extraction ──────────────────────────────────────────────
@@ -276,6 +497,21 @@ class BridgeProvider(ABC):
         """Get support reaction results. 获取反力结果"""
         ...
 
+    @abstractmethod
+    def get_result_columns(self, result_type: str, ids: Any, stage_id: int, **kwargs) -> dict[str, Any]:
+        """
+        Get a result ('deformation', 'force', 'stress', 'reaction') as NumPy
+        columns keyed by dotted field name; repeated queries are served from
+        the result cache until the model changes or analysis is re-run.
+        获取列式分析结果（带缓存）
+        """
+        ...
+
+    @abstractmethod
+    def get_result_cache_status(self) -> dict[str, Any]:
+        """Return result cache size, hit/miss counts and the model revision. 获取结果缓存状态"""
+        ...
+
     # ── Visualization ──────────────────────────────────────────────────
 
     @abstractmethod
@@ -299,6 +535,16 @@ class BridgeProvider(ABC):
         """
         ...
 
+    @abstractmethod
+    def check_connectivity(self) -> dict[str, Any]:
+        """
+        Local connectivity and support pre-check: connected components (with
+        supports and free rigid-body modes), dangling nodes, and elements
+        referencing missing nodes/materials/sections. Adds "seconds".
+        连通性与机构预检查
+        """
+        ...
+
     @abstractmethod
     def add_check_load_combine(self, name: str, standard: int, kind: int, **kwargs) -> None:
         """Add check load combination. 添加检算荷载组合"""
@@ -0,0 +1,366 @@
+"""
+Local connectivity and mechanism pre-check.
+连通性与机构预检查（本地计算）
+
+Runs on the node arrays of the spatial index and the mirrored element and
+boundary tables, before anything is sent to the solver:
+
+  - element-node adjacency (plus elastic and master-slave links) is
+    labelled into connected components;
+  - nodes used by no element or link are reported as dangling;
+  - elements referencing missing nodes, materials or sections are listed;
+  - per component, the supports are assembled into a 6×6 rigid-body
+    restraint matrix; its null space gives the rigid-body modes the
+    supports leave free (a component without supports has all six).
+
+Internal mechanisms (e.g. hinges from beam end releases) are not detected.
+"""
+
+import json
+from typing import Any
+
+import numpy as np
+
+from bridge_mcp.providers.id_set import compress_ids
+from bridge_mcp.providers.model_mirror import expand_ids
+
+DOF_NAMES = ("UX", "UY", "UZ", "RX", "RY", "RZ")
+_AXES = np.eye(3)
+# Frame element types that need a section; plates (4) reference a thickness.
+_FRAME_TYPES = (1, 2, 3)
+
+
+def component_labels(n: int, pairs: np.ndarray) -> np.ndarray:
+    """
+    Connected-component label (lowest member row) of rows 0..n-1 joined by `pairs`.
+    Roots are hooked onto the smaller root, then paths are fully compressed.
+    """
+    labels = np.arange(n)
+    if not len(pairs):
+        return labels
+    a, b = pairs[:, 0], pairs[:, 1]
+    while True:
+        la, lb = labels[a], labels[b]
+        differ = la != lb
+        if not differ.any():
+            return labels
+        a, b, la, lb = a[differ], b[differ], la[differ], lb[differ]
+        np.minimum.at(labels, np.maximum(la, lb), np.minimum(la, lb))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def _id_list(value: Any) -> list[int]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, (int, np.integer)):
+        return [int(value)]
+    return [int(i) for i in expand_ids(value)]
+
+
+def _restraint(info: Any) -> np.ndarray:
+    """Restrained DOFs [X,Y,Z,Rx,Ry,Rz] of a support; unreadable info counts as fixed."""
+    if isinstance(info, str):
+        try:
+            info = json.loads(info)
+        except ValueError:
+            info = [c == "1" for c in info if c in "01"]
+    try:
+        mask = np.asarray(info, dtype=float).ravel()[:6] != 0
+    except (TypeError, ValueError):
+        return np.ones(6, dtype=bool)
+    return mask if len(mask) == 6 else np.ones(6, dtype=bool)
+
+
+def _elastic_restraint(record: dict) -> np.ndarray:
+    info = record.get("boundary_info") or []
+    if int(record.get("support_type", 1) or 1) != 1 and len(info) == 2:
+        # Tension/compression-only: [direction (1-X 2-Y 3-Z), stiffness]
+        mask = np.zeros(6, dtype=bool)
+        direction = int(info[0]) - 1
+        if 0 <= direction < 3 and float(info[1]) != 0:
+            mask[direction] = True
+        return mask
+    return _restraint(info)
+
+
+def _equation_masters(record: dict) -> list[int]:
+    """Master node IDs of a constraint equation ([[node, dof, factor], ...])."""
+    masters = []
+    for item in record.get("master_info") or []:
+        try:
+            masters.append(int(item[0]))
+        except (TypeError, ValueError, IndexError):
+            continue
+    return masters
+
+
+def _support_rows(boundaries: dict[str, list[dict]]) -> tuple[list[int], list[np.ndarray]]:
+    node_ids: list[int] = []
+    masks: list[np.ndarray] = []
+    for key, restraint in (("general_supports", lambda r: _restraint(r.get("boundary_info"))),
+                           ("elastic_supports", _elastic_restraint),
+                           # A 6x6 stiffness property: counted as restraining every DOF.
+                           ("general_elastic_supports", lambda r: np.ones(6, dtype=bool))):
+        for record in boundaries.get(key) or []:
+            mask = restraint(record)
+            for node_id in _id_list(record.get("node_id", record.get("node_ids"))):
+                node_ids.append(node_id)
+                masks.append(mask)
+    # A constraint equation without master terms fixes its slave DOF.
+    for record in boundaries.get("constraint_equations") or []:
+        dof, node = record.get("sec_dof"), record.get("sec_node")
+        if node is not None and not _equation_masters(record) and dof is not None and 1 <= int(dof) <= 6:
+            mask = np.zeros(6, dtype=bool)
+            mask[int(dof) - 1] = True
+            node_ids.append(int(node))
+            masks.append(mask)
+    return node_ids, masks
+
+
+def _link_pairs(boundaries: dict[str, list[dict]]) -> list[tuple[int, int]]:
+    pairs: list[tuple[int, int]] = []
+    for record in boundaries.get("elastic_links") or []:
+        start, end = record.get("start_id"), record.get("end_id")
+        if start is not None and end is not None:
+            pairs.append((int(start), int(end)))
+    for record in boundaries.get("master_slave_links") or []:
+        if "node_ids" in record and isinstance(record["node_ids"], list):
+            pairs.extend((int(m), int(s)) for m, s in record["node_ids"])
+            continue
+        master = record.get("master_id")
+        if master is not None:
+            pairs.extend((int(master), s) for s in _id_list(record.get("slave_id")))
+    for record in boundaries.get("boundary_element_links") or []:
+        start = record.get("node_i", record.get("start_id"))
+        end = record.get("node_j", record.get("end_id"))
+        if start is not None and end is not None:
+            pairs.append((int(start), int(end)))
+    for record in boundaries.get("constraint_equations") or []:
+        node = record.get("sec_node")
+        if node is not None:
+            pairs.extend((m, int(node)) for m in _equation_masters(record))
+    return pairs
+
+
+def rigid_body_modes(points: np.ndarray, masks: np.ndarray, component: np.ndarray,
+                     count: int) -> tuple[np.ndarray, list[list[str]]]:
+    """
+    Rigid-body modes left free by the supports of each component.
+
+    `points` are support coordinates (already centred and scaled per
+    component), `masks` their restrained DOFs and `component` their
+    component index. Each restrained translation e contributes the row
+    [e, p × e], each restrained rotation [0, e]; the null space of the
+    stacked rows per component is the set of free rigid-body motions.
+    Returns (number of free modes, free DOF names) per component.
+    """
+    gram = np.zeros((count, 6, 6))
+    support, dof = np.nonzero(masks)
+    rows = np.zeros((len(support), 6))
+    translation = dof < 3
+    rows[translation, dof[translation]] = 1.0
+    rows[translation, 3:] = np.cross(points[support[translation]], _AXES[dof[translation]])
+    rows[~translation, dof[~translation]] = 1.0
+    np.add.at(gram, component[support], rows[:, :, None] * rows[:, None, :])
+
+    values, vectors = np.linalg.eigh(gram)
+    free = values < 1e-8 * np.maximum(values[:, -1:], 1.0)
+    modes = free.sum(axis=1)
+    names: list[list[str]] = []
+    for c in range(count):
+        if not modes[c]:
+            names.append([])
+            continue
+        null = vectors[c][:, free[c]]
+        participation = (null ** 2).sum(axis=1)
+        dofs = [DOF_NAMES[d] for d in np.flatnonzero(participation > 0.5)]
+        names.append(dofs or [DOF_NAMES[int(participation.argmax())]])
+    return modes, names
+
+
+def check_connectivity(
+    node_ids: np.ndarray,
+    xyz: np.ndarray,
+    elements: list[dict],
+    boundaries: dict[str, list[dict]],
+    material_ids: set[int] | None = None,
+    section_ids: set[int] | None = None,
+    unreadable: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Connectivity and support report of a model.
+
+    Components are listed largest first as {"nodes", "elements", "first_node",
+    "supports", "rigid_body_modes", "free_dofs"}; dangling nodes are not
+    counted as components. `unreadable` names boundary tables whose query
+    failed; the report passes them on so missing supports are not blamed on
+    the model.
+    """
+    n = len(node_ids)
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+
+    def rows_of(ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if not n:
+            return np.zeros(len(ids), dtype=np.int64), np.zeros(len(ids), dtype=bool)
+        pos = np.searchsorted(sorted_ids, ids).clip(0, n - 1)
+        return order[pos], sorted_ids[pos] == ids
+
+    # Element → node incidence, flattened.
+    counts = np.fromiter((len(e["node_ids"]) for e in elements), dtype=np.int64, count=len(elements))
+    flat = np.fromiter((i for e in elements for i in e["node_ids"]), dtype=np.int64, count=int(counts.sum()))
+    element_ids = np.fromiter((e["id"] for e in elements), dtype=np.int64, count=len(elements))
+    owner = np.repeat(np.arange(len(elements)), counts)
+    flat_rows, flat_found = rows_of(flat)
+
+    missing_nodes: dict[int, list[int]] = {}
+    for k in np.flatnonzero(~flat_found):
+        missing_nodes.setdefault(int(element_ids[owner[k]]), []).append(int(flat[k]))
+
+    # Each node of an element is joined to the element's first node.
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    ok = flat_found & flat_found[first]
+    pairs = [np.stack([flat_rows[first[ok]], flat_rows[ok]], axis=1)]
+    link_ids = np.array(_link_pairs(boundaries), dtype=np.int64).reshape(-1, 2)
+    link_rows, link_found = rows_of(link_ids.ravel())
+    link_rows, link_found = link_rows.reshape(-1, 2), link_found.reshape(-1, 2).all(axis=1)
+    pairs.append(link_rows[link_found])
+    labels = component_labels(n, np.concatenate(pairs))
+
+    used = np.zeros(n, dtype=bool)
+    used[flat_rows[flat_found]] = True
+    used[link_rows[link_found].ravel()] = True
+    dangling = np.sort(node_ids[~used])
+
+    # Components over used nodes, numbered 0..k-1.
+    roots, component_of = np.unique(labels[used], return_inverse=True)
+    comp = np.full(n, -1)
+    comp[used] = component_of
+    k = len(roots)
+    node_count = np.bincount(component_of, minlength=k)
+    starts = (np.cumsum(counts) - counts)[counts > 0]
+    starts = starts[flat_found[starts]]
+    element_count = np.bincount(comp[flat_rows[starts]], minlength=k)
+    first_node = np.full(k, np.iinfo(np.int64).max)
+    np.minimum.at(first_node, component_of, node_ids[used])
+
+    # Supports, centred and scaled per component for a well-conditioned check.
+    support_ids, support_masks = _support_rows(boundaries)
+    s_rows, s_found = rows_of(np.asarray(support_ids, dtype=np.int64))
+    s_rows = s_rows[s_found]
+    s_masks = np.asarray(support_masks, dtype=bool).reshape(-1, 6)[s_found]
+    s_comp = comp[s_rows]
+    on_component = s_comp >= 0
+    s_rows, s_masks, s_comp = s_rows[on_component], s_masks[on_component], s_comp[on_component]
+    support_count = np.bincount(s_comp, minlength=k)
+
+    centre = np.zeros((k, 3))
+    np.add.at(centre, component_of, xyz[used])
+    centre /= np.maximum(node_count, 1)[:, None]
+    lo = np.full((k, 3), np.inf)
+    hi = np.full((k, 3), -np.inf)
+    np.minimum.at(lo, component_of, xyz[used])
+    np.maximum.at(hi, component_of, xyz[used])
+    scale = np.maximum((hi - lo).max(axis=1), 1e-9) if k else np.ones(0)
+    points = (xyz[s_rows] - centre[s_comp]) / scale[s_comp, None]
+    modes, free_dofs = rigid_body_modes(points, s_masks, s_comp, k)
+
+    components = [
+        {
+            "nodes": int(node_count[c]),
+            "elements": int(element_count[c]),
+            "first_node": int(first_node[c]),
+            "supports": int(support_count[c]),
+            "rigid_body_modes": int(modes[c]),
+            "free_dofs": free_dofs[c],
+        }
+        for c in range(k)
+    ]
+    components.sort(key=lambda c: (-c["elements"], -c["nodes"], c["first_node"]))
+
+    missing_materials: dict[int, list[int]] = {}
+    missing_sections: dict[int, list[int]] = {}
+    for element in elements:
+        if material_ids is not None and element.get("material_id") not in material_ids:
+            missing_materials.setdefault(element.get("material_id"), []).append(element["id"])
+        if section_ids is not None and element.get("type") in _FRAME_TYPES \
+                and element.get("section_id") not in section_ids:
+            missing_sections.setdefault(element.get("section_id"), []).append(element["id"])
+
+    return {
+        "node_count": int(n),
+        "element_count": len(elements),
+        "components": components,
+        "dangling_nodes": dangling.tolist(),
+        "missing_nodes": missing_nodes,
+        "missing_materials": missing_materials,
+        "missing_sections": missing_sections,
+        "unsupported_components": sum(1 for c in components if not c["supports"]),
+        "mechanisms": sum(1 for c in components if c["rigid_body_modes"]),
+        "unreadable_boundaries": list(unreadable or []),
+    }
+
+
+def _sample(items: list, limit: int = 20) -> str:
+    text = ", ".join(str(i) for i in items[:limit])
+    return f"{text}, … (+{len(items) - limit})" if len(items) > limit else text
+
+
+def _id_sample(ids: list[int], limit: int = 20) -> str:
+    tokens = compress_ids(ids).split()
+    text = " ".join(tokens[:limit])
+    return f"{text} … (+{len(tokens) - limit} ranges)" if len(tokens) > limit else text
+
+
+def connectivity_issues(report: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """Turn a check_connectivity report into (errors, warnings) messages."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    missing = report["missing_nodes"]
+    if missing:
+        errors.append(
+            f"{len(missing)} elements reference missing nodes (单元引用了不存在的节点): "
+            + _sample([f"{e}→{nodes}" for e, nodes in missing.items()])
+        )
+    for mat_id, element_ids in report["missing_materials"].items():
+        errors.append(
+            f"{len(element_ids)} elements use undefined material {mat_id} (单元引用未定义的材料): "
+            + _id_sample(element_ids)
+        )
+    for sec_id, element_ids in report["missing_sections"].items():
+        errors.append(
+            f"{len(element_ids)} elements use undefined section {sec_id} (单元引用未定义的截面): "
+            + _id_sample(element_ids)
+        )
+    # Restraints that could not be read may hold any part: report, don't block.
+    unreadable = report.get("unreadable_boundaries") or []
+    support_issues = warnings if unreadable else errors
+    if unreadable:
+        warnings.append(
+            f"Could not read {', '.join(unreadable)}; support checks below are warnings only "
+            f"(部分边界数据无法读取，支承检查仅作警告)"
+        )
+    for c in report["components"]:
+        where = f"Part at node {c['first_node']} ({c['nodes']} nodes, {c['elements']} elements)"
+        if not c["supports"]:
+            support_issues.append(f"{where} has no supports (结构部分无支承)")
+        elif c["rigid_body_modes"]:
+            support_issues.append(
+                f"{where} is not fully restrained, free: {' '.join(c['free_dofs'])} "
+                f"(支承不足，存在刚体位移)"
+            )
+    if len(report["components"]) > 1:
+        warnings.append(
+            f"Model has {len(report['components'])} disconnected parts "
+            f"(模型存在 {len(report['components'])} 个不连通部分)"
+        )
+    dangling = report["dangling_nodes"]
+    if dangling:
+        warnings.append(
+            f"{len(dangling)} nodes are not connected to any element (孤立节点): " + _id_sample(dangling)
+        )
+    return errors, warnings
@@ -0,0 +1,175 @@
+"""
+Local detection of coincident nodes and overlapping elements.
+重合节点与重叠单元的本地检测
+
+Nodes are hashed into cells a few tolerances wide; each node is compared
+with the nodes in its own cell and only those neighbouring cells it lies
+within the tolerance of (sort + searchsorted, O(n log n)). Pairs within the
+tolerance are merged into groups.
+
+Elements are duplicates when they connect the same nodes once coincident
+nodes are treated as one. Line elements also overlap when they are
+collinear, share a node and run along each other.
+
+Both checks accept a subset of "new" rows: only pairs involving a new
+entity are reported, which lets a caller re-check just what was added.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from bridge_mcp.providers.connectivity import component_labels
+
+# Large odd multipliers for hashing integer cell coordinates into one key.
+_HASH = np.array([73856093, 19349663, 83492791], dtype=np.int64)
+# Cell edge in tolerances: a node needs a neighbouring cell probed only when it
+# lies within one tolerance of the shared face, so ~3 probes per node, not 27.
+_CELL_FACTOR = 4.0
+_NEIGHBOURS = np.stack(
+    np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing="ij"), axis=-1
+).reshape(-1, 3)
+
+
+def _groups(n: int, pairs: np.ndarray) -> list[np.ndarray]:
+    """Connected components (size > 1) of an undirected pair list over rows 0..n-1."""
+    if not len(pairs):
+        return []
+    labels = component_labels(n, pairs)
+    involved = np.unique(pairs)
+    order = np.argsort(labels[involved], kind="stable")
+    sorted_rows = involved[order]
+    _, starts = np.unique(labels[sorted_rows], return_index=True)
+    return [g for g in np.split(sorted_rows, starts[1:]) if len(g) > 1]
+
+
+def coincident_pairs(xyz: np.ndarray, tolerance: float, rows: np.ndarray | None = None) -> np.ndarray:
+    """
+    Row pairs (i, j), i < j, of points closer than `tolerance`.
+    With `rows`, only pairs involving at least one of those rows are returned.
+    """
+    n = len(xyz)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    tol = max(tolerance, 1e-12)
+    size = tol * _CELL_FACTOR
+    cells = np.floor(xyz / size).astype(np.int64)
+    keys = cells @ _HASH
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    query = np.arange(n) if rows is None else np.asarray(rows, dtype=np.int64)
+    local = xyz[query] - cells[query] * size
+    near = {-1: local <= tol, 0: np.ones_like(local, dtype=bool), 1: size - local <= tol}
+    found = []
+    for offset in _NEIGHBOURS:
+        mask = near[offset[0]][:, 0] & near[offset[1]][:, 1] & near[offset[2]][:, 2]
+        if not mask.any():
+            continue
+        probe_rows = query[mask]
+        probe = (cells[probe_rows] + offset) @ _HASH
+        left = np.searchsorted(sorted_keys, probe, side="left")
+        right = np.searchsorted(sorted_keys, probe, side="right")
+        lengths = right - left
+        if not lengths.any():
+            continue
+        src = np.repeat(probe_rows, lengths)
+        dst = order[np.repeat(left - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())]
+        found.append(np.stack([src, dst], axis=1))
+    if not found:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(found)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    # Hash collisions only add candidates; the distance test removes them.
+    close = np.linalg.norm(xyz[pairs[:, 0]] - xyz[pairs[:, 1]], axis=1) <= tolerance
+    pairs = np.sort(pairs[close], axis=1)
+    return np.unique(pairs, axis=0) if len(pairs) else pairs
+
+
+def coincident_node_groups(ids: np.ndarray, xyz: np.ndarray, tolerance: float,
+                           rows: np.ndarray | None = None) -> list[list[int]]:
+    """Groups of node IDs lying within `tolerance` of each other, sorted by first ID."""
+    pairs = coincident_pairs(xyz, tolerance, rows)
+    groups = [sorted(ids[g].tolist()) for g in _groups(len(ids), pairs)]
+    return sorted(groups)
+
+
+def _line_overlap(pa: np.ndarray, pb: np.ndarray, qa: np.ndarray, qb: np.ndarray, tolerance: float) -> bool:
+    """True when segments p and q are collinear and overlap by more than `tolerance`."""
+    axis = pb - pa
+    length = float(np.linalg.norm(axis))
+    if length <= tolerance:
+        return False
+    axis /= length
+    for point in (qa, qb):
+        offset = point - pa
+        if np.linalg.norm(offset - (offset @ axis) * axis) > tolerance:
+            return False
+    lo, hi = sorted((float((qa - pa) @ axis), float((qb - pa) @ axis)))
+    return min(hi, length) - max(lo, 0.0) > tolerance
+
+
+def overlapping_element_groups(
+    elements: list[dict],
+    node_ids: np.ndarray,
+    xyz: np.ndarray,
+    tolerance: float,
+    new_elements: set[int] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Groups of duplicate or overlapping elements.
+
+    Each group is {"ids": [...], "kind": "duplicate" | "overlap"}. With
+    `new_elements`, only groups containing one of those element IDs are kept.
+    """
+    row_of = {int(i): r for r, i in enumerate(node_ids.tolist())}
+    # Canonical node: the lowest row of its coincident group.
+    canon = np.arange(len(node_ids))
+    for group in _groups(len(node_ids), coincident_pairs(xyz, tolerance)):
+        canon[group] = group.min()
+
+    by_nodes: dict[tuple, list[int]] = {}
+    line_rows: dict[int, tuple[int, int]] = {}
+    for element in elements:
+        rows = [row_of[n] for n in element["node_ids"] if n in row_of]
+        if len(rows) != len(element["node_ids"]) or not rows:
+            continue
+        key = tuple(sorted(int(canon[r]) for r in rows))
+        by_nodes.setdefault(key, []).append(int(element["id"]))
+        if len(rows) == 2:
+            line_rows[int(element["id"])] = (int(canon[rows[0]]), int(canon[rows[1]]))
+
+    results: list[dict[str, Any]] = []
+    duplicate_of: dict[int, int] = {}
+    for members in by_nodes.values():
+        if len(members) > 1:
+            results.append({"ids": sorted(members), "kind": "duplicate"})
+            for m in members[1:]:
+                duplicate_of[m] = members[0]
+
+    # Collinear line elements running along each other from a shared node.
+    at_node: dict[int, list[int]] = {}
+    for element_id, (a, b) in line_rows.items():
+        if element_id in duplicate_of:
+            continue
+        at_node.setdefault(a, []).append(element_id)
+        at_node.setdefault(b, []).append(element_id)
+    pairs = set()
+    for members in at_node.values():
+        for i, e1 in enumerate(members):
+            for e2 in members[i + 1:]:
+                if line_rows[e1] == line_rows[e2] or tuple(reversed(line_rows[e1])) == line_rows[e2]:
+                    continue
+                p, q = line_rows[e1], line_rows[e2]
+                if _line_overlap(xyz[p[0]], xyz[p[1]], xyz[q[0]], xyz[q[1]], tolerance) or \
+                        _line_overlap(xyz[q[0]], xyz[q[1]], xyz[p[0]], xyz[p[1]], tolerance):
+                    pairs.add((min(e1, e2), max(e1, e2)))
+    if pairs:
+        element_ids = sorted({e for pair in pairs for e in pair})
+        index = {e: k for k, e in enumerate(element_ids)}
+        pair_rows = np.array([(index[a], index[b]) for a, b in pairs], dtype=np.int64)
+        for group in _groups(len(element_ids), pair_rows):
+            results.append({"ids": sorted(element_ids[k] for k in group.tolist()), "kind": "overlap"})
+
+    if new_elements is not None:
+        results = [r for r in results if new_elements.intersection(r["ids"])]
+    return sorted(results, key=lambda r: r["ids"])
@@ -0,0 +1,165 @@
+"""
+Per-table content fingerprint of the backend model.
+模型内容指纹（按表增量计算）
+
+The model revision counts writes made through this server, but the
+QiaoTong GUI can edit the model behind its back. The fingerprint hashes
+the raw reply text of the node, element, material, section, boundary and
+load queries, one digest per table, and combines the table digests into
+one model fingerprint.
+
+Tables are re-hashed incrementally: every backend write marks the tables
+its command can touch (ADD-NODES → nodes, ADD-NODAL-FORCE → loads, ...),
+and a quick fingerprint re-reads only those. A verified fingerprint
+re-reads every table, which is what catches GUI edits: a table whose
+digest changed without a write from this server was edited externally.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Callable
+
+# Table → backend queries whose replies make up its content.
+FINGERPRINT_TABLES: dict[str, tuple[str, ...]] = {
+    "nodes": ("GET-NODE-DATA",),
+    "elements": ("GET-ELEMENT-DATA",),
+    "materials": ("GET-MATERIAL-DATA",),
+    # GET-SECTION-DATA is queried per ID listed by GET-SECTION-NAMES.
+    "sections": ("GET-SECTION-NAMES",),
+    "boundaries": (
+        "GET-GENERAL-SUPPORT-DATA", "GET-ELASTIC-LINK-DATA", "GET-ELASTIC-SUPPORT-DATA",
+        "GET-GENERAL-ELASTIC-SUPPORT-DATA", "GET-MASTER-SLAVE-LINK-DATA", "GET-BEAM-CONSTRAINT-DATA",
+        "GET-CONSTRAINT-EQUATION-DATA", "GET-BOUNDARY-ELEMENT-LINK-DATA",
+    ),
+    "loads": (
+        "GET-LOAD-CASE-NAMES", "GET-NODAL-FORCE-LOAD-DATA", "GET-NODAL-DISPLACEMENT-LOAD-DATA",
+        "GET-BEAM-ELEMENT-LOAD-DATA", "GET-PLATE-ELEMENT-LOAD-DATA", "GET-PRE-STRESS-LOAD-DATA",
+        "GET-INITIAL-TENSION-LOAD-DATA", "GET-CABLE-LENGTH-LOAD-DATA", "GET-DEVIATION-LOAD-DATA",
+    ),
+}
+
+# Keywords in a write command naming the tables it can change; one command may hit several.
+_TABLE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "nodes": ("NODE",),
+    "elements": ("ELEMENT", "BEAM-BETWEEN", "FRAME", "ORIENTATION"),
+    "materials": ("MATERIAL",),
+    "sections": ("SECTION", "THICK", "TAPPER"),
+    "boundaries": ("SUPPORT", "LINK", "CONSTRAINT", "BOUNDARY"),
+    "loads": (
+        "LOAD", "FORCE", "TEMPERATURE", "PRE-STRESS", "DISPLACEMENT", "TENSION",
+        "DEVIATION", "SINK", "CASE", "COMBINE",
+    ),
+}
+# Commands that renumber, delete or replace model content ripple through other
+# tables (removing a node removes its elements and supports): mark everything.
+_ALL_TABLES_PREFIXES = (
+    "REMOVE-", "RENUMBER-", "MERGE-", "INITIAL", "OPEN-", "INP-", "UNDO", "REDO", "CREATE-",
+)
+
+
+def tables_for(header: str) -> tuple[str, ...]:
+    """Fingerprint tables a write command may have changed."""
+    if header.startswith(_ALL_TABLES_PREFIXES) or header.endswith("-ID"):
+        return tuple(FINGERPRINT_TABLES)
+    return tuple(t for t, words in _TABLE_KEYWORDS.items() if any(w in header for w in words))
+
+
+class ModelFingerprint:
+    """
+    Table digests plus the write revision each was taken at.
+    各表摘要及其对应的修改版本
+
+    `fetch(header, payload)` returns the raw reply text of one backend query.
+    """
+
+    def __init__(self):
+        self._tables: dict[str, dict[str, Any]] = {}
+        # Revision of the latest write marking each table.
+        self._written: dict[str, int] = {}
+
+    def mark(self, header: str, revision: int) -> None:
+        """Record a backend write at `revision`."""
+        for table in tables_for(header):
+            self._written[table] = revision
+
+    def reset(self) -> None:
+        """Forget every digest (e.g. after reconnecting to a restarted GUI)."""
+        self._tables.clear()
+        self._written.clear()
+
+    def stale_tables(self) -> list[str]:
+        return [
+            t for t in FINGERPRINT_TABLES
+            if t not in self._tables or self._written.get(t, -1) > self._tables[t]["revision"]
+        ]
+
+    def _digest(self, table: str, fetch: Callable[[str, dict | None], str]) -> tuple[str, int]:
+        h = hashlib.blake2b(digest_size=16)
+        size = 0
+        for header in FINGERPRINT_TABLES[table]:
+            text = fetch(header, None)
+            h.update(header.encode())
+            h.update(text.encode("utf-8"))
+            size += len(text)
+            if header == "GET-SECTION-NAMES":
+                for sec_id in _section_ids(text):
+                    data = fetch("GET-SECTION-DATA", {"sec_id": sec_id, "position": 0})
+                    h.update(data.encode("utf-8"))
+                    size += len(data)
+        return h.hexdigest(), size
+
+    def compute(self, fetch: Callable[[str, dict | None], str], revision: int,
+                verify: bool = False) -> dict[str, Any]:
+        """
+        Re-hash stale tables (all tables with `verify`) and return the
+        fingerprint, per-table digests and the tables changed externally —
+        re-read digests that differ although no write marked the table.
+        """
+        start = time.perf_counter()
+        stale = set(self.stale_tables())
+        external: list[str] = []
+        rehashed: list[str] = []
+        for table in FINGERPRINT_TABLES:
+            if table not in stale and not verify:
+                continue
+            t0 = time.perf_counter()
+            digest, size = self._digest(table, fetch)
+            previous = self._tables.get(table)
+            if previous is not None and table not in stale and previous["digest"] != digest:
+                external.append(table)
+            self._tables[table] = {
+                "digest": digest,
+                "revision": revision,
+                "bytes": size,
+                "ms": round((time.perf_counter() - t0) * 1000, 2),
+            }
+            rehashed.append(table)
+        combined = hashlib.blake2b(digest_size=16)
+        for table in FINGERPRINT_TABLES:
+            combined.update(self._tables[table]["digest"].encode())
+        return {
+            "fingerprint": combined.hexdigest(),
+            "tables": {t: dict(self._tables[t]) for t in FINGERPRINT_TABLES},
+            "rehashed": rehashed,
+            "external_changes": external,
+            "seconds": round(time.perf_counter() - start, 4),
+        }
+
+
+def _section_ids(text: str) -> list[Any]:
+    """Section IDs from a GET-SECTION-NAMES reply (a list of IDs or an {id: name} map)."""
+    try:
+        parsed = json.loads(text) if text.strip() else []
+    except ValueError:
+        return []
+    if isinstance(parsed, dict):
+        parsed = list(parsed)
+    ids = []
+    for item in parsed if isinstance(parsed, list) else []:
+        value = item.get("id") if isinstance(item, dict) else item
+        try:
+            ids.append(int(value))
+        except (TypeError, ValueError):
+            continue
+    return ids
@@ -0,0 +1,204 @@
+"""
+In-memory mirror of model tables for the provider layer.
+模型数据本地镜像
+
+The mirror holds nodes, elements, materials, sections, structure groups and
+boundaries as last read from the backend. Providers populate a table on the
+first read, update it in place from their own mutating methods where the
+result of the write is known exactly, and invalidate it otherwise. Edits
+made directly in the backend GUI are not seen until the mirror is resynced.
+"""
+
+from typing import Any
+
+from bridge_mcp.providers.id_set import id_array
+
+MIRROR_TABLES = (
+    "nodes",
+    "elements",
+    "materials",
+    "sections",
+    "structure_groups",
+    "boundaries",
+)
+
+# qtmodel reports element types as strings; the modeling tools use integer codes.
+_ELEMENT_TYPE_CODES = {"BEAM": 1, "TRUSS": 2, "LINK": 2, "CABLE": 3, "PLATE": 4}
+
+
+
+def _as_dict(record: Any) -> dict:
+    """Coerce a backend record (dict, qtmodel object) into a plain dict."""
+    if isinstance(record, dict):
+        return record
+    if hasattr(record, "to_dict"):
+        return record.to_dict()
+    return dict(vars(record))
+
+
+def normalize_node(record: Any) -> dict:
+    """Return a node record as {"id", "x", "y", "z"}."""
+    d = _as_dict(record)
+    if "Item1" in d:
+        return {"id": int(d["Item1"]), "x": float(d["Item2"]), "y": float(d["Item3"]), "z": float(d["Item4"])}
+    node_id = d.get("id", d.get("node_id", d.get("index")))
+    return {"id": int(node_id), "x": float(d.get("x", 0)), "y": float(d.get("y", 0)), "z": float(d.get("z", 0))}
+
+
+def normalize_element(record: Any) -> dict:
+    """Return an element record as {"id", "type", "material_id", "section_id", "beta_angle", "node_ids"}."""
+    d = _as_dict(record)
+    ele_type = d.get("type", d.get("ele_type", 1))
+    if isinstance(ele_type, str):
+        ele_type = int(ele_type) if ele_type.isdigit() else _ELEMENT_TYPE_CODES.get(ele_type.upper(), 0)
+    if "node_ids" in d:
+        node_ids = [int(n) for n in d["node_ids"]]
+    else:
+        node_ids = [int(d[k]) for k in ("node_i", "node_j", "node_k", "node_l") if d.get(k) is not None]
+    return {
+        "id": int(d.get("id", d.get("index"))),
+        "type": int(ele_type),
+        "material_id": int(d.get("material_id", d.get("mat_id", 0))),
+        "section_id": int(d.get("section_id", d.get("sec_id", d.get("thick_id", 0)))),
+        "beta_angle": float(d.get("beta_angle", d.get("beta", 0.0))),
+        "node_ids": node_ids,
+    }
+
+
+def element_from_row(row: list) -> dict:
+    """Build an element record from an `add_elements` row [id, type, mat, sec, beta, nodes...]."""
+    ele_type = int(row[1])
+    node_count = 4 if ele_type == 4 else 2
+    return {
+        "id": int(row[0]),
+        "type": ele_type,
+        "material_id": int(row[2]),
+        "section_id": int(row[3]),
+        "beta_angle": float(row[4]),
+        "node_ids": [int(n) for n in row[5:5 + node_count]],
+    }
+
+
+def expand_ids(ids: Any) -> list[int]:
+    """Expand an int, list, or range string like '1to10 15 20to30by2' into a list of IDs."""
+    return id_array(ids).tolist()
+
+
+class ModelMirror:
+    """
+    Write-through cache of model tables.
+
+    A table is either loaded (holding the last known data) or stale (None).
+    Nodes and elements are stored as dicts keyed by ID; the other tables hold
+    the parsed backend result as-is.
+
+    模型表本地镜像，每张表要么已加载，要么失效(None)。
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._tables: dict[str, Any] = {name: None for name in MIRROR_TABLES}
+        self.hits = 0
+        self.misses = 0
+
+    # ── Table state ────────────────────────────────────────────────────
+
+    def is_loaded(self, table: str) -> bool:
+        return self.enabled and self._tables[table] is not None
+
+    def get(self, table: str) -> Any:
+        """Return the mirrored table, or None when disabled or stale."""
+        if not self.is_loaded(table):
+            return None
+        self.hits += 1
+        return self._tables[table]
+
+    def put(self, table: str, data: Any) -> None:
+        """Store a table freshly loaded from the backend (counted as a miss)."""
+        if not self.enabled:
+            return
+        self.misses += 1
+        if table == "nodes":
+            data = {n["id"]: n for n in (normalize_node(r) for r in data)}
+        elif table == "elements":
+            data = {e["id"]: e for e in (normalize_element(r) for r in data)}
+        self._tables[table] = data
+
+    def invalidate(self, *tables: str) -> None:
+        """Mark tables stale; with no arguments every table is dropped."""
+        for name in tables or MIRROR_TABLES:
+            self._tables[name] = None
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "tables": {
+                name: (len(data) if data is not None else None)
+                for name, data in self._tables.items()
+            },
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    # ── Queries ────────────────────────────────────────────────────────
+
+    def select(self, table: str, ids: Any = None) -> list[dict] | None:
+        """Return node/element records for `ids` (all when None), or None if stale."""
+        rows = self.get(table)
+        if rows is None:
+            return None
+        if ids is None:
+            return list(rows.values())
+        return [rows[i] for i in expand_ids(ids) if i in rows]
+
+    # ── Write-through updates ──────────────────────────────────────────
+
+    def upsert(self, table: str, records: list[dict]) -> None:
+        rows = self._tables[table]
+        if rows is None:
+            return
+        for record in records:
+            rows[record["id"]] = record
+
+    def remove(self, table: str, ids: Any = None) -> None:
+        rows = self._tables[table]
+        if rows is None:
+            return
+        if ids is None:
+            rows.clear()
+            return
+        for i in expand_ids(ids):
+            rows.pop(i, None)
+
+    def update_fields(self, table: str, ids: Any, **fields: Any) -> None:
+        rows = self._tables[table]
+        if rows is None:
+            return
+        for i in expand_ids(ids):
+            if i in rows:
+                rows[i] = {**rows[i], **fields}
+
+    def move_nodes(self, ids: Any, dx: float, dy: float, dz: float) -> None:
+        rows = self._tables["nodes"]
+        if rows is None:
+            return
+        targets = rows.keys() if ids is None else expand_ids(ids)
+        for i in list(targets):
+            if i in rows:
+                n = rows[i]
+                rows[i] = {**n, "x": n["x"] + dx, "y": n["y"] + dy, "z": n["z"] + dz}
+
+    def rename_group(self, name: str, new_name: str) -> None:
+        groups = self._tables["structure_groups"]
+        if groups is not None:
+            self._tables["structure_groups"] = [new_name if g == name else g for g in groups]
+
+    def add_group(self, name: str) -> None:
+        groups = self._tables["structure_groups"]
+        if groups is not None and name not in groups:
+            groups.append(name)
+
+    def remove_group(self, name: str = "") -> None:
+        groups = self._tables["structure_groups"]
+        if groups is not None:
+            self._tables["structure_groups"] = [g for g in groups if g != name] if name else []
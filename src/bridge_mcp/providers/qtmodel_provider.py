@@ -7,11 +7,54 @@ the BridgeProvider interface.
 桥通软件后端适配器，封装 qtmodel Python API。
 """
 
-from typing import Any
-import json
-import ast
+from collections import deque
+from typing import Any, Iterator
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
 
 from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.providers.connectivity import check_connectivity, connectivity_issues
+from bridge_mcp.providers.duplicates import coincident_node_groups, overlapping_element_groups
+from bridge_mcp.providers.fingerprint import ModelFingerprint
+from bridge_mcp.providers.id_set import IdSet, compress_ids, id_array
+from bridge_mcp.providers.model_mirror import (
+    MIRROR_TABLES, ModelMirror, element_from_row, expand_ids, normalize_element, normalize_node,
+)
+from bridge_mcp.providers.result_cache import ResultCache, ids_key
+from bridge_mcp.providers.renumbering import rcm_renumbering
+from bridge_mcp.providers.result_parser import ResultParser, from_columns, to_columns
+from bridge_mcp.providers.spatial_index import SpatialIndex
+from bridge_mcp.providers.subdivision import (
+    ELEMENT_DATA_QUERIES, SUBDIVIDABLE_TYPES, referenced_elements, subdivide_frames,
+)
+from bridge_mcp.providers.transport import SOLVE_COMMANDS, QtTransport
+
+logger = logging.getLogger("bridge-mcp.qtmodel")
+
+# Boundary tables: (key in get_boundary_data, odb method or command name).
+_BOUNDARY_QUERIES = (
+    ("general_supports", "get_general_support_data"),
+    ("elastic_links", "get_elastic_link_data"),
+    ("elastic_supports", "get_elastic_support_data"),
+    ("general_elastic_supports", "get_general_elastic_support_data"),
+    ("master_slave_links", "get_master_slave_link_data"),
+    ("beam_constraints", "get_beam_constraint_data"),
+    ("constraint_equations", "get_constraint_equation_data"),
+    ("boundary_element_links", "get_boundary_element_link_data"),
+)
+
+# result_type → odb method
+_RESULT_FETCHERS = {
+    "deformation": "get_deformation",
+    "force": "get_element_force",
+    "stress": "get_element_stress",
+    "reaction": "get_reaction",
+}
 
 
 class QtModelProvider(BridgeProvider):
@@ -26,38 +69,161 @@ class QtModelProvider(BridgeProvider):
     桥通软件 qtmodel API 适配器。
     """
 
-    def __init__(self):
-        """Initialize the qtmodel provider and check availability."""
+    def __init__(self, config: dict | None = None):
+        """
+        Initialize the qtmodel provider. Nothing is imported or connected here;
+        the backend is reached on first use and re-probed with backoff while down.
+
+        Args:
+            config: Provider options from BridgeMCPConfig.provider_config.
+                    model_mirror (bool): serve model tables from a local mirror.
+                    summary_ttl (float): seconds a model summary is reused, default 2.
+                    server_url, connect_timeout, read_timeout, solve_timeout, max_retries:
+                        backend HTTP transport options (see QtTransport).
+                    probe_timeout (float): seconds for the reachability probe, default 0.5.
+                    reconnect_initial (float): first retry delay in seconds, default 1.
+                    reconnect_max (float): longest retry delay in seconds, default 30.
+                    result_cache_mb (float): memory budget of the analysis-result
+                        cache, default 256; 0 disables it.
+                    edit_session_idle_timeout (float): seconds without writes
+                        after which an edit session opened through the MCP
+                        tools is closed automatically, default 600; 0 disables it.
+        """
+        config = config or {}
+        self._mirror = ModelMirror(enabled=bool(config.get("model_mirror", False)))
+        self._summary_ttl = float(config.get("summary_ttl", 2.0))
+        # (time, model revision, summary); reused within the TTL at the same revision.
+        self._summary_cache: tuple[float, int, dict[str, Any]] | None = None
+        # Node/element counts known to be exact; dropped when a write makes them uncertain.
+        self._counts: dict[str, int] = {}
+        # Sorted node/element IDs for paging without a mirror; dropped on any write.
+        self._id_index: dict[str, np.ndarray] = {}
+        self._spatial = SpatialIndex()
+        # Node/element IDs seen by the last duplicate check (for incremental checks).
+        self._duplicates_checked: dict[str, np.ndarray] | None = None
+        self._missing_endpoints: set[str] = set()
+        # Boundary tables whose query failed at the last fetch.
+        self._unreadable_boundaries: list[str] = []
+        self._parser = ResultParser()
+        self._results = ResultCache(int(float(config.get("result_cache_mb", 256)) * 1024 * 1024))
+        # Bumped by every backend write (including analysis runs) and by GUI edits
+        # found by a fingerprint check; part of the result cache key.
+        self._revision = 0
+        self._fingerprint = ModelFingerprint()
+        self._transport = QtTransport(config)
+        self._transport.on_write = self._on_backend_write
+        # What a solve depends on: writes other than settings, plus the latest
+        # payload digest of each analysis-settings command.
+        self._model_writes = 0
+        self._analysis_settings: dict[str, str] = {}
+        self._last_solve: dict[str, Any] | None = None
+        self._solve_history: deque[dict[str, Any]] = deque(maxlen=50)
         self._mdb = None
         self._odb = None
         self._cdb = None
         self._available = False
-        self._unavailable_reason = ""
-        self._try_import()
-
-    def _try_import(self):
-        """Attempt to import qtmodel and connect to QiaoTong software."""
-        try:
-            import qtmodel
-            # Accessing mdb/odb/cdb will raise if the software is not running
-            self._mdb = qtmodel.mdb
-            self._odb = qtmodel.odb
-            self._cdb = qtmodel.cdb
+        self._unavailable_reason = "not connected yet (尚未连接)"
+        self._session: dict[str, Any] | None = None
+        self._session_depth = 0
+        self._last_session: dict[str, Any] | None = None
+        self._refresh_counts = {"issued": 0, "suppressed": 0}
+        self._session_idle_timeout = float(config.get("edit_session_idle_timeout", 600.0))
+        # Lazy connection with exponential backoff between attempts.
+        self._probe_timeout = float(config.get("probe_timeout", 0.5))
+        self._reconnect_initial = float(config.get("reconnect_initial", 1.0))
+        self._reconnect_max = float(config.get("reconnect_max", 30.0))
+        self._retry_delay = self._reconnect_initial
+        self._next_attempt = 0.0
+        self._connect_lock = threading.Lock()
+        self._connection = {"attempts": 0, "connects": 0, "connected_at": None, "connect_ms": None}
+
+    def _try_import(self) -> bool:
+        """
+        Import qtmodel and connect to QiaoTong software.
+        Called on first use; after a failure the next attempt waits for the backoff delay.
+        """
+        with self._connect_lock:
+            if self._available:
+                return True
+            now = time.monotonic()
+            if now < self._next_attempt:
+                return False
+            self._connection["attempts"] += 1
+            start = time.perf_counter()
+            try:
+                import qtmodel
+            except ImportError:
+                self._unavailable_reason = (
+                    "qtmodel package not found. Run: uv add qtmodel "
+                    "(qtmodel 包未安装，请运行: uv add qtmodel)"
+                )
+                self._schedule_retry(now)
+                return False
+            if not self._transport.ping(self._probe_timeout):
+                self._unavailable_reason = (
+                    f"QiaoTong server not reachable at {self._transport.url}; retrying in "
+                    f"{self._retry_delay:g}s. Please ensure QiaoTong software is running. "
+                    "(无法连接桥通服务端，请确保桥通软件已启动)"
+                )
+                self._schedule_retry(now)
+                return False
+            try:
+                self._transport.install()
+                self._mdb = qtmodel.mdb
+                self._odb = qtmodel.odb
+                self._cdb = qtmodel.cdb
+            except Exception as e:
+                self._unavailable_reason = (
+                    f"qtmodel imported but connection failed ({type(e).__name__}: {e}). "
+                    "Please ensure QiaoTong software is running. "
+                    "(qtmodel 已安装，但连接失败，请确保桥通软件已启动)"
+                )
+                self._schedule_retry(now)
+                return False
+            # The GUI may have been restarted with another model: drop everything cached.
+            self._mirror.invalidate()
+            self._spatial.invalidate_nodes()
+            self._counts.clear()
+            self._id_index.clear()
+            self._missing_endpoints.clear()
+            self._summary_cache = None
+            self._results.clear()
+            self._revision += 1
+            self._fingerprint.reset()
+            self._last_solve = None
+            self._transport.connection_lost = False
+            self._retry_delay = self._reconnect_initial
             self._available = True
-        except ImportError:
-            self._available = False
-            self._unavailable_reason = (
-                "qtmodel package not found. Run: uv add qtmodel "
-                "(qtmodel 包未安装，请运行: uv add qtmodel)"
-            )
-        except Exception as e:
-            # qtmodel is installed but QiaoTong software is likely not running
+            self._unavailable_reason = ""
+            self._connection["connects"] += 1
+            self._connection["connected_at"] = time.time()
+            self._connection["connect_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            logger.info(f"Connected to QiaoTong at {self._transport.url} "
+                        f"({self._connection['connect_ms']} ms)")
+            return True
+
+    def _schedule_retry(self, now: float) -> None:
+        self._available = False
+        self._next_attempt = now + self._retry_delay
+        self._retry_delay = min(self._retry_delay * 2, self._reconnect_max)
+
+    def _connected(self) -> bool:
+        """Connect on first use; reconnect (with backoff) after the server went away."""
+        if self._available and self._transport.connection_lost:
             self._available = False
-            self._unavailable_reason = (
-                f"qtmodel imported but connection failed ({type(e).__name__}: {e}). "
-                "Please ensure QiaoTong software is running. "
-                "(qtmodel 已安装，但连接失败，请确保桥通软件已启动)"
-            )
+            self._unavailable_reason = "Connection to QiaoTong lost (与桥通软件的连接已断开)"
+            self._next_attempt = 0.0
+            logger.warning(f"{self._unavailable_reason}; reconnecting")
+        return self._available or self._try_import()
+
+    def get_connection_status(self) -> dict[str, Any]:
+        """Connection state and reconnect backoff (连接状态)."""
+        return {
+            "connected": self._available,
+            "reason": self._unavailable_reason,
+            "next_attempt_in_s": round(max(self._next_attempt - time.monotonic(), 0.0), 1),
+            **self._connection,
+        }
 
     @property
     def name(self) -> str:
@@ -72,7 +238,7 @@ class QtModelProvider(BridgeProvider):
             return "not installed"
 
     def is_available(self) -> bool:
-        return self._available
+        return self._connected()
 
     def get_software_name(self) -> str:
         return "QiaoTong (桥通)"
@@ -110,75 +276,242 @@ class QtModelProvider(BridgeProvider):
 
 
     def _require_available(self):
-        """Raise error if provider is not available."""
-        if not self._available:
+        """Raise error if provider is not available (connects on first use)."""
+        if not self._connected():
             raise RuntimeError(
                 f"qtmodel provider unavailable: {self._unavailable_reason}"
             )
 
+    # ── Edit Sessions ──────────────────────────────────────────────────
+
+    def _touch(self, *stale: str) -> None:
+        """Record a model write; `stale` names mirror tables the write invalidated."""
+        self._summary_cache = None
+        self._id_index.clear()
+        self._results.clear()
+        if "nodes" in stale:
+            self._spatial.invalidate_nodes()
+        if "elements" in stale:
+            self._spatial.invalidate_elements()
+        if stale:
+            self._mirror.invalidate(*stale)
+            for table in stale:
+                self._counts.pop(table, None)
+
+    def _refresh(self, *stale: str) -> None:
+        """Record a write, then refresh the GUI (deferred while an edit session is open)."""
+        self._touch(*stale)
+        self._update_view()
+
+    def _update_view(self) -> None:
+        self._expire_idle_session()
+        if self._session is not None:
+            self._session["suppressed_refreshes"] += 1
+            self._session["last_write_at"] = time.time()
+            self._refresh_counts["suppressed"] += 1
+            return
+        self._refresh_counts["issued"] += 1
+        self._mdb.update_model()
+
+    def begin_edit_session(self, name: str = "", idle_timeout: float | None = None) -> dict[str, Any]:
+        self._require_available()
+        self._expire_idle_session()
+        self._session_depth += 1
+        if self._session is None:
+            now = time.time()
+            self._session = {
+                "name": name,
+                "started_at": now,
+                "last_write_at": now,
+                "suppressed_refreshes": 0,
+                "idle_timeout": self._session_idle_timeout if idle_timeout is None else float(idle_timeout),
+            }
+        return self.get_edit_session_status()
+
+    def commit_edit_session(self) -> dict[str, Any]:
+        self._expire_idle_session()
+        if self._session is None:
+            last = self._last_session or {}
+            if last.get("closed") == "idle timeout":
+                raise RuntimeError(
+                    f"The edit session was closed after {last['idle_timeout']:g}s without writes "
+                    f"(编辑会话因长时间无操作已自动关闭)"
+                )
+            raise RuntimeError("No edit session is open (当前没有打开的编辑会话)")
+        if self._session_depth > 1:
+            # Nested session: the outermost commit owns the refresh.
+            self._session_depth -= 1
+            return self.get_edit_session_status()
+        return self._close_session("committed")
+
+    def abort_edit_session(self) -> dict[str, Any]:
+        if self._session is None:
+            raise RuntimeError("No edit session is open (当前没有打开的编辑会话)")
+        return self._close_session("aborted")
+
+    def _close_session(self, reason: str) -> dict[str, Any]:
+        """
+        Issue the deferred refresh, then close the session at every nesting
+        level. A refresh that fails leaves the session open to retry.
+        """
+        session = self._session
+        if session["suppressed_refreshes"] > 0:
+            self._refresh_counts["issued"] += 1
+            self._mdb.update_model()
+        self._session, self._session_depth = None, 0
+        session["duration_s"] = round(time.time() - session.pop("started_at"), 3)
+        session.pop("last_write_at")
+        session["refreshes_issued"] = 1 if session["suppressed_refreshes"] > 0 else 0
+        session["closed"] = reason
+        self._last_session = session
+        return dict(session)
+
+    def _expire_idle_session(self) -> None:
+        """
+        Close a tool-opened session left idle past its timeout, so a client
+        that never commits cannot suppress refreshes forever. Nested sessions
+        (a workflow or batch running inside) are never expired. Only called
+        on write paths: closing issues the deferred refresh.
+        """
+        session = self._session
+        if session is None or not session["idle_timeout"] or self._session_depth > 1:
+            return
+        if time.time() - session["last_write_at"] > session["idle_timeout"]:
+            logger.warning("Edit session %r idle for over %gs, closing it", session["name"], session["idle_timeout"])
+            self._close_session("idle timeout")
+
+    def get_edit_session_status(self) -> dict[str, Any]:
+        # Read-only (it may run cache-only during a solve), so an idle session
+        # is reported here and closed by the next write or commit.
+        if self._session is None:
+            return {"active": False, "last_session": self._last_session}
+        idle = time.time() - self._session["last_write_at"]
+        timeout = self._session["idle_timeout"]
+        return {
+            "active": True,
+            "name": self._session["name"],
+            "depth": self._session_depth,
+            "suppressed_refreshes": self._session["suppressed_refreshes"],
+            "elapsed_s": round(time.time() - self._session["started_at"], 3),
+            "idle_s": round(idle, 3),
+            "idle_expired": bool(timeout) and self._session_depth <= 1 and idle > timeout,
+        }
+
+    # ── Model Revision ─────────────────────────────────────────────────
+
+    def _on_backend_write(self, header: str, command: str) -> None:
+        self._revision += 1
+        self._fingerprint.mark(header, self._revision)
+        if "SETTING" in header:
+            self._analysis_settings[header] = hashlib.blake2b(command.encode("utf-8"), digest_size=8).hexdigest()
+        elif not header.startswith(SOLVE_COMMANDS):
+            self._model_writes += 1
+
+    def get_model_revision(self) -> int:
+        return self._revision
+
+    def _fingerprint_query(self, header: str, payload: dict | None) -> str:
+        from qtmodel.core.qt_server import QtServer
+
+        try:
+            return QtServer.get_json_str(header, payload)
+        except Exception:
+            if self._transport.cache_only_active or self._transport.connection_lost:
+                raise
+            # Query not supported by this backend version: hashed as empty.
+            return ""
+
+    def get_model_fingerprint(self, verify: bool = False) -> dict[str, Any]:
+        self._require_available()
+        result = self._fingerprint.compute(self._fingerprint_query, self._revision, verify=verify)
+        external = result["external_changes"]
+        if external:
+            # Edited in the GUI: drop what this server cached about those tables.
+            logger.info(f"Model edited outside the server: {', '.join(external)}")
+            self._revision += 1
+            self._touch(*(t for t in external if t in MIRROR_TABLES))
+        result["revision"] = self._revision
+        return result
+
     # ── Model Information ──────────────────────────────────────────────
 
-    @staticmethod
-    def _parse(result: Any) -> Any:
+    def _parse(self, result: Any) -> Any:
         """Parse string result from qtmodel API into Python object."""
-        if isinstance(result, str):
-            cleaned = result.strip()
-            if not cleaned:
-                return cleaned
-                
-            # Fallback to standard JSON parsing first (handles true/false/null)
-            try:
-                return json.loads(cleaned)
-            except Exception:
-                pass
+        return self._parser.parse(result)
 
-            # QtModel sometimes returns Python string representations (e.g., single quotes for strings)
-            # which json.loads fails to parse. ast.literal_eval handles these robustly.
-            try:
-                parsed = ast.literal_eval(cleaned)
-                return parsed
-            except Exception:
-                pass
-                
-        return result
+    @contextmanager
+    def cache_only(self) -> Iterator[None]:
+        with self._transport.cache_only():
+            yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        # Released by the transport while a request is in flight.
+        with self._transport.exclusive():
+            yield
+
+    def set_call_observer(self, observer) -> None:
+        self._transport.observer = observer
 
+    def get_performance_stats(self) -> dict[str, Any]:
+        return {
+            "connection": self.get_connection_status(),
+            "refreshes": dict(self._refresh_counts),
+            "mirror": self._mirror.status(),
+            "result_cache": self._results.status(),
+            "spatial_index": self._spatial.status(),
+            "parser": self._parser.stats()["totals"],
+            "transport": {
+                k: v for k, v in self._transport.status().items() if k != "by_command"
+            },
+        }
+
+    def get_transport_status(self) -> dict[str, Any]:
+        """Backend HTTP connection settings and per-command traffic counters."""
+        return self._transport.status()
+
+    def get_parse_stats(self) -> dict[str, Any]:
+        """Parse time and payload size per format, plus the most recent calls."""
+        return self._parser.stats()
 
     @staticmethod
-    def _validate_ids(ids, required: bool = False):
-        """Validate and normalize ids input for robust error handling."""
+    def _validate_ids(ids, required: bool = False, ordered: bool = False):
+        """
+        Validate and normalize ids input for robust error handling.
+        Lists and range strings come back as a compact range string
+        ('1to100 105'), sorted and de-duplicated. With `ordered=True` the
+        caller's order and duplicates are kept: the compact form is used
+        only when the IDs are already strictly ascending.
+        """
         if ids is None:
             if required:
                 raise ValueError("ids parameter is required but was empty or None.")
             return None
-            
-        if isinstance(ids, str):
-            cleaned = ids.strip()
-            if not cleaned:
-                if required:
-                    raise ValueError("ids string cannot be empty.")
-                return None
-            return cleaned
-            
-        if isinstance(ids, (int, float)):
-            if ids <= 0:
-                raise ValueError(f"Invalid ID: {ids}. IDs must be positive integers.")
-            return int(ids)
-            
-        if isinstance(ids, (list, tuple)):
-            if not ids and required:
+
+        if isinstance(ids, str) and not ids.strip():
+            if required:
+                raise ValueError("ids string cannot be empty.")
+            return None
+
+        if isinstance(ids, (list, tuple)) and not ids:
+            if required:
                 raise ValueError("ids list cannot be empty.")
-            valid_ids = []
-            for i in ids:
-                try:
-                    val = int(i)
-                    if val <= 0:
-                        raise ValueError(f"Invalid ID in list: {i}. IDs must be positive.")
-                    valid_ids.append(val)
-                except (ValueError, TypeError):
-                    raise ValueError(f"Invalid ID format in list: {i}")
-            return valid_ids
-            
-        raise ValueError(f"Unsupported ids type: {type(ids)}. Expected int, list, or string.")
+            return []
+
+        if not isinstance(ids, (str, int, float, list, tuple, np.ndarray, np.integer, IdSet)):
+            raise ValueError(f"Unsupported ids type: {type(ids)}. Expected int, list, or string.")
+        values = id_array(ids)
+        if not values.size:
+            # An empty selection would reach qtmodel as "all IDs".
+            raise ValueError(f"ids {ids!r} does not contain any IDs.")
+        bad = values <= 0
+        if bad.any():
+            raise ValueError(f"Invalid ID: {values[bad][0]}. IDs must be positive integers.")
+        if isinstance(ids, (int, float, np.integer)):
+            return int(values[0])
+        if ordered and not (np.diff(values) > 0).all():
+            return values.tolist()
+        return IdSet(np.unique(values)).encode()
 
     def _safe_get(self, fn_name: str, *args, **kwargs) -> Any:
         """Call an odb method by name, auto-parse JSON, return None on error."""
@@ -187,16 +520,19 @@ class QtModelProvider(BridgeProvider):
             # Fallback: if this python version of qtmodel wrapper is missing the method, 
             # attempt to send it directly as a REST command header to the running QT Server.
             try:
-                from qtmodel.core.qt_server import QtServer
                 header = fn_name.replace("_", "-").upper()
-                raw_result = QtServer.send_dict(header=header)
-                return self._parse(raw_result)
+                return self._parse(self._transport.send_dict(header=header))
             except Exception:
+                if self._transport.cache_only_active:
+                    raise
                 return None
                 
         try:
             return self._parse(fn(*args, **kwargs))
         except Exception:
+            # A cache-only miss is not an empty result; let the caller report it.
+            if self._transport.cache_only_active:
+                raise
             return None
 
     @staticmethod
@@ -205,43 +541,214 @@ class QtModelProvider(BridgeProvider):
             return len(result)
         return 0
 
+    def _safe_call(self, fn, *args, **kwargs) -> Any:
+        """Call a provider read method, returning None on error."""
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            if self._transport.cache_only_active:
+                raise
+            return None
+
+    def _entity_count(self, table: str, endpoint: str, fetch) -> int:
+        """
+        Count nodes or elements as cheaply as possible: the mirror, then a
+        count kept exact by the provider, then a backend count endpoint,
+        and only then the full table.
+        """
+        rows = self._mirror.get(table)
+        if rows is not None:
+            return len(rows)
+        if table in self._counts:
+            return self._counts[table]
+        if endpoint not in self._missing_endpoints:
+            result = self._safe_get(endpoint)
+            if isinstance(result, int) and not isinstance(result, bool):
+                self._counts[table] = result
+                return result
+            self._missing_endpoints.add(endpoint)
+        count = self._count(self._safe_call(fetch))
+        self._counts[table] = count
+        return count
+
     def get_model_summary(self) -> dict[str, Any]:
         self._require_available()
-        return {
-            "node_count":            self._count(self._safe_get("get_node_data")),
-            "element_count":         self._count(self._safe_get("get_element_data")),
-            "material_count":        self._count(self._safe_get("get_material_data")),
+        now = time.monotonic()
+        if self._summary_cache is not None and (
+            (now - self._summary_cache[0] < self._summary_ttl and self._summary_cache[1] == self._revision)
+            or self._transport.cache_only_active
+        ):
+            return dict(self._summary_cache[2])
+        summary = {
+            "node_count":            self._entity_count("nodes", "get_node_count", self.get_node_data),
+            "element_count":         self._entity_count("elements", "get_element_count", self.get_element_data),
+            "material_count":        self._count(self._safe_call(self.get_material_data)),
             "section_count":         self._count(self.get_section_names()),
             "stage_count":           self._count(self.get_stage_names()),
             "load_case_count":       self._count(self.get_load_case_names()),
-            "structure_group_count": self._count(self._safe_get("get_structure_group_names")),
+            "structure_group_count": self._count(self._safe_call(self.get_structure_group_names)),
             "boundary_group_count":  self._count(self._safe_get("get_boundary_group_names")),
         }
+        self._summary_cache = (now, self._revision, summary)
+        return dict(summary)
+
+    def _load_table(self, table: str, fetch) -> Any:
+        """Fetch a full table from the backend and store it in the mirror."""
+        data = fetch()
+        self._mirror.put(table, data)
+        return data
 
     def get_node_data(self, ids: Any = None) -> list[dict]:
         self._require_available()
         if ids is not None:
-            ids = self._validate_ids(ids)
+            ids = self._validate_ids(ids, ordered=True)
+        if self._mirror.enabled:
+            if not self._mirror.is_loaded("nodes"):
+                self._load_table("nodes", self._fetch_node_data)
+            cached = self._mirror.select("nodes", ids)
+            if cached is not None:
+                return cached
+        return self._fetch_node_data(ids)
+
+    def _fetch_node_data(self, ids: Any = None) -> list[dict]:
         result = self._parse(
             self._odb.get_node_data(ids=ids) if ids is not None else self._odb.get_node_data()
         )
         if isinstance(result, dict):
-            return [result]
-        return result if isinstance(result, list) else []
+            result = [result]
+        # qtmodel returns Node objects; hand out plain records like the mirror does.
+        result = [normalize_node(r) for r in result] if isinstance(result, list) else []
+        if ids is None:
+            self._counts["nodes"] = len(result)
+        return result
 
     def get_element_data(self, ids: Any = None) -> list[dict]:
         self._require_available()
         if ids is not None:
-            ids = self._validate_ids(ids)
+            ids = self._validate_ids(ids, ordered=True)
+        if self._mirror.enabled:
+            if not self._mirror.is_loaded("elements"):
+                self._load_table("elements", self._fetch_element_data)
+            cached = self._mirror.select("elements", ids)
+            if cached is not None:
+                return cached
+        return self._fetch_element_data(ids)
+
+    def _fetch_element_data(self, ids: Any = None) -> list[dict]:
         result = self._parse(
             self._odb.get_element_data(ids=ids) if ids is not None else self._odb.get_element_data()
         )
         if isinstance(result, dict):
-            return [result]
-        return result if isinstance(result, list) else []
+            result = [result]
+        # qtmodel returns Element objects; hand out plain records like the mirror does.
+        result = [normalize_element(r) for r in result] if isinstance(result, list) else []
+        if ids is None:
+            self._counts["elements"] = len(result)
+        return result
+
+    def get_table_page(self, table: str, ids: Any = None, offset: int = 0, limit: int = 0,
+                       after: int | None = None) -> dict[str, Any]:
+        self._require_available()
+        if table not in ("nodes", "elements"):
+            raise ValueError(f"Paging supports 'nodes' and 'elements', not '{table}'")
+        fetch = self._fetch_node_data if table == "nodes" else self._fetch_element_data
+        by_id: dict[int, dict] | None = None
+        if ids is not None:
+            order = IdSet.parse(self._validate_ids(ids)).values
+        elif self._mirror.enabled:
+            if not self._mirror.is_loaded(table):
+                self._load_table(table, fetch)
+            by_id = self._mirror.get(table)
+            order = np.sort(np.fromiter(by_id, dtype=np.int64, count=len(by_id)))
+        elif table in self._id_index:
+            order = self._id_index[table]
+        else:
+            # No way to list IDs alone: read the table once and keep its ID index.
+            by_id = {r["id"]: r for r in fetch()}
+            order = np.sort(np.fromiter(by_id, dtype=np.int64, count=len(by_id)))
+            self._id_index[table] = order
+
+        start = int(np.searchsorted(order, after, side="right")) if after is not None else max(offset, 0)
+        page = order[start:start + limit] if limit > 0 else order[start:]
+        wanted = page.tolist()
+        if by_id is not None:
+            rows = [by_id[i] for i in wanted if i in by_id]
+        elif wanted:
+            fetched = {r["id"]: r for r in fetch(wanted)}
+            rows = [fetched[i] for i in wanted if i in fetched]
+        else:
+            rows = []
+        end = start + len(wanted)
+        return {
+            "rows": rows,
+            "total": int(len(order)),
+            "offset": start,
+            "next_after": int(order[end - 1]) if wanted and end < len(order) else None,
+        }
+
+    # ── Spatial Queries ────────────────────────────────────────────────
+
+    def _spatial_index(self, elements: bool = False) -> SpatialIndex:
+        """The node spatial index, (re)loaded from the node/element tables when stale."""
+        self._require_available()
+        if not self._spatial.nodes_loaded:
+            self._spatial.load_nodes(self.get_node_data())
+        if elements and not self._spatial.elements_loaded:
+            self._spatial.load_elements(self.get_element_data())
+        return self._spatial
+
+    def find_nearest_nodes(self, x: float, y: float, z: float, count: int = 1) -> list[dict]:
+        return self._spatial_index().nearest([x, y, z], count)
+
+    def find_nodes_within(self, x: float, y: float, z: float, radius: float) -> list[dict]:
+        return self._spatial_index().within([x, y, z], radius)
+
+    def find_nodes_in_box(self, lo: list[float], hi: list[float]) -> list[dict]:
+        return self._spatial_index().in_box(lo, hi)
+
+    def find_elements_at_point(self, x: float, y: float, z: float, tolerance: float = 1e-3) -> list[dict]:
+        return self._spatial_index(elements=True).elements_at([x, y, z], tolerance)
+
+    def get_spatial_index_status(self) -> dict[str, Any]:
+        return self._spatial.status()
+
+    def find_duplicates(
+        self, tolerance: float = 1e-4, incremental: bool = False, update_baseline: bool = False
+    ) -> dict[str, Any]:
+        start = time.perf_counter()
+        index = self._spatial_index()
+        elements = self.get_element_data()
+        node_ids, xyz = index.ids, index.xyz
+        element_ids = np.fromiter((e["id"] for e in elements), dtype=np.int64, count=len(elements))
+        last = self._duplicates_checked if incremental else None
+        new_rows = new_elements = None
+        if last is not None:
+            new_rows = np.flatnonzero(~np.isin(node_ids, last["nodes"]))
+            new_elements = set(element_ids[~np.isin(element_ids, last["elements"])].tolist())
+        result = {
+            "coincident_nodes": coincident_node_groups(node_ids, xyz, tolerance, new_rows),
+            "overlapping_elements": overlapping_element_groups(
+                elements, node_ids, xyz, tolerance, new_elements
+            ),
+            "incremental": last is not None,
+            "checked": {
+                "nodes": int(len(node_ids) if new_rows is None else len(new_rows)),
+                "elements": int(len(element_ids) if new_elements is None else len(new_elements)),
+            },
+        }
+        if update_baseline:
+            self._duplicates_checked = {"nodes": node_ids.copy(), "elements": element_ids}
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        return result
 
     def get_material_data(self) -> list[dict]:
         self._require_available()
+        cached = self._mirror.get("materials")
+        if cached is not None:
+            return cached
+        return self._load_table("materials", self._fetch_material_data)
+
+    def _fetch_material_data(self) -> list[dict]:
         result = self._parse(self._odb.get_material_data())
         return result if isinstance(result, list) else []
 
@@ -253,7 +760,12 @@ class QtModelProvider(BridgeProvider):
     def get_section_names(self) -> dict[str, str] | list:
         """Return section info (dict of id->name, or list of IDs/dicts depending on API version)."""
         self._require_available()
-        
+        cached = self._mirror.get("sections")
+        if cached is not None:
+            return cached
+        return self._load_table("sections", self._fetch_section_names)
+
+    def _fetch_section_names(self) -> dict[str, str] | list:
         # New API returns JSON dict {"3": "上横梁", "4": "下横梁", ...}
         for method in ("get_section_names", "get_section_ids", "get_all_section_data"):
             result = self._safe_get(method)
@@ -269,13 +781,32 @@ class QtModelProvider(BridgeProvider):
 
     def get_boundary_data(self) -> dict[str, list[dict]]:
         self._require_available()
-        return {
-            "general_supports": self._safe_get("get_general_support_data") or [],
-            "elastic_links":    self._safe_get("get_elastic_link_data") or [],
-            "elastic_supports": self._safe_get("get_elastic_support_data") or [],
-            "master_slave_links": self._safe_get("get_master_slave_link_data") or [],
-            "beam_constraints": self._safe_get("get_beam_constraint_data") or [],
-        }
+        cached = self._mirror.get("boundaries")
+        if cached is not None:
+            return cached
+        return self._load_table("boundaries", self._fetch_boundary_data)
+
+    def _fetch_boundary_data(self) -> dict[str, list[dict]]:
+        data: dict[str, list[dict]] = {}
+        unreadable = []
+        for key, fn_name in _BOUNDARY_QUERIES:
+            fn = getattr(self._odb, fn_name, None)
+            try:
+                if fn is None:
+                    # No qtmodel wrapper: send the command header directly.
+                    result = self._parse(self._transport.send_dict(header=fn_name.replace("_", "-").upper()))
+                else:
+                    result = self._parse(fn())
+            except Exception:
+                if self._transport.cache_only_active:
+                    raise
+                result = None
+                unreadable.append(key)
+            data[key] = result if isinstance(result, list) else []
+        # A failed query is not an empty table: the connectivity check must not
+        # conclude "no supports" from restraints it could not read.
+        self._unreadable_boundaries = unreadable
+        return data
 
     def get_load_case_names(self) -> list[str]:
         """Return load case names."""
@@ -298,18 +829,50 @@ class QtModelProvider(BridgeProvider):
 
     def get_structure_group_names(self) -> list[str]:
         self._require_available()
+        cached = self._mirror.get("structure_groups")
+        if cached is not None:
+            return cached
+        return self._load_table("structure_groups", self._fetch_structure_group_names)
+
+    def _fetch_structure_group_names(self) -> list[str]:
         result = self._safe_get("get_structure_group_names")
         return result if isinstance(result, list) else []
 
+    # ── Model Mirror ───────────────────────────────────────────────────
+
+    def resync_model_mirror(self, enable: bool = True) -> dict[str, Any]:
+        self._require_available()
+        self._mirror.enabled = self._mirror.enabled or enable
+        self._mirror.invalidate()
+        self._spatial.invalidate_nodes()
+        self._counts.clear()
+        self._id_index.clear()
+        self._summary_cache = None
+        self._invalidate_results()
+        if self._mirror.enabled:
+            self._load_table("nodes", self._fetch_node_data)
+            self._load_table("elements", self._fetch_element_data)
+            self._load_table("materials", self._fetch_material_data)
+            self._load_table("sections", self._fetch_section_names)
+            self._load_table("structure_groups", self._fetch_structure_group_names)
+            self._load_table("boundaries", self._fetch_boundary_data)
+        return self._mirror.status()
+
+    def get_model_mirror_status(self) -> dict[str, Any]:
+        return self._mirror.status()
+
     # ── Modeling Operations ────────────────────────────────────────────
 
     def initialize_model(self) -> None:
         self._require_available()
         self._mdb.initial()
+        self._refresh(*MIRROR_TABLES)
+        self._counts.update(nodes=0, elements=0)
 
     def update_model(self) -> None:
-        """Refresh the model display in QiaoTong software."""
+        """Refresh the model display in QiaoTong software, also inside an edit session."""
         self._require_available()
+        self._refresh_counts["issued"] += 1
         self._mdb.update_model()
 
     def save_model_file(self, file_path: str) -> None:
@@ -319,25 +882,44 @@ class QtModelProvider(BridgeProvider):
     def open_model_file(self, file_path: str) -> None:
         self._require_available()
         self._mdb.open_file(file_path=file_path)
+        self._refresh(*MIRROR_TABLES)
 
     def remove_unused_sections(self) -> None:
         self._require_available()
         self._mdb.remove_unused_sections()
-        self._mdb.update_model()
+        self._refresh("sections")
 
     def add_nodes(self, node_data: list[list[float]], **kwargs) -> None:
         self._require_available()
         if not node_data:
             raise ValueError("node_data cannot be empty")
         self._mdb.add_nodes(node_data=node_data, **kwargs)
-        self._mdb.update_model()
+        if all(len(row) == 4 for row in node_data):
+            # Explicit IDs are stored verbatim (no merging or renumbering).
+            self._mirror.upsert("nodes", [
+                {"id": int(r[0]), "x": float(r[1]), "y": float(r[2]), "z": float(r[3])}
+                for r in node_data
+            ])
+            self._spatial.upsert([int(r[0]) for r in node_data], [r[1:4] for r in node_data])
+            self._counts.pop("nodes", None)
+            self._refresh()
+        elif kwargs.get("intersected"):
+            self._refresh("nodes", "elements")
+        else:
+            self._refresh("nodes")
 
     def add_elements(self, ele_data: list[list], **kwargs) -> None:
         self._require_available()
         if not ele_data:
             raise ValueError("ele_data cannot be empty")
         self._mdb.add_elements(ele_data=ele_data, **kwargs)
-        self._mdb.update_model()
+        if all(int(row[0]) > 0 for row in ele_data):
+            self._mirror.upsert("elements", [element_from_row(row) for row in ele_data])
+            self._counts.pop("elements", None)
+            self._spatial.invalidate_elements()
+            self._refresh()
+        else:
+            self._refresh("elements")
 
     def add_material(
         self,
@@ -353,54 +935,54 @@ class QtModelProvider(BridgeProvider):
             params["database"] = database
         params.update(kwargs)
         self._mdb.add_material(**params)
-        self._mdb.update_model()
+        self._refresh("materials")
 
     def add_time_parameter(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_time_parameter(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_creep_function(self, name: str, creep_data: list, scale_factor: float = 1) -> None:
         self._require_available()
         self._mdb.add_creep_function(name=name, creep_data=creep_data, scale_factor=scale_factor)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_shrink_function(self, name: str, shrink_data: list = None, scale_factor: float = 1) -> None:
         self._require_available()
         self._mdb.add_shrink_function(name=name, shrink_data=shrink_data, scale_factor=scale_factor)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_thickness(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_thickness(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_effective_width(self, element_ids, **kwargs) -> None:
         self._require_available()
         self._mdb.add_effective_width(element_ids=element_ids, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_tapper_section_group(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_tapper_section_group(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_section(self, name: str, sec_type: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_section(name=name, sec_type=sec_type, **kwargs)
-        self._mdb.update_model()
+        self._refresh("sections")
 
     def add_tapper_section_by_id(self, name: str, begin_id: int, end_id: int, shear_consider: bool = True, sec_normalize: bool = False) -> None:
         self._require_available()
         self._mdb.add_tapper_section_by_id(name=name, begin_id=begin_id, end_id=end_id, shear_consider=shear_consider, sec_normalize=sec_normalize)
-        self._mdb.update_model()
+        self._refresh("sections")
 
     def remove_section(self, ids: Any) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.remove_section(ids=ids)
-        self._mdb.update_model()
+        self._refresh("sections")
 
     def update_section_bias(self, index: int, bias_type: str, center_type: str = "质心", shear_consider: bool = True, bias_point: list[float] = None, side_i: bool = True) -> None:
         self._require_available()
@@ -422,33 +1004,61 @@ class QtModelProvider(BridgeProvider):
     def update_node(self, node_id: int, **kwargs) -> None:
         self._require_available()
         self._mdb.update_node(node_id=node_id, **kwargs)
+        if kwargs.get("new_id", -1) not in (-1, node_id):
+            self._refresh("nodes", "elements", "boundaries")
+        else:
+            coords = {k: float(v) for k, v in kwargs.items() if k in ("x", "y", "z")}
+            self._mirror.update_fields("nodes", node_id, **coords)
+            self._spatial.update(node_id, **coords)
+            self._refresh()
 
     def update_node_id(self, node_id: int, new_id: int) -> None:
         self._require_available()
         self._mdb.update_node_id(node_id=node_id, new_id=new_id)
+        self._refresh("nodes", "elements", "boundaries")
 
     def renumber_nodes(self, ids: Any = None, new_ids: Any = None) -> None:
         self._require_available()
         if ids is not None:
-            ids = self._validate_ids(ids)
+            ids = expand_ids(self._validate_ids(ids, ordered=True))
         if ids is None:
             self._mdb.renumber_nodes()
         else:
             self._mdb.renumber_nodes(ids, new_ids)
+        self._refresh("nodes", "elements", "boundaries")
+
+    def renumber_nodes_rcm(self, apply: bool = True) -> dict[str, Any]:
+        start = time.perf_counter()
+        index = self._spatial_index()
+        plan = rcm_renumbering(index.ids, self.get_element_data(), self.get_boundary_data())
+        before, after = plan["before"], plan["after"]
+        improves = (after["profile"], after["bandwidth"]) < (before["profile"], before["bandwidth"])
+        plan["applied"] = bool(apply and improves and plan["ids"])
+        if plan["applied"]:
+            # One RENUMBER-NODES call carrying the full old → new map.
+            self.renumber_nodes(plan["ids"], plan["new_ids"])
+        plan["changed"] = len(plan["ids"])
+        plan["seconds"] = round(time.perf_counter() - start, 4)
+        return plan
 
     def move_nodes(self, ids: Any, offset_x: float = 0, offset_y: float = 0, offset_z: float = 0) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.move_nodes(ids=ids, offset_x=offset_x, offset_y=offset_y, offset_z=offset_z)
+        self._mirror.move_nodes(ids, offset_x, offset_y, offset_z)
+        self._spatial.move(expand_ids(ids) if ids is not None else None, offset_x, offset_y, offset_z)
+        self._refresh()
 
     def update_element(self, old_id: int, **kwargs) -> None:
         self._require_available()
         self._mdb.update_element(old_id=old_id, **kwargs)
+        self._refresh("elements", "boundaries")
 
     def update_element_id(self, old_id: int, new_id: int) -> None:
         self._require_available()
         self._mdb.update_element_id(old_id=old_id, new_id=new_id)
+        self._refresh("elements", "boundaries")
 
     def renumber_elements(self, element_ids: Any = None, new_ids: Any = None) -> None:
         self._require_available()
@@ -456,38 +1066,159 @@ class QtModelProvider(BridgeProvider):
             self._mdb.renumber_elements()
         else:
             self._mdb.renumber_elements(element_ids, new_ids)
+        self._refresh("elements", "boundaries")
+
+    def _element_data_references(self) -> dict[int, list[str]]:
+        """Element ID → labels of the element-keyed tables that reference it."""
+        refs: dict[int, list[str]] = {}
+        for label, fn_name in ELEMENT_DATA_QUERIES:
+            try:
+                records = self._parse(getattr(self._odb, fn_name)())
+            except Exception as e:
+                raise ValueError(
+                    f"Cannot read {label} to check what the split would drop (无法读取{label}): {e}"
+                ) from e
+            for element_id in referenced_elements(records):
+                refs.setdefault(element_id, []).append(label)
+        return refs
+
+    def subdivide_elements(self, ids: Any, segments: int = 2, ratio: float = 1.0) -> dict[str, Any]:
+        self._require_available()
+        start = time.perf_counter()
+        requested = id_array(self._validate_ids(ids, required=True))
+        selected = self.get_element_data(requested.tolist())
+        missing = np.setdiff1d(requested, [e["id"] for e in selected])
+        if len(missing):
+            raise ValueError(f"Elements not found (单元不存在): {compress_ids(missing.tolist())}")
+        frames = [e for e in selected if e["type"] in SUBDIVIDABLE_TYPES and len(e["node_ids"]) >= 2]
+        frame_ids = {e["id"] for e in frames}
+        skipped = sorted(e["id"] for e in selected if e["id"] not in frame_ids)
+        # Loads, end releases, effective widths... keyed to a parent ID would be
+        # lost with it; such elements are left whole.
+        refs = self._element_data_references() if frames else {}
+        refused = {e["id"]: refs[e["id"]] for e in frames if e["id"] in refs}
+        frames = [e for e in frames if e["id"] not in refused]
+        result: dict[str, Any] = {
+            "elements": len(frames), "new_nodes": 0, "new_elements": 0, "groups": [],
+            "skipped": skipped, "refused": refused,
+        }
+        if not frames:
+            result["seconds"] = round(time.perf_counter() - start, 4)
+            return result
+
+        # The whole plan is built and checked before the first write.
+        index = self._spatial_index()
+        all_elements = self.get_element_data()
+        plan = subdivide_frames(
+            frames, index.ids, index.xyz, segments, ratio,
+            next_node_id=int(index.ids.max(initial=0)) + 1,
+            next_element_id=max((e["id"] for e in all_elements), default=0) + 1,
+        )
+        # Group membership is read before the parents are removed from their groups.
+        memberships = []
+        for name in self.get_structure_group_names():
+            members = np.isin(plan["parents"], np.asarray(self.get_structure_group_elements(name), dtype=np.int64))
+            if members.any():
+                memberships.append((name, members))
+
+        done: list[str] = []
+        with self.edit_session(name="subdivide_elements"):
+            try:
+                self.remove_elements(plan["parents"].tolist())
+                done.append("removed")
+                self.add_nodes(node_data=plan["node_data"], intersected=False, is_merged=False)
+                done.append("nodes")
+                self.add_elements(ele_data=plan["ele_data"])
+                done.append("elements")
+                for name, members in memberships:
+                    self._mdb.add_structure_to_group(
+                        name=name,
+                        node_ids=plan["nodes"][members].ravel().tolist(),
+                        element_ids=plan["elements"][members].ravel().tolist(),
+                    )
+                    self._refresh()
+            except Exception as e:
+                self._undo_subdivision(frames, plan, memberships, done, e)
+                raise
+
+        result.update({
+            "new_nodes": len(plan["node_data"]),
+            "new_elements": len(plan["ele_data"]) - len(frames),
+            "groups": [name for name, _ in memberships],
+            "seconds": round(time.perf_counter() - start, 4),
+        })
+        return result
+
+    def _undo_subdivision(self, frames: list[dict], plan: dict[str, Any],
+                          memberships: list[tuple[str, np.ndarray]], done: list[str],
+                          error: Exception) -> None:
+        """Put the parent elements back after a failed subdivision write."""
+        logger.warning(f"Subdivision failed after {done or 'no writes'}, rolling back: {error}")
+        try:
+            if "elements" in done:
+                self.remove_elements(plan["elements"].ravel().tolist())
+            if "nodes" in done:
+                self.remove_nodes(plan["nodes"].ravel().tolist())
+            if "removed" in done:
+                self.add_elements(ele_data=[
+                    [e["id"], e["type"], e["material_id"], e["section_id"], e["beta_angle"], *e["node_ids"][:2]]
+                    for e in frames
+                ])
+                for name, members in memberships:
+                    self._mdb.add_structure_to_group(name=name, element_ids=plan["parents"][members].tolist())
+                self._refresh()
+        except Exception as undo_error:
+            raise RuntimeError(
+                f"Subdivision failed ({error}) and the rollback failed too ({undo_error}); "
+                f"elements {compress_ids(plan['parents'].tolist())} may be missing "
+                f"(细分失败且回滚失败，请检查模型)"
+            ) from error
 
     def revert_local_orientation(self, ids: Any) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.revert_local_orientation(ids=ids)
+        self._refresh("elements")
 
     def update_element_material(self, ids: Any, mat_id: int) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.update_element_material(ids=ids, mat_id=mat_id)
+        self._mirror.update_fields("elements", ids, material_id=int(mat_id))
+        self._spatial.invalidate_elements()
+        self._refresh()
 
     def update_frame_section(self, ids: Any, sec_id: int) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.update_frame_section(ids=ids, sec_id=sec_id)
+        self._mirror.update_fields("elements", ids, section_id=int(sec_id))
+        self._spatial.invalidate_elements()
+        self._refresh()
 
     def update_element_beta(self, ids: Any, beta: float) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.update_element_beta(ids=ids, beta=beta)
+        self._mirror.update_fields("elements", ids, beta_angle=float(beta))
+        self._spatial.invalidate_elements()
+        self._refresh()
 
     def update_element_node(self, element_id: int, node_ids: list) -> None:
         self._require_available()
         self._mdb.update_element_node(element_id, node_ids)
+        self._mirror.update_fields("elements", element_id, node_ids=[int(n) for n in node_ids])
+        self._spatial.invalidate_elements()
+        self._refresh()
 
     def remove_structure_from_group(self, name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.remove_structure_from_group(name=name, **kwargs)
+        self._touch()
 
     def remove_nodes(self, ids: Any = None) -> None:
         self._require_available()
@@ -497,6 +1228,13 @@ class QtModelProvider(BridgeProvider):
             self._mdb.remove_nodes(ids=ids)
         else:
             self._mdb.remove_nodes()
+        self._mirror.remove("nodes", ids)
+        self._spatial.remove(expand_ids(ids) if ids is not None else None)
+        self._refresh("elements", "boundaries")
+        if ids is None:
+            self._counts["nodes"] = 0
+        else:
+            self._counts.pop("nodes", None)
 
     def remove_elements(self, ids: Any = None, remove_free: bool = False) -> None:
         self._require_available()
@@ -506,6 +1244,16 @@ class QtModelProvider(BridgeProvider):
             self._mdb.remove_elements(ids=ids, remove_free=remove_free)
         else:
             self._mdb.remove_elements(remove_free=remove_free)
+        self._mirror.remove("elements", ids)
+        if remove_free:
+            self._refresh("nodes", "boundaries")
+        else:
+            self._spatial.invalidate_elements()
+            self._refresh()
+        if ids is None:
+            self._counts["elements"] = 0
+        else:
+            self._counts.pop("elements", None)
 
     def merge_nodes(self, ids: Any = None, tolerance: float = 1e-4) -> None:
         self._require_available()
@@ -515,6 +1263,7 @@ class QtModelProvider(BridgeProvider):
             self._mdb.merge_nodes(ids=ids, tolerance=tolerance)
         else:
             self._mdb.merge_nodes(tolerance=tolerance)
+        self._refresh("nodes", "elements", "boundaries")
 
 
 
@@ -525,7 +1274,7 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_general_support(
             node_id=node_id, boundary_info=boundary_info, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     def add_elastic_link(
         self, link_type: int, start_id: int, end_id: int, **kwargs
@@ -534,7 +1283,7 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_elastic_link(
             link_type=link_type, start_id=start_id, end_id=end_id, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     def add_beam_constraint(
         self, beam_id: int, info_i: list[bool] = None, info_j: list[bool] = None, group_name: str = ""
@@ -548,29 +1297,29 @@ class QtModelProvider(BridgeProvider):
         if group_name:
             kwargs["group_name"] = group_name
         self._mdb.add_beam_constraint(**kwargs)
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     def add_constraint_equation(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_constraint_equation(**kwargs)
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_boundary(self, **kwargs) -> None:
         self._require_available()
         self._mdb.remove_boundary(**kwargs)
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     # ── Load Operations ────────────────────────────────────────────────
 
     def add_load_group(self, name: str) -> None:
         self._require_available()
         self._mdb.add_load_group(name=name)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_load_case(self, name: str, case_type: str = "施工阶段荷载", desc: str = "") -> None:
         self._require_available()
         self._mdb.add_load_case(name=name, case_type=case_type)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_load_combine(self, index: int = -1, name: str = "", combine_type: int = 1, describe: str = "", combine_info: list[tuple] = None) -> None:
         self._require_available()
@@ -578,7 +1327,7 @@ class QtModelProvider(BridgeProvider):
         if combine_info is not None:
             kwargs["combine_info"] = combine_info
         self._mdb.add_load_combine(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_nodal_force(
         self, node_id: Any, case_name: str, load_info: list, **kwargs
@@ -587,7 +1336,7 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_nodal_force(
             node_id=node_id, case_name=case_name, load_info=load_info, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
     def add_beam_element_load(
         self, element_id: Any, case_name: str, load_type: int, **kwargs
@@ -596,7 +1345,7 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_beam_element_load(
             element_id=element_id, case_name=case_name, load_type=load_type, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
     def add_system_temperature(
         self, element_id: Any, case_name: str, temperature: float, **kwargs
@@ -605,7 +1354,7 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_element_temperature(
             element_id=element_id, case_name=case_name, temperature=temperature, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
     def add_gradient_temperature(
         self, element_id: Any, case_name: str, temperature_g: float, **kwargs
@@ -614,38 +1363,38 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_gradient_temperature(
             element_id=element_id, case_name=case_name, temperature_g=temperature_g, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
 
     def add_custom_temperature(self, element_id, case_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_custom_temperature(element_id=element_id, case_name=case_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_beam_section_temperature(self, element_id, case_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_beam_section_temperature(element_id=element_id, case_name=case_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_initial_tension_load(self, element_id, case_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_initial_tension_load(element_id=element_id, case_name=case_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_cable_length_load(self, element_id, case_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_cable_length_load(element_id=element_id, case_name=case_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_plate_element_load(self, element_id, case_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_plate_element_load(element_id=element_id, case_name=case_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_distribute_plane_load(self, index: int, case_name: str, type_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_distribute_plane_load(index=index, case_name=case_name, type_name=type_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_support_settlement(
         self, node_id: Any, case_name: str, displacement_info: list, **kwargs
@@ -654,36 +1403,36 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_node_displacement(
             node_id=node_id, case_name=case_name, displacement_info=displacement_info, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
     # ── Tendon Operations ──────────────────────────────────────────────
 
     def add_tendon_property(self, name: str, tendon_type: int, **kwargs) -> None:
         self._require_available()
         self._mdb.add_tendon_property(name=name, tendon_type=tendon_type, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_tendon_2d(self, name: str, property_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_tendon_2d(name=name, property_name=property_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_tendon_profile(self, name: str, property_name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_tendon_profile(name=name, property_name=property_name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_tendon_3d(self, name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_tendon_3d(name=name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_tendon_elements(self, ids: Any) -> None:
         self._require_available()
         if ids is not None:
             ids = self._validate_ids(ids)
         self._mdb.add_tendon_elements(ids=ids)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_pre_stress(
         self, case_name: str, tendon_name: str, force: float, **kwargs
@@ -692,656 +1441,634 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_pre_stress(
             case_name=case_name, tendon_name=tendon_name, force=force, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh()
 
     # ── Construction Stage Operations ──────────────────────────────────
 
     def add_construction_stage(self, name: str, duration: float, **kwargs) -> None:
         self._require_available()
         self._mdb.add_construction_stage(name=name, duration=duration, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def merge_all_stages(self, name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.merge_all_stages(name=name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def remove_construction_stage(self, name: str = "") -> None:
         self._require_available()
         self._mdb.remove_construction_stage(name=name)
-        self._mdb.update_model()
+        self._refresh()
 
     def update_construction_stage(self, name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.update_construction_stage(name=name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def switch_display_stage(self, stage_name: str) -> None:
         self._require_available()
         self._mdb.update_view_stage(stage_name=stage_name)
-        self._mdb.update_model()
+        self._refresh()
 
     # ── Analysis Operations ────────────────────────────────────────────
 
     def update_project_setting(self, **kwargs) -> None:
         self._require_available()
         self._mdb.update_project_setting(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def update_construction_stage_setting(self, **kwargs) -> None:
         self._require_available()
         self._mdb.update_construction_stage_setting(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def update_self_vibration_setting(self, **kwargs) -> None:
         self._require_available()
         self._mdb.update_self_vibration_setting(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def update_bulking_setting(self, **kwargs) -> None:
         self._require_available()
         self._mdb.update_bulking_setting(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_nodal_mass(self, node_id, **kwargs) -> None:
         self._require_available()
         self._mdb.add_nodal_mass(node_id=node_id, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_load_to_mass(self, name: str, factor: float = 1.0) -> None:
         self._require_available()
         self._mdb.add_load_to_mass(name=name, factor=factor)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_spectrum_function(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_spectrum_function(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_spectrum_case(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_spectrum_case(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_time_history_function(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_time_history_function(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_time_history_case(self, **kwargs) -> None:
         self._require_available()
         self._mdb.add_time_history_case(**kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
-    def run_analysis(self) -> None:
-        self._require_available()
-        # qtmodel uses do_solve() with read_timeout
-        self._mdb.do_solve(read_timeout=3600)
+    def _solve_fingerprint(self, verify: bool) -> str | None:
+        try:
+            return self.get_model_fingerprint(verify=verify)["fingerprint"]
+        except Exception as e:
+            logger.warning(f"Model fingerprint unavailable, cannot skip the solve: {e}")
+            return None
+
+    def _changes_since_solve(self) -> list[str]:
+        """
+        Why the model needs solving again, from the write counter and the
+        analysis settings alone; empty when neither changed since the last solve.
+        """
+        last = self._last_solve
+        if last is None:
+            return ["no successful solve in this session (本次会话尚未成功计算)"]
+        reasons = []
+        writes = self._model_writes - last["model_writes"]
+        if writes:
+            reasons.append(f"{writes} model writes since the last solve (上次计算后模型已修改)")
+        changed = sorted(
+            h for h in {*self._analysis_settings, *last["settings"]}
+            if self._analysis_settings.get(h) != last["settings"].get(h)
+        )
+        if changed:
+            reasons.append(f"analysis settings changed: {', '.join(changed)} (分析设置已修改)")
+        return reasons
+
+    def run_analysis(self, force: bool = False) -> dict[str, Any]:
+        self._require_available()
+        reasons = self._changes_since_solve()
+        fingerprint = None
+        if not reasons:
+            # No writes from this server: only a verified fingerprint (every
+            # table re-read) can tell whether the model was edited in the GUI.
+            fingerprint = self._solve_fingerprint(verify=True)
+            if fingerprint is None or self._last_solve["fingerprint"] is None:
+                reasons.append("model fingerprint unavailable (无法获取模型指纹)")
+            elif fingerprint != self._last_solve["fingerprint"]:
+                reasons.append("model content changed outside this server (模型在界面中被修改)")
+            if not reasons and not force:
+                return {"skipped": True, "last_solve": dict(self._last_solve)}
+        else:
+            # Solving anyway; the quick fingerprint only re-reads tables written
+            # since it was last taken and is the baseline for the next skip check.
+            fingerprint = self._solve_fingerprint(verify=False)
+        model_writes, settings = self._model_writes, dict(self._analysis_settings)
+        self._invalidate_results()
+        entry = {
+            "started_at": time.time(),
+            "seconds": None,
+            "ok": False,
+            "forced": force and not reasons,
+            "reasons": reasons,
+        }
+        start = time.perf_counter()
+        try:
+            # The transport waits solve_timeout for the reply; qtmodel's own
+            # read_timeout argument is fixed at 600 s and not used.
+            self._mdb.do_solve()
+            entry["ok"] = True
+        finally:
+            self._invalidate_results()
+            entry["seconds"] = round(time.perf_counter() - start, 3)
+            self._solve_history.append(entry)
+            self._last_solve = {
+                **entry, "model_writes": model_writes, "settings": settings, "fingerprint": fingerprint,
+            } if entry["ok"] else None
+        return {"skipped": False, **entry}
+
+    def get_analysis_history(self) -> dict[str, Any]:
+        last = self._last_solve
+        return {
+            "last_solve": {k: last[k] for k in ("started_at", "seconds", "fingerprint")} if last else None,
+            "model_writes_since": self._model_writes - last["model_writes"] if last else None,
+            "solves": [dict(e) for e in self._solve_history],
+        }
 
 
 
     def update_plate_thick(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_plate_thick")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_shrink_function(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_shrink_function")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_creep_function(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_creep_function")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_material_time_parameter(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_material_time_parameter")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_material_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_material_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("materials")
 
     def update_time_parameter_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_time_parameter_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_material(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_material")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("materials")
 
     def update_material_construction_factor(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_material_construction_factor")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_time_parameter(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_time_parameter")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_thickness_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_thickness_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_thickness(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_thickness")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_section_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_section_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("sections")
 
     def update_tapper_section_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_tapper_section_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("sections")
 
     def remove_tapper_section_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_tapper_section_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("sections")
 
     def update_boundary_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_boundary_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def update_node_axis_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_node_axis_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_general_elastic_support_property_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_general_elastic_support_property_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_effective_width(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_effective_width")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_boundary_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_boundary_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_all_boundary(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_all_boundary")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_general_elastic_support_property(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_general_elastic_support_property")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_node_axis(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_node_axis")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_tendon_property_material(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_tendon_property_material")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_tendon_property(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_tendon_property")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_tendon_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_tendon_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_element_component_type(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_element_component_type")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("elements")
 
     def update_tendon_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_tendon_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_tendon(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_tendon")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_tendon_property(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_tendon_property")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_pre_stress(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_pre_stress")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_tendon_group(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_tendon_group")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_distribute_plane_load_type(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_distribute_plane_load_type")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_nodal_force(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_nodal_force")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_nodal_displacement(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_nodal_displacement")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_initial_tension_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_initial_tension_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_beam_element_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_beam_element_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_plate_element_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_plate_element_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_cable_length_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_cable_length_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_distribute_plane_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_distribute_plane_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_distribute_plane_load_type(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_distribute_plane_load_type")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_vehicle_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_vehicle_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_influence_plane_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_influence_plane_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_lane_line_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_lane_line_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_node_tandem_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_node_tandem_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_live_load_case_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_live_load_case_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_vehicle(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_vehicle")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_node_tandem(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_node_tandem")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_influence_plane(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_influence_plane")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_lane_line(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_lane_line")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_live_load_case(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_live_load_case")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_load_to_mass(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_load_to_mass")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_nodal_mass(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_nodal_mass")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_boundary_element_property_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_boundary_element_property_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_boundary_element_link(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_boundary_element_link")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def update_time_history_case_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_time_history_case_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_time_history_function_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_time_history_function_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_nodal_dynamic_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_nodal_dynamic_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_ground_motion(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_ground_motion")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_time_history_load_case(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_time_history_load_case")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_time_history_function(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_time_history_function")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_load_to_mass(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_load_to_mass")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_nodal_mass(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_nodal_mass")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_boundary_element_property(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_boundary_element_property")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_boundary_element_link(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_boundary_element_link")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh("boundaries")
 
     def remove_ground_motion(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_ground_motion")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_nodal_dynamic_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_nodal_dynamic_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_spectrum_function_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_spectrum_function_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_spectrum_case_name(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_spectrum_case_name")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_spectrum_case(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_spectrum_case")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_spectrum_function(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_spectrum_function")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_element_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_element_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_top_plate_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_top_plate_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_beam_section_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_beam_section_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_gradient_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_gradient_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_custom_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_custom_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_index_temperature(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_index_temperature")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_deviation_parameter(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_deviation_parameter")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_deviation_parameter(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_deviation_parameter")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_deviation_load(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_deviation_load")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_weight_stage(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_weight_stage")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_construction_stage_id(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_construction_stage_id")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_all_stage_setting_type(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_all_stage_setting_type")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_section_connection_stage(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_section_connection_stage")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_section_connection_stage(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "remove_section_connection_stage")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_global_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_global_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_live_load_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_live_load_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_non_linear_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_non_linear_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_operation_stage_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_operation_stage_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_response_spectrum_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_response_spectrum_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def update_time_history_setting(self, *args, **kwargs):
         self._require_available()
         getattr(self._mdb, "update_time_history_setting")(*args, **kwargs)
-        if "_mdb" == "_mdb":
-            self._mdb.update_model()
+        self._refresh()
 
     def remove_check_load_combine(self, *args, **kwargs):
         self._require_available()
         getattr(self._cdb, "remove_check_load_combine")(*args, **kwargs)
-        if "_cdb" == "_mdb":
-            self._mdb.update_model()
 
     def remove_concrete_check_case(self, *args, **kwargs):
         self._require_available()
         getattr(self._cdb, "remove_concrete_check_case")(*args, **kwargs)
-        if "_cdb" == "_mdb":
-            self._mdb.update_model()
 
     def update_element_steel_hoop(self, *args, **kwargs):
         self._require_available()
         getattr(self._cdb, "update_element_steel_hoop")(*args, **kwargs)
-        if "_cdb" == "_mdb":
-            self._mdb.update_model()
 
 
     def add_single_section(self, *args, **kwargs):
         self._require_available()
-        return getattr(self._mdb, "add_single_section")(*args, **kwargs)
+        result = getattr(self._mdb, "add_single_section")(*args, **kwargs)
+        self._touch("sections")
+        return result
 
     def add_elements_to_tapper_section_group(self, *args, **kwargs):
         self._require_available()
@@ -1349,7 +2076,9 @@ class QtModelProvider(BridgeProvider):
 
     def add_tapper_section_from_group(self, *args, **kwargs):
         self._require_available()
-        return getattr(self._mdb, "add_tapper_section_from_group")(*args, **kwargs)
+        result = getattr(self._mdb, "add_tapper_section_from_group")(*args, **kwargs)
+        self._touch("sections")
+        return result
 
     def add_general_elastic_support_property(self, *args, **kwargs):
         self._require_available()
@@ -1357,11 +2086,15 @@ class QtModelProvider(BridgeProvider):
 
     def add_general_elastic_support(self, *args, **kwargs):
         self._require_available()
-        return getattr(self._mdb, "add_general_elastic_support")(*args, **kwargs)
+        result = getattr(self._mdb, "add_general_elastic_support")(*args, **kwargs)
+        self._touch("boundaries")
+        return result
 
     def add_master_slave_links(self, *args, **kwargs):
         self._require_available()
-        return getattr(self._mdb, "add_master_slave_links")(*args, **kwargs)
+        result = getattr(self._mdb, "add_master_slave_links")(*args, **kwargs)
+        self._touch("boundaries")
+        return result
 
     def add_node_axis(self, *args, **kwargs):
         self._require_available()
@@ -1405,7 +2138,9 @@ class QtModelProvider(BridgeProvider):
 
     def add_boundary_element_link(self, *args, **kwargs):
         self._require_available()
-        return getattr(self._mdb, "add_boundary_element_link")(*args, **kwargs)
+        result = getattr(self._mdb, "add_boundary_element_link")(*args, **kwargs)
+        self._touch("boundaries")
+        return result
 
     def add_nodal_dynamic_load(self, *args, **kwargs):
         self._require_available()
@@ -1464,29 +2199,62 @@ class QtModelProvider(BridgeProvider):
         return getattr(self._cdb, "add_reinforcement_by_point")(*args, **kwargs)
     # ── Result Extraction ──────────────────────────────────────────────
 
-    def get_deformation(self, ids: Any, stage_id: int, **kwargs) -> str:
-        self._require_available()
-        if ids is not None:
-            ids = self._validate_ids(ids)
-        return self._odb.get_deformation(ids=ids, stage_id=stage_id, **kwargs)
-
-    def get_element_force(self, ids: Any, stage_id: int, **kwargs) -> str:
-        self._require_available()
-        if ids is not None:
-            ids = self._validate_ids(ids)
-        return self._odb.get_element_force(ids=ids, stage_id=stage_id, **kwargs)
-
-    def get_element_stress(self, ids: Any, stage_id: int, **kwargs) -> str:
-        self._require_available()
-        if ids is not None:
-            ids = self._validate_ids(ids)
-        return self._odb.get_element_stress(ids=ids, stage_id=stage_id, **kwargs)
+    def _invalidate_results(self) -> None:
+        self._revision += 1
+        self._results.clear()
 
-    def get_reaction(self, ids: Any, stage_id: int, **kwargs) -> str:
+    def _fetch_result(self, result_type: str, ids: Any, stage_id: int, **kwargs) -> tuple[dict | None, Any]:
+        """
+        Return (columns, parsed) for a result query. Tabular results are
+        converted to NumPy columns and cached, with parsed=None; anything
+        else is returned as parsed with columns=None.
+        """
         self._require_available()
+        fetcher = _RESULT_FETCHERS.get(result_type)
+        if fetcher is None:
+            raise ValueError(
+                f"Unknown result_type '{result_type}'. Available: {', '.join(_RESULT_FETCHERS)}"
+            )
         if ids is not None:
-            ids = self._validate_ids(ids)
-        return self._odb.get_reaction(ids=ids, stage_id=stage_id, **kwargs)
+            ids = self._validate_ids(ids, ordered=True)
+        options = tuple(sorted((k, repr(v)) for k, v in kwargs.items() if k != "case_name"))
+        key = (result_type, stage_id, kwargs.get("case_name", ""), ids_key(ids), self._revision, options)
+        columns = self._results.get(key)
+        if columns is not None:
+            return columns, None
+        parsed = self._parse(getattr(self._odb, fetcher)(ids=ids, stage_id=stage_id, **kwargs))
+        if not (isinstance(parsed, list) and all(isinstance(r, dict) for r in parsed)):
+            return None, parsed
+        columns = to_columns(parsed)
+        self._results.put(key, columns)
+        return columns, None
+
+    def _result_records(self, result_type: str, ids: Any, stage_id: int, **kwargs) -> Any:
+        # Records always come from the columns, so a cache hit returns
+        # exactly what the first (uncached) call did.
+        columns, parsed = self._fetch_result(result_type, ids, stage_id, **kwargs)
+        return parsed if columns is None else from_columns(columns)
+
+    def get_result_columns(self, result_type: str, ids: Any, stage_id: int, **kwargs) -> dict[str, Any]:
+        columns, _ = self._fetch_result(result_type, ids, stage_id, **kwargs)
+        if columns is None:
+            raise ValueError(f"{result_type} result is not tabular (结果不是表格数据)")
+        return columns
+
+    def get_result_cache_status(self) -> dict[str, Any]:
+        return {"revision": self._revision, **self._results.status()}
+
+    def get_deformation(self, ids: Any, stage_id: int, **kwargs) -> Any:
+        return self._result_records("deformation", ids, stage_id, **kwargs)
+
+    def get_element_force(self, ids: Any, stage_id: int, **kwargs) -> Any:
+        return self._result_records("force", ids, stage_id, **kwargs)
+
+    def get_element_stress(self, ids: Any, stage_id: int, **kwargs) -> Any:
+        return self._result_records("stress", ids, stage_id, **kwargs)
+
+    def get_reaction(self, ids: Any, stage_id: int, **kwargs) -> Any:
+        return self._result_records("reaction", ids, stage_id, **kwargs)
 
     def get_vibration_modal_results(self, mode: int = 1) -> list[dict]:
         self._require_available()
@@ -1730,20 +2498,19 @@ class QtModelProvider(BridgeProvider):
         errors = []
         warnings = []
 
-        # Check for overlapping nodes
-        overlap_nodes = self._odb.get_overlap_nodes()
+        # Overlapping nodes and elements, detected locally
+        duplicates = self.find_duplicates()
+        overlap_nodes = duplicates["coincident_nodes"]
         if overlap_nodes:
             warnings.append(
                 f"Found {len(overlap_nodes)} groups of overlapping nodes "
-                f"(发现 {len(overlap_nodes)} 组重合节点): {overlap_nodes[:5]}..."
+                f"(发现 {len(overlap_nodes)} 组重合节点)"
             )
-
-        # Check for overlapping elements
-        overlap_elements = self._odb.get_overlap_elements()
+        overlap_elements = duplicates["overlapping_elements"]
         if overlap_elements:
             warnings.append(
                 f"Found {len(overlap_elements)} groups of overlapping elements "
-                f"(发现 {len(overlap_elements)} 组重合单元): {overlap_elements[:5]}..."
+                f"(发现 {len(overlap_elements)} 组重合单元)"
             )
 
         # Check basic model existence
@@ -1755,13 +2522,44 @@ class QtModelProvider(BridgeProvider):
         if summary["material_count"] == 0:
             errors.append("Model has no materials (模型无材料)")
 
+        connectivity = self.check_connectivity()
+        found_errors, found_warnings = connectivity_issues(connectivity)
+        errors.extend(found_errors)
+        warnings.extend(found_warnings)
+
         return {
             "is_valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
             "summary": summary,
+            "overlapping_nodes": overlap_nodes,
+            "overlapping_elements": overlap_elements,
+            "connectivity": connectivity,
         }
 
+    def check_connectivity(self) -> dict[str, Any]:
+        start = time.perf_counter()
+        index = self._spatial_index()
+        materials = self.get_material_data()
+        sections = self.get_section_names()
+        section_ids = {int(k) for k in sections} if isinstance(sections, dict) else {
+            int(s["id"]) if isinstance(s, dict) else int(s) for s in sections or []
+        }
+        result = check_connectivity(
+            index.ids,
+            index.xyz,
+            self.get_element_data(),
+            self.get_boundary_data(),
+            # An empty or unreadable table skips its check rather than flagging every element.
+            material_ids={
+                int(m.get("id", m.get("index", 0))) for m in materials if isinstance(m, dict)
+            } or None,
+            section_ids=section_ids or None,
+            unreadable=self._unreadable_boundaries,
+        )
+        result["seconds"] = round(time.perf_counter() - start, 4)
+        return result
+
     # ── Structural Checking ────────────────────────────────────────────
 
     def add_check_load_combine(
@@ -1801,12 +2599,14 @@ class QtModelProvider(BridgeProvider):
     def add_structure_group(self, name: str) -> None:
         self._require_available()
         self._mdb.add_structure_group(name=name)
-        self._mdb.update_model()
+        self._mirror.add_group(name)
+        self._refresh()
 
     def update_structure_group_name(self, name: str, new_name: str) -> None:
         self._require_available()
         self._mdb.update_structure_group_name(name=name, new_name=new_name)
-        self._mdb.update_model()
+        self._mirror.rename_group(name, new_name)
+        self._refresh()
 
     def remove_structure_group(self, name: str = "") -> None:
         self._require_available()
@@ -1814,28 +2614,29 @@ class QtModelProvider(BridgeProvider):
             self._mdb.remove_structure_group(name=name)
         else:
             self._mdb.remove_structure_group()
-        self._mdb.update_model()
+        self._mirror.remove_group(name)
+        self._refresh()
 
     def add_elements_to_structure_group(self, name: str, element_ids: Any) -> None:
         self._require_available()
         # Real API uses add_structure_to_group
         self._mdb.add_structure_to_group(name=name, element_ids=element_ids)
-        self._mdb.update_model()
+        self._refresh()
 
     def get_structure_group_elements(self, name: str) -> list:
         self._require_available()
         # Real API uses get_group_elements
-        return self._odb.get_group_elements(name=name) or []
+        return self._odb.get_group_elements(group_name=name) or []
 
     def add_boundary_group(self, name: str) -> None:
         self._require_available()
         self._mdb.add_boundary_group(name=name)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_load_group(self, name: str) -> None:
         self._require_available()
         self._mdb.add_load_group(name=name)
-        self._mdb.update_model()
+        self._refresh()
 
     # ── Advanced Boundary ──────────────────────────────────────────────
 
@@ -1844,14 +2645,14 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_master_slave_link(
             master_id=master_id, slave_ids=slave_ids, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     def add_elastic_support(self, node_id: Any, spring_values: list, **kwargs) -> None:
         self._require_available()
         self._mdb.add_elastic_support(
             node_id=node_id, spring_values=spring_values, **kwargs
         )
-        self._mdb.update_model()
+        self._refresh("boundaries")
 
     # ── Moving Loads ───────────────────────────────────────────────────
 
@@ -1860,33 +2661,25 @@ class QtModelProvider(BridgeProvider):
         self._mdb.add_standard_vehicle(
             name=name, vehicle_type=vehicle_type, standard=standard
         )
-        self._mdb.update_model()
+        self._refresh()
 
     def add_lane(self, name: str, **kwargs) -> None:
         self._require_available()
         # Real API method is add_lane_line
         self._mdb.add_lane_line(name=name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def add_live_load_case(self, name: str, **kwargs) -> None:
         self._require_available()
         self._mdb.add_live_load_case(name=name, **kwargs)
-        self._mdb.update_model()
+        self._refresh()
 
     def get_live_load_results(self, case_name: str, result_type: str, ids: Any) -> Any:
-        self._require_available()
-        if ids is not None:
-            ids = self._validate_ids(ids)
         # Live load results are embedded in standard result queries (deformation/force/stress)
         # Query using the live load case name directly
-        if result_type == "force":
-            return self._odb.get_element_force(ids=ids, stage_id=-1, case_name=case_name)
-        elif result_type == "stress":
-            return self._odb.get_element_stress(ids=ids, stage_id=-1, case_name=case_name)
-        elif result_type == "deformation":
-            return self._odb.get_deformation(ids=ids, stage_id=-1, case_name=case_name)
-        else:
-            return self._odb.get_element_force(ids=ids, stage_id=-1, case_name=case_name)
+        if result_type not in ("force", "stress", "deformation"):
+            result_type = "force"
+        return self._result_records(result_type, ids, -1, case_name=case_name)
 
     # ── Self-weight ────────────────────────────────────────────────────
 
@@ -1895,7 +2688,7 @@ class QtModelProvider(BridgeProvider):
         # In QiaoTong, self-weight is applied by the solver automatically when a
         # load case exists. The caller must create the load group and load case
         # BEFORE calling this method. We only trigger the model refresh here.
-        self._mdb.update_model()
+        self._refresh()
 
     # ── Tendon Data ────────────────────────────────────────────────────
 
@@ -0,0 +1,122 @@
+"""
+Analysis-result cache for the qtmodel provider.
+分析结果缓存
+
+Parsed results are held as NumPy column arrays (see result_parser.to_columns)
+keyed by (result type, stage, case, ID set, model revision, other options).
+Entries are evicted least-recently-used once their total size exceeds a byte
+budget. The provider clears the cache whenever the model is written or an
+analysis is run; the revision in the key keeps a stale entry from ever being
+served should a clear be missed.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from bridge_mcp.providers.model_mirror import expand_ids
+
+
+def ids_key(ids: Any) -> Any:
+    """
+    Key for an ID selection (None means "all"). Rows come back in the
+    requested order, so the same IDs in another order are another key.
+    """
+    if ids is None:
+        return None
+    try:
+        values = np.asarray(expand_ids(ids), dtype=np.int64)
+    except (TypeError, ValueError):
+        return ("raw", str(ids))
+    if values.size <= 16:
+        return tuple(values.tolist())
+    # Large selections are keyed by digest rather than kept as a tuple.
+    return (int(values.size), hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest())
+
+
+def columns_nbytes(value: Any) -> int:
+    """Approximate memory held by a cached value."""
+    if isinstance(value, dict):
+        total = 0
+        for column in value.values():
+            total += column.nbytes
+            if column.dtype == object:
+                total += sum(sys.getsizeof(v) for v in column)
+        return total
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Byte-budgeted LRU of parsed analysis results.
+    按字节预算淘汰的 LRU 结果缓存
+
+    Args:
+        max_bytes: total size of cached columns; 0 disables the cache
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: tuple) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value: Any) -> None:
+        if not self.enabled:
+            return
+        size = columns_nbytes(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def status(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,204 @@
+"""
+Result payload parsing for the qtmodel provider.
+qtmodel 返回结果解析
+
+qtmodel returns either JSON text, Python-repr text (single-quoted strings,
+True/False/None) or already-decoded objects. The parser sniffs the format
+from the first few kilobytes and goes straight to the matching decoder,
+instead of attempting json.loads on the whole payload and falling back to
+ast.literal_eval — which dominates response time for multi-megabyte results.
+
+Large tabular results (lists of flat or nested dicts) can also be decoded
+into NumPy column arrays with `to_columns` and rebuilt with `from_columns`.
+"""
+
+import ast
+import json
+import logging
+import re
+import time
+from collections import deque
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger("bridge-mcp.parser")
+
+_SNIFF_BYTES = 4096
+
+# Python-repr literals that differ from JSON. Outside of string values these
+# are the only bare words a repr can contain, so plain replacement is safe
+# once it is confirmed none of them occur inside a string.
+_PY_LITERALS = (
+    ("True", "true"), ("False", "false"), ("None", "null"),
+    ("inf", "Infinity"), ("nan", "NaN"), ("(", "["), (")", "]"),
+)
+_PY_STRING = re.compile(r"'[^']*'")
+
+
+def sniff_format(text: str) -> str:
+    """Classify a payload as 'json', 'python' or 'scalar' from its first few KB."""
+    head = text[:1]
+    if head not in ("[", "{", "("):
+        return "scalar"
+    if head == "(":
+        return "python"
+    sample = text[:_SNIFF_BYTES]
+    single, double = sample.find("'"), sample.find('"')
+    if single != -1 and (double == -1 or single < double):
+        return "python"
+    if double == -1 and re.search(r"\b(True|False|None)\b", sample):
+        return "python"
+    return "json"
+
+
+def _python_to_json(text: str) -> str | None:
+    """Translate a Python repr to JSON text, or None if it cannot be done safely."""
+    # Strings that would need escaping (or contain quotes) go to literal_eval.
+    if '"' in text or "\\" in text:
+        return None
+    present = [pair for pair in _PY_LITERALS if pair[0] in text]
+    if present:
+        outside = _PY_STRING.sub("''", text)
+        if any(text.count(word) != outside.count(word) for word, _ in present):
+            return None
+    text = text.replace("'", '"')
+    for word, literal in present:
+        text = text.replace(word, literal)
+    return text
+
+
+def _decode_python(text: str) -> Any:
+    translated = _python_to_json(text)
+    if translated is not None:
+        try:
+            return json.loads(translated)
+        except ValueError:
+            pass
+    return ast.literal_eval(text)
+
+
+def _flatten(record: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _column(values: list) -> np.ndarray:
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return np.asarray(values, dtype=np.int64)
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return np.asarray(values, dtype=np.float64)
+    if values and all(isinstance(v, (list, tuple)) for v in values):
+        try:
+            return np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def to_columns(records: Any) -> dict[str, np.ndarray]:
+    """
+    Convert a list of (possibly nested) dicts into NumPy columns keyed by
+    dotted field name, e.g. {"id": int64[n], "force.fx": float64[n]}.
+    Numeric list fields become 2-D arrays; anything else is an object column.
+    """
+    if isinstance(records, dict):
+        records = [records]
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError("Columnar decoding needs a list of dict records")
+    flat = [_flatten(r) for r in records]
+    keys: dict[str, None] = {}
+    for row in flat:
+        keys.update(dict.fromkeys(row))
+    return {key: _column([row.get(key) for row in flat]) for key in keys}
+
+
+def from_columns(columns: dict[str, np.ndarray]) -> list[dict]:
+    """Inverse of `to_columns`: rebuild the list of records, re-nesting dotted keys."""
+    keys = list(columns)
+    lists = [columns[k].tolist() for k in keys]
+    records = [dict(zip(keys, row)) for row in zip(*lists)]
+    if not any("." in k for k in keys):
+        return records
+    paths = [k.split(".") for k in keys]
+    nested = []
+    for record in records:
+        out: dict = {}
+        for path, value in zip(paths, record.values()):
+            node = out
+            for part in path[:-1]:
+                node = node.setdefault(part, {})
+            node[path[-1]] = value
+        nested.append(out)
+    return nested
+
+
+class ResultParser:
+    """
+    Format-sniffing parser that records per-call parse time and payload size.
+    解析器，记录每次调用的解析耗时与数据量
+    """
+
+    def __init__(self, history: int = 200):
+        self.recent: deque[dict[str, Any]] = deque(maxlen=history)
+        self.totals: dict[str, dict[str, float]] = {}
+
+    def parse(self, result: Any) -> Any:
+        """Parse a qtmodel result; non-string results are returned unchanged."""
+        if not isinstance(result, str):
+            return result
+        cleaned = result.strip()
+        if not cleaned:
+            return cleaned
+
+        start = time.perf_counter()
+        fmt = sniff_format(cleaned)
+        parsed = result
+        try:
+            if fmt == "json":
+                try:
+                    parsed = json.loads(cleaned)
+                except ValueError:
+                    fmt = "python"
+                    parsed = _decode_python(cleaned)
+            elif fmt == "python":
+                parsed = _decode_python(cleaned)
+            else:
+                try:
+                    parsed = json.loads(cleaned)
+                except ValueError:
+                    parsed = ast.literal_eval(cleaned)
+        except Exception:
+            fmt = "text"
+            parsed = result
+        self._record(fmt, len(cleaned), time.perf_counter() - start)
+        return parsed
+
+    def parse_columns(self, result: Any) -> dict[str, np.ndarray]:
+        """Parse a tabular result straight into NumPy columns."""
+        return to_columns(self.parse(result))
+
+    def _record(self, fmt: str, size: int, seconds: float) -> None:
+        self.recent.append({"format": fmt, "bytes": size, "seconds": round(seconds, 6)})
+        total = self.totals.setdefault(fmt, {"calls": 0, "bytes": 0, "seconds": 0.0})
+        total["calls"] += 1
+        total["bytes"] += size
+        total["seconds"] += seconds
+        if size > 1_000_000:
+            logger.info(f"Parsed {size / 1e6:.1f} MB {fmt} payload in {seconds * 1000:.0f} ms")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "totals": {
+                fmt: {**t, "seconds": round(t["seconds"], 6)} for fmt, t in self.totals.items()
+            },
+            "recent": list(self.recent)[-20:],
+        }
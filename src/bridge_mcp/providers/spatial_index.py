@@ -0,0 +1,307 @@
+"""
+Spatial index over model nodes for local geometric lookups.
+节点空间索引：本地几何查询
+
+Nodes are bucketed into a uniform grid (cells sorted by key, located with
+searchsorted), which answers nearest-node, within-radius and in-box queries
+without a backend round trip. Element-at-point uses the same grid plus a
+node → element adjacency to find candidate elements, then measures the exact
+distance to each line segment or plate.
+
+The provider applies node writes (add/move/update/remove) directly to the
+index; anything it cannot follow marks the index stale and it is rebuilt
+from the node table on the next query.
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+
+# Target number of nodes per occupied grid cell.
+_NODES_PER_CELL = 4
+
+
+class SpatialIndex:
+    """Uniform-grid index of node coordinates, with optional element geometry."""
+
+    def __init__(self):
+        self.ids = np.empty(0, dtype=np.int64)
+        self.xyz = np.empty((0, 3))
+        self._row: dict[int, int] = {}
+        self.nodes_loaded = False
+        self._grid_dirty = True
+        # Element geometry: node ID lists, CSR adjacency node row → element rows.
+        self._elements: list[dict] | None = None
+        self._adj_ptr = np.zeros(1, dtype=np.int64)
+        self._adj_idx = np.empty(0, dtype=np.int64)
+        self._max_span = 0.0
+        self.builds = 0
+        self.build_seconds = 0.0
+        self.queries = 0
+
+    # ── Loading and synchronisation ──────────────────────────────────────
+
+    def load_nodes(self, nodes: list[dict]) -> None:
+        self.ids = np.fromiter((n["id"] for n in nodes), dtype=np.int64, count=len(nodes))
+        self.xyz = np.array([(n["x"], n["y"], n["z"]) for n in nodes], dtype=np.float64).reshape(-1, 3)
+        self._row = {int(i): r for r, i in enumerate(self.ids.tolist())}
+        self.nodes_loaded = True
+        self._grid_dirty = True
+        self._elements = None
+
+    def load_elements(self, elements: list[dict]) -> None:
+        self._elements = elements
+        self._build_adjacency()
+
+    def invalidate_nodes(self) -> None:
+        self.nodes_loaded = False
+        self._elements = None
+
+    def invalidate_elements(self) -> None:
+        self._elements = None
+
+    @property
+    def elements_loaded(self) -> bool:
+        return self._elements is not None
+
+    def upsert(self, ids: list[int], xyz: list[list[float]]) -> None:
+        if not self.nodes_loaded:
+            return
+        new_ids, new_xyz = [], []
+        for node_id, point in zip(ids, xyz):
+            row = self._row.get(node_id)
+            if row is None:
+                new_ids.append(node_id)
+                new_xyz.append(point)
+            else:
+                self.xyz[row] = point
+        if new_ids:
+            start = len(self.ids)
+            self.ids = np.concatenate([self.ids, np.asarray(new_ids, dtype=np.int64)])
+            self.xyz = np.vstack([self.xyz, np.asarray(new_xyz, dtype=np.float64)])
+            self._row.update((i, start + k) for k, i in enumerate(new_ids))
+            self._elements = None
+        self._grid_dirty = True
+
+    def update(self, node_id: int, **coords: float) -> None:
+        row = self._row.get(node_id) if self.nodes_loaded else None
+        if row is None:
+            return
+        for axis, key in enumerate("xyz"):
+            if key in coords:
+                self.xyz[row, axis] = coords[key]
+        self._grid_dirty = True
+
+    def move(self, ids: list[int] | None, dx: float, dy: float, dz: float) -> None:
+        if not self.nodes_loaded:
+            return
+        offset = np.array([dx, dy, dz])
+        if ids is None:
+            self.xyz += offset
+        else:
+            rows = [self._row[i] for i in ids if i in self._row]
+            self.xyz[rows] += offset
+        self._grid_dirty = True
+
+    def remove(self, ids: list[int] | None) -> None:
+        if not self.nodes_loaded:
+            return
+        if ids is None:
+            self.load_nodes([])
+            return
+        keep = ~np.isin(self.ids, np.asarray(ids, dtype=np.int64))
+        self.ids, self.xyz = self.ids[keep], self.xyz[keep]
+        self._row = {int(i): r for r, i in enumerate(self.ids.tolist())}
+        self._grid_dirty = True
+        self._elements = None
+
+    # ── Grid ─────────────────────────────────────────────────────────────
+
+    def _ensure_grid(self) -> None:
+        if not self._grid_dirty:
+            return
+        start = time.perf_counter()
+        n = len(self.ids)
+        if n:
+            self._lo = self.xyz.min(axis=0)
+            extent = self.xyz.max(axis=0) - self._lo
+            span = float(extent.max())
+            dims = max(int((extent > span * 1e-6).sum()), 1) if span > 0 else 1
+            cell = span / max((n / _NODES_PER_CELL) ** (1 / dims), 1.0) if span > 0 else 1.0
+        else:
+            self._lo, extent, cell = np.zeros(3), np.zeros(3), 1.0
+        self._cell = cell
+        self._shape = (np.floor(extent / cell).astype(np.int64) + 1)
+        keys = self._keys(self._cells(self.xyz))
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+        self._grid_dirty = False
+        self.builds += 1
+        self.build_seconds += time.perf_counter() - start
+
+    def _cells(self, xyz: np.ndarray) -> np.ndarray:
+        return np.floor((xyz - self._lo) / self._cell).astype(np.int64)
+
+    def _keys(self, cells: np.ndarray) -> np.ndarray:
+        ny, nz = self._shape[1], self._shape[2]
+        return (cells[..., 0] * ny + cells[..., 1]) * nz + cells[..., 2]
+
+    def _rows_in_cells(self, lo_cell: np.ndarray, hi_cell: np.ndarray) -> np.ndarray:
+        """Rows of all nodes in the cell block lo_cell..hi_cell (inclusive, clipped to the grid)."""
+        lo = np.maximum(lo_cell, 0)
+        hi = np.minimum(hi_cell, self._shape - 1)
+        if (hi < lo).any():
+            return np.empty(0, dtype=np.int64)
+        counts = hi - lo + 1
+        if int(np.prod(counts)) > len(self.ids):
+            # The block covers more cells than there are nodes: scan everything.
+            return np.arange(len(self.ids))
+        axes = [np.arange(a, b + 1) for a, b in zip(lo, hi)]
+        block = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+        keys = self._keys(block)
+        left = np.searchsorted(self._sorted_keys, keys, side="left")
+        right = np.searchsorted(self._sorted_keys, keys, side="right")
+        hits = right > left
+        if not hits.any():
+            return np.empty(0, dtype=np.int64)
+        left, right = left[hits], right[hits]
+        lengths = right - left
+        positions = np.repeat(left - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return self._order[positions]
+
+    # ── Node queries ─────────────────────────────────────────────────────
+
+    def _hits(self, rows: np.ndarray, distances: np.ndarray) -> list[dict[str, Any]]:
+        return [
+            {"id": int(self.ids[r]), "x": float(self.xyz[r, 0]), "y": float(self.xyz[r, 1]),
+             "z": float(self.xyz[r, 2]), "distance": float(d)}
+            for r, d in zip(rows.tolist(), distances.tolist())
+        ]
+
+    def within(self, point: list[float], radius: float) -> list[dict[str, Any]]:
+        """Nodes within `radius` of `point`, nearest first."""
+        self._ensure_grid()
+        self.queries += 1
+        p = np.asarray(point, dtype=np.float64)
+        rows = self._rows_in_cells(self._cells(p - radius), self._cells(p + radius))
+        d = np.linalg.norm(self.xyz[rows] - p, axis=1)
+        keep = d <= radius
+        rows, d = rows[keep], d[keep]
+        order = np.argsort(d, kind="stable")
+        return self._hits(rows[order], d[order])
+
+    def nearest(self, point: list[float], count: int = 1) -> list[dict[str, Any]]:
+        """The `count` nodes closest to `point`, nearest first."""
+        self._ensure_grid()
+        self.queries += 1
+        n = len(self.ids)
+        if not n or count < 1:
+            return []
+        count = min(count, n)
+        p = np.asarray(point, dtype=np.float64)
+        center = self._cells(p)
+        # Start from the ring that reaches the grid when the point lies outside it.
+        outside = np.maximum(np.maximum(-center, center - (self._shape - 1)), 0)
+        ring = int(outside.max())
+        while True:
+            rows = self._rows_in_cells(center - ring, center + ring)
+            if len(rows) >= count or len(rows) == n:
+                d = np.linalg.norm(self.xyz[rows] - p, axis=1)
+                part = np.argpartition(d, count - 1)[:count] if len(d) > count else np.arange(len(d))
+                # Every node closer than `ring` cells is inside the searched block.
+                if len(rows) == n or d[part].max() <= ring * self._cell:
+                    order = part[np.argsort(d[part], kind="stable")]
+                    return self._hits(rows[order], d[order])
+                ring = max(ring + 1, int(np.ceil(d[part].max() / self._cell)))
+            else:
+                ring = ring * 2 + 1
+
+    def in_box(self, lo: list[float], hi: list[float]) -> list[dict[str, Any]]:
+        """Nodes inside the axis-aligned box lo..hi (inclusive), in ID order."""
+        self._ensure_grid()
+        self.queries += 1
+        lo_p, hi_p = np.minimum(lo, hi).astype(np.float64), np.maximum(lo, hi).astype(np.float64)
+        rows = self._rows_in_cells(self._cells(lo_p), self._cells(hi_p))
+        pts = self.xyz[rows]
+        rows = rows[((pts >= lo_p) & (pts <= hi_p)).all(axis=1)]
+        rows = rows[np.argsort(self.ids[rows], kind="stable")]
+        return self._hits(rows, np.zeros(len(rows)))
+
+    # ── Element queries ──────────────────────────────────────────────────
+
+    def _build_adjacency(self) -> None:
+        rows, owners, span = [], [], 0.0
+        for k, element in enumerate(self._elements or []):
+            node_rows = [self._row[i] for i in element["node_ids"] if i in self._row]
+            rows.extend(node_rows)
+            owners.extend([k] * len(node_rows))
+            if len(node_rows) >= 2:
+                pts = self.xyz[node_rows]
+                span = max(span, float(np.linalg.norm(pts.max(axis=0) - pts.min(axis=0))))
+        rows_arr = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(rows_arr, kind="stable")
+        self._adj_idx = np.asarray(owners, dtype=np.int64)[order]
+        self._adj_ptr = np.concatenate([[0], np.cumsum(np.bincount(rows_arr, minlength=len(self.ids)))])
+        self._max_span = span
+
+    def elements_at(self, point: list[float], tolerance: float) -> list[dict[str, Any]]:
+        """Elements passing within `tolerance` of `point`, nearest first."""
+        if self._elements is None:
+            raise RuntimeError("Element geometry not loaded")
+        p = np.asarray(point, dtype=np.float64)
+        # Any element touching the point has a node within its span of it.
+        near = self.within(point, self._max_span + tolerance)
+        candidates: set[int] = set()
+        for hit in near:
+            row = self._row[hit["id"]]
+            candidates.update(self._adj_idx[self._adj_ptr[row]:self._adj_ptr[row + 1]].tolist())
+        hits = []
+        for k in sorted(candidates):
+            element = self._elements[k]
+            pts = self.xyz[[self._row[i] for i in element["node_ids"] if i in self._row]]
+            d = _distance_to_polygon(p, pts) if len(pts) >= 3 else _distance_to_segment(p, pts[0], pts[-1])
+            if d <= tolerance:
+                hits.append({"id": int(element["id"]), "type": element.get("type"),
+                             "node_ids": element["node_ids"], "distance": d})
+        hits.sort(key=lambda h: h["distance"])
+        return hits
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "nodes_loaded": self.nodes_loaded,
+            "nodes": int(len(self.ids)) if self.nodes_loaded else None,
+            "elements": len(self._elements) if self._elements is not None else None,
+            "cell_size": round(getattr(self, "_cell", 0.0), 6),
+            "builds": self.builds,
+            "build_ms": round(self.build_seconds * 1000, 3),
+            "queries": self.queries,
+        }
+
+
+def _distance_to_segment(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> float:
+    ab = b - a
+    denom = float(ab @ ab)
+    t = 0.0 if denom == 0 else min(max(float((p - a) @ ab) / denom, 0.0), 1.0)
+    return float(np.linalg.norm(p - (a + t * ab)))
+
+
+def _distance_to_triangle(p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> float:
+    normal = np.cross(b - a, c - a)
+    area2 = float(np.linalg.norm(normal))
+    if area2 == 0:
+        return min(_distance_to_segment(p, a, b), _distance_to_segment(p, b, c))
+    normal /= area2
+    q = p - float((p - a) @ normal) * normal
+    # q lies inside the triangle when it is on the inner side of all three edges.
+    if all(float(np.cross(v1 - v0, q - v0) @ normal) >= -1e-12 for v0, v1 in ((a, b), (b, c), (c, a))):
+        return float(np.linalg.norm(p - q))
+    return min(_distance_to_segment(p, a, b), _distance_to_segment(p, b, c), _distance_to_segment(p, c, a))
+
+
+def _distance_to_polygon(p: np.ndarray, pts: np.ndarray) -> float:
+    """Distance to a plate given as a triangle or quadrilateral (split into two triangles)."""
+    d = _distance_to_triangle(p, pts[0], pts[1], pts[2])
+    if len(pts) >= 4:
+        d = min(d, _distance_to_triangle(p, pts[0], pts[2], pts[3]))
+    return d
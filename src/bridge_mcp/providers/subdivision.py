@@ -0,0 +1,113 @@
+"""
+Frame element subdivision.
+杆系单元细分
+
+Splits two-node frame elements into equal or graded segments. Intermediate
+nodes and the segment element rows are generated for all selected elements
+at once with numpy, so the provider can upload them in one add_nodes and
+one add_elements call however many elements are refined.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from bridge_mcp.providers.id_set import id_array
+
+# Element types that can be split: beam and truss. Cables carry a tension
+# definition for their full length and plates are not line elements.
+SUBDIVIDABLE_TYPES = (1, 2)
+
+# Model data keyed to element IDs that a split would silently drop, as
+# (label, odb method). Elements referenced here are not split.
+ELEMENT_DATA_QUERIES = (
+    ("beam element loads", "get_beam_element_load_data"),
+    ("beam end constraints", "get_beam_constraint_data"),
+    ("effective widths", "get_effective_width_data"),
+    ("pre-stress loads", "get_pre_stress_load_data"),
+    ("initial tension loads", "get_initial_tension_load_data"),
+    ("deviation loads", "get_deviation_load_data"),
+)
+_ELEMENT_KEYS = ("element_id", "element_ids", "ele_id", "ele_ids", "beam_id", "beam_ids")
+
+
+def referenced_elements(records: Any) -> set[int]:
+    """Element IDs named by the records of one element-keyed table."""
+    found: set[int] = set()
+    for record in records if isinstance(records, list) else []:
+        if not isinstance(record, dict):
+            continue
+        for key in _ELEMENT_KEYS:
+            value = record.get(key)
+            if value is None or value == "":
+                continue
+            try:
+                found.update(id_array(value).tolist())
+            except (TypeError, ValueError):
+                continue
+    return found
+
+
+def segment_fractions(segments: int, ratio: float = 1.0) -> np.ndarray:
+    """
+    Positions of the segments-1 interior points along an element, 0..1.
+    `ratio` is last/first segment length; lengths grow geometrically in between.
+    """
+    if segments < 2:
+        raise ValueError("segments must be at least 2 (分段数至少为 2)")
+    if ratio <= 0:
+        raise ValueError("ratio must be positive (长度比必须为正)")
+    lengths = ratio ** (np.arange(segments) / (segments - 1))
+    return np.cumsum(lengths)[:-1] / lengths.sum()
+
+
+def subdivide_frames(
+    elements: list[dict],
+    node_ids: np.ndarray,
+    xyz: np.ndarray,
+    segments: int,
+    ratio: float,
+    next_node_id: int,
+    next_element_id: int,
+) -> dict[str, Any]:
+    """
+    Node and element rows splitting each element (normalized records) into
+    `segments` pieces. The first piece keeps the parent's ID; the others and
+    the new nodes are numbered from next_element_id / next_node_id, element
+    by element. Returns "parents" (m,), "nodes" (m, segments-1) and
+    "elements" (m, segments) ID arrays plus the "node_data" and "ele_data" rows.
+    """
+    fractions = segment_fractions(segments, ratio)
+    m = len(elements)
+    order = np.argsort(node_ids, kind="stable")
+    sorted_ids = node_ids[order]
+    ends = np.array([e["node_ids"][:2] for e in elements], dtype=np.int64).reshape(m, 2)
+    pos = np.searchsorted(sorted_ids, ends).clip(0, max(len(sorted_ids) - 1, 0))
+    found = sorted_ids[pos] == ends if len(sorted_ids) else np.zeros(ends.shape, dtype=bool)
+    if not found.all():
+        missing = sorted(set(ends[~found].tolist()))
+        raise ValueError(f"Elements reference missing nodes {missing[:10]} (单元引用的节点不存在)")
+    xi, xj = xyz[order[pos[:, 0]]], xyz[order[pos[:, 1]]]
+
+    # (m, segments-1, 3) interior points.
+    points = xi[:, None, :] + fractions[None, :, None] * (xj - xi)[:, None, :]
+    new_nodes = next_node_id + np.arange(m * (segments - 1)).reshape(m, segments - 1)
+    parents = np.array([e["id"] for e in elements], dtype=np.int64)
+    new_elements = np.empty((m, segments), dtype=np.int64)
+    new_elements[:, 0] = parents
+    new_elements[:, 1:] = next_element_id + np.arange(m * (segments - 1)).reshape(m, segments - 1)
+    chain = np.concatenate([ends[:, :1], new_nodes, ends[:, 1:]], axis=1)
+
+    node_data = np.concatenate([new_nodes.reshape(-1, 1), np.round(points.reshape(-1, 3), 6)], axis=1)
+    ele_data = [
+        [eid, e["type"], e["material_id"], e["section_id"], e["beta_angle"], ni, nj]
+        for e, eids, nodes in zip(elements, new_elements.tolist(), chain.tolist())
+        for eid, ni, nj in zip(eids, nodes[:-1], nodes[1:])
+    ]
+    return {
+        "parents": parents,
+        "nodes": new_nodes,
+        "elements": new_elements,
+        "node_data": [[int(row[0]), *row[1:]] for row in node_data.tolist()],
+        "ele_data": ele_data,
+    }
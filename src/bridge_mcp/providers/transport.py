@@ -0,0 +1,294 @@
+"""
+Keep-alive HTTP transport to the QiaoTong server.
+桥通服务端长连接传输层
+
+qtmodel sends every mdb/odb/cdb call through `QtServer.send_command`. The
+transport replaces that function with one backed by a session the provider
+owns: a single keep-alive connection (the server drives one GUI model, so
+commands are sent one at a time), configurable connect/read timeouts,
+retries on connection failure, and per-command traffic counters.
+
+`requests` is only imported when the session is first needed, so building a
+transport costs nothing at server start.
+"""
+
+import json
+import logging
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("bridge-mcp.transport")
+
+DEFAULT_URL = "http://localhost:55125/pythonForQt/"
+
+# Commands that only read the model, compute from it or change the view;
+# every other command is treated as a model write.
+READ_ONLY_PREFIXES = (
+    "GET-", "PLOT-", "DISPLAY-", "CALC-", "CALCULATE-", "CHECK-", "EXP-", "SAVE-",
+    "UPDATE-TO-", "UPDATE-VIEW-",
+)
+# odb view commands: camera, display units, hidden-line rendering, and which
+# stage or structure the window shows. None of them edits the model.
+VIEW_COMMANDS = {
+    "UPDATE", "SET-VIEW-CAMERA", "SET-VIEW-DIRECTION", "SET-RENDER", "SET-UNIT",
+    "RESET-DISPLAY", "CHANGE-CONSTRUCT-STAGE", "ACTIVATE-STRUCTURE",
+}
+
+
+# Analysis runs: the reply only comes back once the solver finishes.
+SOLVE_COMMANDS = ("DO-SOLVE", "SOLVE-")
+
+
+def is_write_command(header: str) -> bool:
+    return header not in VIEW_COMMANDS and not header.startswith(READ_ONLY_PREFIXES)
+
+
+class BackendBusyError(Exception):
+    """Raised for a backend call made in cache-only mode while the backend is busy."""
+
+
+def _keep_busy_error(send: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a QtServer sender that re-raises every failure as a plain Exception."""
+    if getattr(send, "keeps_busy_error", False):
+        return send
+
+    def wrapper(*args, **kwargs):
+        try:
+            return send(*args, **kwargs)
+        except BackendBusyError:
+            raise
+        except Exception as ex:
+            if isinstance(ex.__cause__, BackendBusyError):
+                raise ex.__cause__ from None
+            raise
+
+    wrapper.keeps_busy_error = True
+    return wrapper
+
+
+class QtTransport:
+    """
+    Keep-alive session for the QiaoTong HTTP endpoint.
+
+    Options (from BridgeMCPConfig.provider_config):
+        server_url (str): endpoint, default http://localhost:55125/pythonForQt/
+        connect_timeout (float): seconds to establish a connection, default 3
+        read_timeout (float): seconds to wait for a reply, default 600
+        solve_timeout (float): seconds to wait for an analysis run to finish,
+            default 21600 (6 h)
+        max_retries (int): retries when the connection is refused/reset, default 2
+    """
+
+    def __init__(self, config: dict | None = None):
+        config = config or {}
+        self.url = config.get("server_url", DEFAULT_URL)
+        self.connect_timeout = float(config.get("connect_timeout", 3))
+        self.read_timeout = float(config.get("read_timeout", 600))
+        self.solve_timeout = float(config.get("solve_timeout", 21600))
+        self.max_retries = int(config.get("max_retries", 2))
+        self._session = None
+        self._adapter = None
+        # The backend drives a single GUI model; commands are never interleaved.
+        self._lock = threading.Lock()
+        # Guards the provider's local state (mirror, spatial index, caches).
+        # The thread running a provider call holds it except while waiting for
+        # the server, so cache-only readers run between backend calls and never
+        # see a cache half updated.
+        self.state_lock = threading.Lock()
+        self._local = threading.local()
+        self.stats: dict[str, dict[str, float]] = {}
+        # Set when a command could not reach the server; cleared by the next reply.
+        self.connection_lost = False
+        # Called as observer(header, seconds, bytes_sent, bytes_received, error).
+        self.observer: Callable[..., None] | None = None
+        # Called as on_write(header, command) once a model-writing command reached the server.
+        self.on_write: Callable[[str, str], None] | None = None
+
+    @property
+    def session(self):
+        """The keep-alive requests.Session, created on first use."""
+        if self._session is None:
+            self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            # Only retry failures before the request reached the server;
+            # modeling commands are not idempotent.
+            max_retries=Retry(total=self.max_retries, connect=self.max_retries, read=0,
+                              status=0, other=0, allowed_methods=None, backoff_factor=0.2),
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self._adapter = adapter
+        return session
+
+    def ping(self, timeout: float = 0.5) -> bool:
+        """True when the server accepts a TCP connection (cheap reachability probe)."""
+        parts = urlsplit(self.url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        try:
+            with socket.create_connection((parts.hostname or "localhost", port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+    def install(self) -> None:
+        """Route qtmodel's QtServer through this transport."""
+        from qtmodel.core.qt_server import QtServer
+
+        QtServer.URL = self.url
+        QtServer._session = self.session
+        QtServer._lock = self._lock
+        QtServer.send_command = staticmethod(self._send_for_qtmodel)
+        QtServer.send_dict = staticmethod(_keep_busy_error(QtServer.send_dict))
+        QtServer.get_json_str = staticmethod(_keep_busy_error(QtServer.get_json_str))
+        logger.info(f"Backend transport: {self.url} (keep-alive, "
+                    f"timeouts {self.connect_timeout}s/{self.read_timeout}s, solve {self.solve_timeout}s)")
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the state lock for the current thread; released around each request."""
+        if getattr(self._local, "exclusive", False):
+            yield
+            return
+        with self.state_lock:
+            self._local.exclusive = True
+            try:
+                yield
+            finally:
+                self._local.exclusive = False
+
+    @contextmanager
+    def cache_only(self) -> Iterator[None]:
+        """Within this block, calls from the current thread fail fast instead of queueing."""
+        with self.exclusive():
+            self._local.cache_only = True
+            try:
+                yield
+            finally:
+                self._local.cache_only = False
+
+    @property
+    def cache_only_active(self) -> bool:
+        return getattr(self._local, "cache_only", False)
+
+    def send_command(self, command: str = "", header: str = "", read_timeout: float | None = None) -> str:
+        """
+        POST one command; same contract and error messages as QtServer.send_command.
+        Without an explicit read_timeout the configured one applies
+        (solve_timeout for analysis runs).
+        """
+        if self.cache_only_active:
+            raise BackendBusyError(
+                f"Backend is busy; {header} needs live data — retry when the running "
+                f"operation finishes (后端正忙，请稍后重试)"
+            )
+        import requests
+
+        body = command.encode("utf-8")
+        if read_timeout is None:
+            read_timeout = self.solve_timeout if header.startswith(SOLVE_COMMANDS) else self.read_timeout
+        start = time.perf_counter()
+        # Let cache-only readers in while this thread waits for the server.
+        holds_state = getattr(self._local, "exclusive", False)
+        if holds_state:
+            self.state_lock.release()
+        try:
+            with self._lock:
+                response = self.session.post(
+                    self.url,
+                    headers={"Content-Type": header},
+                    data=body,
+                    timeout=(self.connect_timeout, read_timeout),
+                )
+        except requests.exceptions.ReadTimeout as ex:
+            self._record(header, len(body), 0, time.perf_counter() - start, error=True)
+            raise Exception(f"请求超时：服务端处理超过 {read_timeout} 秒仍未返回") from ex
+        except requests.exceptions.ConnectionError as ex:
+            self.connection_lost = True
+            self._record(header, len(body), 0, time.perf_counter() - start, error=True)
+            raise Exception(f"请求失败: {ex}") from ex
+        except requests.exceptions.RequestException as ex:
+            self._record(header, len(body), 0, time.perf_counter() - start, error=True)
+            raise Exception(f"请求失败: {ex}") from ex
+        finally:
+            if holds_state:
+                self.state_lock.acquire()
+
+        self.connection_lost = False
+        self._record(header, len(body), len(response.content), time.perf_counter() - start,
+                     error=response.status_code != 200)
+        # Even a rejected write may have applied in part: report it regardless of status.
+        if self.on_write is not None and is_write_command(header):
+            self.on_write(header, command)
+        if response.status_code == 200:
+            return response.text
+        if response.status_code == 400:
+            raise Exception(response.text)
+        if response.status_code == 413:
+            raise Exception("请求体过大，请拆分请求或调整服务端请求限制")
+        if response.status_code == 504:
+            raise Exception("服务端处理超时，请增加最大等待时间")
+        raise Exception(f"连接错误，请重新尝试。HTTP {response.status_code}: {response.text}")
+
+    def _send_for_qtmodel(self, command: str = "", header: str = "", read_timeout: float | None = None) -> str:
+        # qtmodel passes a fixed read_timeout=600 on every call, do_solve
+        # included; the configured timeouts replace it.
+        return self.send_command(command, header=header)
+
+    def send_dict(self, header: str, payload: dict | None = None, read_timeout: float | None = None) -> Any:
+        """Send a command with an optional JSON payload and return the raw reply text."""
+        command = json.dumps(payload, ensure_ascii=False) if payload else ""
+        return self.send_command(command, header=header, read_timeout=read_timeout)
+
+    def _record(self, header: str, sent: int, received: int, seconds: float, error: bool = False) -> None:
+        entry = self.stats.setdefault(
+            header, {"calls": 0, "errors": 0, "bytes_sent": 0, "bytes_received": 0, "seconds": 0.0}
+        )
+        entry["calls"] += 1
+        entry["errors"] += int(error)
+        entry["bytes_sent"] += sent
+        entry["bytes_received"] += received
+        entry["seconds"] += seconds
+        if self.observer is not None:
+            self.observer(header, seconds, sent, received, error)
+
+    def connections_opened(self) -> int:
+        """Number of TCP connections opened so far (keep-alive reuse keeps this low)."""
+        if self._adapter is None:
+            return 0
+        return sum(
+            getattr(pool, "num_connections", 0)
+            for pool in self._adapter.poolmanager.pools._container.values()
+        )
+
+    def status(self) -> dict[str, Any]:
+        calls = sum(int(s["calls"]) for s in self.stats.values())
+        return {
+            "url": self.url,
+            "timeouts": {"connect": self.connect_timeout, "read": self.read_timeout, "solve": self.solve_timeout},
+            "calls": calls,
+            "connection_lost": self.connection_lost,
+            "connections_opened": self.connections_opened(),
+            "by_command": {
+                header: {**s, "seconds": round(s["seconds"], 4)} for header, s in self.stats.items()
+            },
+        }
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
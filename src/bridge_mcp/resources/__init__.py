@@ -10,6 +10,7 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from bridge_mcp.formatting import format_data
 from bridge_mcp.providers import BridgeProvider
 
 
@@ -24,7 +25,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             summary = provider.get_model_summary()
-            return json.dumps(summary, indent=2, ensure_ascii=False)
+            return format_data(summary)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -35,7 +36,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             materials = provider.get_material_data()
-            return json.dumps(materials, indent=2, ensure_ascii=False)
+            return format_data(materials)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -46,7 +47,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             sections = provider.get_section_names()
-            return json.dumps(sections, indent=2, ensure_ascii=False)
+            return format_data(sections)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -57,7 +58,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             cases = provider.get_load_case_names()
-            return json.dumps(cases, indent=2, ensure_ascii=False)
+            return format_data(cases)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -68,7 +69,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             stages = provider.get_stage_names()
-            return json.dumps(stages, indent=2, ensure_ascii=False)
+            return format_data(stages)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -79,7 +80,7 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             groups = provider.get_structure_group_names()
-            return json.dumps(groups, indent=2, ensure_ascii=False)
+            return format_data(groups)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
@@ -87,11 +88,12 @@ def register_resources(mcp: FastMCP, provider: BridgeProvider):
     def model_boundaries() -> str:
         """
         Boundary condition data in the current model (当前模型边界条件信息).
-        Includes general supports, elastic links, elastic supports,
-        master-slave links, and beam constraints.
+        Includes general supports, elastic links, elastic and general elastic
+        supports, master-slave links, beam constraints, constraint equations
+        and boundary element links.
         """
         try:
             boundary_data = provider.get_boundary_data()
-            return json.dumps(boundary_data, indent=2, ensure_ascii=False)
+            return format_data(boundary_data)
         except Exception as e:
             return json.dumps({"error": str(e)})
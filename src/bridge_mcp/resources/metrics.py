@@ -0,0 +1,23 @@
+"""
+MCP Resource exposing server runtime metrics.
+服务器运行指标资源
+"""
+
+import json
+
+from mcp.server.fastmcp import FastMCP
+
+from bridge_mcp.metrics import Metrics
+
+
+def register_metrics_resource(mcp: FastMCP, metrics: Metrics):
+    """Register the bridge://server/metrics resource."""
+
+    # Async so it is answered on the event loop, never queued behind the backend.
+    @mcp.resource("bridge://server/metrics")
+    async def server_metrics() -> str:
+        """
+        Per-tool and per-backend-command latency histograms, error counts,
+        payload bytes and model refresh counts (服务器运行指标).
+        """
+        return json.dumps(metrics.snapshot(), indent=2, ensure_ascii=False, default=str)
@@ -9,6 +9,7 @@ structural analysis tools.
 
 import sys
 import logging
+import time
 
 # Ensure stdout/stderr use UTF-8 to prevent Mojibake in Node.js (MCP Inspector) under Windows
 if sys.platform == "win32":
@@ -17,8 +18,12 @@ if sys.platform == "win32":
     if hasattr(sys.stderr, "reconfigure"):
         sys.stderr.reconfigure(encoding="utf-8")
 
-from mcp.server.fastmcp import FastMCP
 
+from bridge_mcp import _import_started as _T0
+from bridge_mcp.config import BridgeMCPConfig
+from bridge_mcp.jobs import AnalysisJobs
+from bridge_mcp.formatting import set_output_format
+from bridge_mcp.metrics import Metrics
 from bridge_mcp.providers.qtmodel_provider import QtModelProvider
 
 # Phase 1 modules
@@ -41,20 +46,35 @@ from bridge_mcp.tools.queries import register_query_tools
 # Phase 4 — modify tools
 from bridge_mcp.tools.modifications import register_modification_tools
 
+# Phase 5 — performance tools
+from bridge_mcp.tools.alignment import register_alignment_tools
+from bridge_mcp.tools.analysis_jobs import register_analysis_job_tools
+from bridge_mcp.tools.batch import register_batch_tools
+from bridge_mcp.tools.edit_session import register_edit_session_tools
+from bridge_mcp.tools.envelope import register_envelope_tools
+from bridge_mcp.tools.spatial import register_spatial_tools
+from bridge_mcp.resources.metrics import register_metrics_resource
+from bridge_mcp.worker import BackendWorker, WorkerMCP
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("bridge-mcp")
 
+_startup_ms: dict[str, float] = {"imports": (time.perf_counter() - _T0) * 1000}
+
 # ── Initialize Provider first (needed to build dynamic instructions) ──
 
-provider = QtModelProvider()
+config = BridgeMCPConfig.from_env()
+set_output_format(config.output_format)
+provider = QtModelProvider(config.provider_config)
+metrics = Metrics(enabled=config.metrics_enabled)
+if metrics.enabled:
+    provider.set_call_observer(metrics.record_backend)
 
-if provider.is_available():
-    logger.info(f"✅ {provider.get_software_name()} provider loaded successfully")
-else:
-    logger.warning(
-        f"⚠️  {provider.get_software_name()} provider not available — {provider._unavailable_reason}"
-    )
+# The backend is not contacted here: the provider connects on the first tool
+# call and keeps retrying with backoff until QiaoTong is running.
+logger.info(f"{provider.get_software_name()} provider configured — connects on first use")
+_startup_ms["provider"] = (time.perf_counter() - _T0) * 1000 - sum(_startup_ms.values())
 
 # ── Build MCP instructions dynamically from the active provider ───────
 
@@ -64,23 +84,31 @@ _SERVER_INSTRUCTIONS = (
     "## Software-Specific Rules — Read Before Using Any Tool\n"
     + provider.get_llm_instructions()
     + "\n## Available Tool Groups\n"
-    "Core:     create_nodes_linear, create_nodes, create_elements, create_material, create_section (plus specific sections like create_rectangle_section, etc.)\n"
+    "Core:     create_nodes_linear, create_nodes_on_alignment (curved girders), create_nodes, create_elements, create_material, create_section (plus specific sections like create_rectangle_section, etc.)\n"
     "Loads:    create_load_group, create_load_case, apply_self_weight, apply_nodal_force, apply_beam_distributed_load, add_system_temperature, add_gradient_temperature, add_support_settlement\n"
     "Boundary: set_support, add_elastic_link, add_master_slave_link, add_elastic_support\n"
     "Groups:   create_structure_group, update_structure_group_name, remove_structure_group, create_boundary_group, add_to_structure_group, remove_from_structure_group, list_group_members\n"
-    "Stages:   add_construction_stage, merge_operation_stage, configure_analysis, run_analysis, get_analysis_results, plot_analysis_result\n"
+    "Stages:   add_construction_stage, merge_operation_stage, configure_analysis, run_analysis (skips unchanged models; force=True re-solves), get_analysis_history, get_analysis_results, get_stage_envelope, plot_analysis_result\n"
+    "Jobs:     submit_analysis, get_analysis_job_status, wait_for_analysis_job, cancel_analysis_job — long solves in the background\n"
     "Workflow: create_simple_beam_bridge, create_continuous_beam_bridge\n"
-    "Queries:  get_model_info, get_nodes, get_elements, get_materials, get_section_list, get_section_detail, get_boundaries, get_load_cases, get_construction_stages, get_structure_groups\n"
+    "Queries:  get_model_info, get_nodes, get_elements, get_materials, get_section_list, get_section_detail, get_boundaries, get_load_cases, get_construction_stages, get_structure_groups, resync_model_mirror, get_model_revision (verify=True detects GUI edits)\n"
     "Tendons:  create_tendon_property, create_tendon_2d, apply_prestress, get_tendon_info\n"
     "Traffic:  add_standard_vehicle, add_traffic_lane, create_live_load_case, get_live_load_results\n"
     "Checking: setup_concrete_check, add_check_load_combination, add_parametric_reinforcement, run_concrete_check\n"
-    "Modify:   update_node, update_node_id, renumber_nodes, move_nodes, merge_nodes, remove_nodes, update_element, update_element_id, renumber_elements, revert_local_orientation, remove_elements\n"
+    "Modify:   update_node, update_node_id, renumber_nodes, renumber_nodes_rcm (bandwidth), move_nodes, merge_nodes, remove_nodes, update_element, update_element_id, renumber_elements, subdivide_elements, revert_local_orientation, remove_elements\n"
+    "Spatial:  get_nearest_node, get_nodes_within_radius, get_nodes_in_box, get_elements_at_point, get_duplicates — local index, no backend round trip\n"
+    "Checks:   validate_model, get_connectivity_report — run_analysis pre-checks supports and connectivity locally\n"
     "View:     set_view_angle, save_model_screenshot\n"
+    "Session:  begin_edit_session, commit_edit_session, abort_edit_session, get_edit_session_status — wrap long modeling sequences to defer model refreshes\n"
+    "Batch:    batch_execute — run many tool calls in one request with a single refresh (prefer it for long modeling sequences)\n"
 )
 
 # ── Initialize MCP Server ─────────────────────────────────────────────
 
-mcp = FastMCP("bridge-mcp", instructions=_SERVER_INSTRUCTIONS)
+# Synchronous tools and resources are wrapped to run on the backend worker
+# thread as they are registered.
+worker = BackendWorker(provider, metrics=metrics)
+mcp = WorkerMCP("bridge-mcp", instructions=_SERVER_INSTRUCTIONS, worker=worker)
 
 # ── Register Phase 1 Tools, Resources, Prompts ────────────────────────
 
@@ -106,6 +134,43 @@ register_query_tools(mcp, provider)
 
 register_modification_tools(mcp, provider)
 
+# ── Register Phase 5 Performance Tools ────────────────────────────────
+
+register_edit_session_tools(mcp, provider)
+register_batch_tools(mcp, provider)
+register_alignment_tools(mcp, provider)
+register_envelope_tools(mcp, provider)
+register_spatial_tools(mcp, provider)
+register_metrics_resource(mcp, metrics)
+
+# Job tools are async and stay on the event loop; the jobs run on the worker.
+register_analysis_job_tools(mcp, AnalysisJobs(worker, provider))
+logger.info(f"{len(mcp.backend_tools)} tools run on the backend worker")
+
+metrics.add_source("provider", provider.get_performance_stats)
+metrics.add_source("worker", worker.status)
+metrics.start_dump(config.metrics_file, config.metrics_interval)
+
+# ── Startup time budget ───────────────────────────────────────────────
+
+_startup_ms["registration"] = (time.perf_counter() - _T0) * 1000 - sum(_startup_ms.values())
+_startup_ms["total"] = sum(_startup_ms.values())
+_startup = {
+    **{f"{k}_ms": round(v, 1) for k, v in _startup_ms.items()},
+    "budget_ms": config.startup_budget_ms,
+    "within_budget": _startup_ms["total"] <= config.startup_budget_ms,
+}
+metrics.add_source("startup", lambda: _startup)
+_startup_line = (
+    f"Startup {_startup_ms['total']:.0f} ms (imports {_startup_ms['imports']:.0f}, "
+    f"provider {_startup_ms['provider']:.0f}, registration {_startup_ms['registration']:.0f}; "
+    f"budget {config.startup_budget_ms:.0f} ms)"
+)
+if _startup["within_budget"]:
+    logger.info(_startup_line)
+else:
+    logger.warning(f"{_startup_line} — over budget (启动耗时超出预算)")
+
 logger.info(f"🌉 Bridge-MCP server initialized with {provider.get_software_name()} backend")
 
 
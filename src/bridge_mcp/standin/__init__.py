@@ -0,0 +1,14 @@
+"""
+QtServer stand-in — a local, GUI-free substitute for the QiaoTong server.
+桥通服务端替身（无需图形界面，用于基准测试与回归测试）
+
+Point the provider at it with provider_config {"server_url": server.url},
+or run it on the default port so qtmodel connects without configuration:
+
+    python -m bridge_mcp.standin --latency-ms 2
+"""
+
+from bridge_mcp.standin.model import CommandError, StandInModel
+from bridge_mcp.standin.server import StandInServer, main
+
+__all__ = ["CommandError", "StandInModel", "StandInServer", "main"]
@@ -0,0 +1,3 @@
+from bridge_mcp.standin.server import main
+
+main()
@@ -0,0 +1,413 @@
+"""
+In-memory model behind the QtServer stand-in.
+替身服务端的内存模型
+
+Each supported command header maps to a `cmd_<header>` method, e.g.
+ADD-NODES → cmd_add_nodes(payload). Records use the same shapes the
+QiaoTong server returns (`node_id`/`x`/`y`/`z` for nodes, `index`/`ele_type`/
+`node_ids`/`mat_id`/`sec_id` for elements), so qtmodel's own decoders work
+unchanged. Analysis results are synthetic but deterministic per ID.
+"""
+
+import math
+from typing import Any
+
+from bridge_mcp.providers.model_mirror import expand_ids
+
+
+class CommandError(Exception):
+    """A command the real server would reject (HTTP 400)."""
+
+
+class StandInModel:
+    """Nodes, elements, properties, groups, boundaries, loads and stages kept in dicts."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.nodes: dict[int, list[float]] = {}
+        self.elements: dict[int, dict[str, Any]] = {}
+        self.materials: dict[int, dict[str, Any]] = {}
+        self.sections: dict[int, dict[str, Any]] = {}
+        self.structure_groups: dict[str, dict[str, list[int]]] = {}
+        self.boundary_groups: list[str] = []
+        self.supports: list[dict[str, Any]] = []
+        self.load_groups: list[str] = []
+        self.load_cases: list[dict[str, Any]] = []
+        self.stages: list[dict[str, Any]] = []
+        self.solved = False
+
+    def handle(self, header: str, payload: dict | None) -> Any:
+        """Run one command; unknown headers are accepted and ignored."""
+        handler = getattr(self, "cmd_" + header.lower().replace("-", "_"), None)
+        if handler is None:
+            return ""
+        return handler(payload or {})
+
+    def _changed(self) -> None:
+        self.solved = False
+
+    @staticmethod
+    def _next_id(existing: dict, start: int = 1) -> int:
+        return max(existing, default=start - 1) + 1
+
+    # ── Project ────────────────────────────────────────────────────────
+
+    def cmd_initial(self, payload: dict) -> str:
+        self.reset()
+        return ""
+
+    def cmd_do_solve(self, payload: dict) -> str:
+        self.solved = True
+        return ""
+
+    # ── Nodes ──────────────────────────────────────────────────────────
+
+    def cmd_add_nodes(self, payload: dict) -> str:
+        numbering = payload.get("numbering_type", 0)
+        next_id = payload.get("start_id", 1) if numbering == 2 else None
+        for row in payload.get("node_data", []):
+            if len(row) == 4:
+                self.nodes[int(row[0])] = [float(v) for v in row[1:4]]
+                continue
+            if next_id is None:
+                next_id = self._next_id(self.nodes) if numbering == 1 else 1
+            while next_id in self.nodes:
+                next_id += 1
+            self.nodes[next_id] = [float(v) for v in row[:3]]
+        self._changed()
+        return ""
+
+    def cmd_update_node(self, payload: dict) -> str:
+        node_id = int(payload["node_id"])
+        if node_id not in self.nodes:
+            raise CommandError(f"节点 {node_id} 不存在")
+        self.nodes[node_id] = [float(payload["x"]), float(payload["y"]), float(payload["z"])]
+        new_id = int(payload.get("new_id", -1))
+        if new_id > 0 and new_id != node_id:
+            self._renumber_nodes({node_id: new_id})
+        self._changed()
+        return ""
+
+    def cmd_update_node_id(self, payload: dict) -> str:
+        self._renumber_nodes({int(payload["node_id"]): int(payload["new_id"])})
+        self._changed()
+        return ""
+
+    def cmd_move_nodes(self, payload: dict) -> str:
+        dx, dy, dz = payload.get("offsets", [0, 0, 0])
+        ids = payload.get("ids") or list(self.nodes)
+        for i in ids:
+            if i in self.nodes:
+                x, y, z = self.nodes[i]
+                self.nodes[i] = [x + dx, y + dy, z + dz]
+        self._changed()
+        return ""
+
+    def cmd_remove_nodes(self, payload: dict) -> str:
+        ids = payload.get("ids")
+        if not ids:
+            self.nodes.clear()
+            self.elements.clear()
+        else:
+            removed = set(ids)
+            for i in removed:
+                self.nodes.pop(i, None)
+            self.elements = {
+                k: e for k, e in self.elements.items() if not removed.intersection(e["node_ids"])
+            }
+        self._changed()
+        return ""
+
+    def cmd_renumber_nodes(self, payload: dict) -> str:
+        old, new = payload.get("node_ids"), payload.get("new_ids")
+        if old and new:
+            mapping = dict(zip(old, new))
+        else:
+            mapping = {old_id: n for n, old_id in enumerate(sorted(self.nodes), start=1)}
+        self._renumber_nodes(mapping)
+        self._changed()
+        return ""
+
+    def _renumber_nodes(self, mapping: dict[int, int]) -> None:
+        moved = {mapping[i]: self.nodes.pop(i) for i in list(mapping) if i in self.nodes}
+        self.nodes.update(moved)
+        for e in self.elements.values():
+            e["node_ids"] = [mapping.get(n, n) for n in e["node_ids"]]
+        for support in self.supports:
+            support["node_id"] = mapping.get(support["node_id"], support["node_id"])
+
+    def cmd_get_node_data(self, payload: dict) -> list[dict]:
+        ids = payload.get("ids")
+        keys = ids if ids else self.nodes.keys()
+        return [
+            {"node_id": i, "x": self.nodes[i][0], "y": self.nodes[i][1], "z": self.nodes[i][2]}
+            for i in keys if i in self.nodes
+        ]
+
+    def cmd_get_node_id(self, payload: dict) -> int:
+        x, y, z = payload.get("x", 0), payload.get("y", 0), payload.get("z", 0)
+        tol = payload.get("tolerance", 1e-4)
+        for i, (nx, ny, nz) in self.nodes.items():
+            if abs(nx - x) <= tol and abs(ny - y) <= tol and abs(nz - z) <= tol:
+                return i
+        return -1
+
+    def cmd_get_overlap_nodes(self, payload: dict) -> list[list[int]]:
+        digits = payload.get("round_num", 4)
+        buckets: dict[tuple, list[int]] = {}
+        for i, xyz in self.nodes.items():
+            buckets.setdefault(tuple(round(v, digits) for v in xyz), []).append(i)
+        return [ids for ids in buckets.values() if len(ids) > 1]
+
+    # ── Elements ───────────────────────────────────────────────────────
+
+    def cmd_add_elements(self, payload: dict) -> str:
+        for row in payload.get("ele_data", []):
+            ele_type = int(row[1])
+            count = 4 if ele_type == 4 else 2
+            ele_id = int(row[0]) if int(row[0]) > 0 else self._next_id(self.elements)
+            self.elements[ele_id] = {
+                "ele_type": ele_type,
+                "mat_id": int(row[2]),
+                "sec_id": int(row[3]),
+                "beta_angle": float(row[4]),
+                "node_ids": [int(n) for n in row[5:5 + count]],
+            }
+        self._changed()
+        return ""
+
+    def _update_elements(self, payload: dict, **fields: Any) -> str:
+        for i in payload.get("ids") or list(self.elements):
+            if i in self.elements:
+                self.elements[i].update(fields)
+        self._changed()
+        return ""
+
+    def cmd_update_element_material(self, payload: dict) -> str:
+        return self._update_elements(payload, mat_id=int(payload["mat_id"]))
+
+    def cmd_update_frame_section(self, payload: dict) -> str:
+        return self._update_elements(payload, sec_id=int(payload["sec_id"]))
+
+    def cmd_update_plate_thick(self, payload: dict) -> str:
+        return self._update_elements(payload, sec_id=int(payload["thick_id"]))
+
+    def cmd_update_element_beta(self, payload: dict) -> str:
+        return self._update_elements(payload, beta_angle=float(payload["beta_angle"]))
+
+    def cmd_update_element_node(self, payload: dict) -> str:
+        ele_id = int(payload["element_id"])
+        if ele_id not in self.elements:
+            raise CommandError(f"单元 {ele_id} 不存在")
+        self.elements[ele_id]["node_ids"] = [int(n) for n in payload["node_ids"]]
+        self._changed()
+        return ""
+
+    def cmd_remove_elements(self, payload: dict) -> str:
+        ids = payload.get("ids")
+        if not ids:
+            self.elements.clear()
+        else:
+            for i in ids:
+                self.elements.pop(i, None)
+        if payload.get("remove_free"):
+            used = {n for e in self.elements.values() for n in e["node_ids"]}
+            self.nodes = {i: xyz for i, xyz in self.nodes.items() if i in used}
+        self._changed()
+        return ""
+
+    def cmd_renumber_elements(self, payload: dict) -> str:
+        old, new = payload.get("element_ids"), payload.get("new_ids")
+        if old and new:
+            mapping = dict(zip(old, new))
+        else:
+            mapping = {old_id: n for n, old_id in enumerate(sorted(self.elements), start=1)}
+        moved = {mapping[i]: self.elements.pop(i) for i in list(mapping) if i in self.elements}
+        self.elements.update(moved)
+        self._changed()
+        return ""
+
+    def cmd_get_element_data(self, payload: dict) -> list[dict]:
+        ids = payload.get("ids")
+        keys = ids if ids else self.elements.keys()
+        return [{"index": i, **self.elements[i]} for i in keys if i in self.elements]
+
+    def cmd_get_overlap_elements(self, payload: dict) -> list[list[int]]:
+        buckets: dict[tuple, list[int]] = {}
+        for i, e in self.elements.items():
+            buckets.setdefault(tuple(sorted(e["node_ids"])), []).append(i)
+        return [ids for ids in buckets.values() if len(ids) > 1]
+
+    # ── Properties ─────────────────────────────────────────────────────
+
+    def cmd_add_material(self, payload: dict) -> str:
+        index = int(payload.get("index", -1))
+        index = index if index > 0 else self._next_id(self.materials)
+        self.materials[index] = {
+            "index": index,
+            "name": payload.get("name", ""),
+            "mat_type": payload.get("mat_type", 1),
+            "database": payload.get("database", ""),
+        }
+        return ""
+
+    def cmd_get_material_data(self, payload: dict) -> list[dict]:
+        return list(self.materials.values())
+
+    def cmd_add_section(self, payload: dict) -> str:
+        index = int(payload.get("index", -1))
+        index = index if index > 0 else self._next_id(self.sections)
+        self.sections[index] = {
+            "index": index,
+            "name": payload.get("name", ""),
+            "sec_type": payload.get("sec_type", ""),
+            "sec_info": payload.get("sec_info"),
+        }
+        return ""
+
+    def cmd_get_section_names(self, payload: dict) -> dict[str, str]:
+        return {str(i): s["name"] for i, s in self.sections.items()}
+
+    def cmd_get_section_ids(self, payload: dict) -> list[int]:
+        return list(self.sections)
+
+    def cmd_get_all_section_data(self, payload: dict) -> list[dict]:
+        return list(self.sections.values())
+
+    def cmd_get_section_data(self, payload: dict) -> dict:
+        sec_id = int(payload.get("sec_id", 0))
+        if sec_id not in self.sections:
+            raise CommandError(f"截面 {sec_id} 不存在")
+        return self.sections[sec_id]
+
+    # ── Groups and boundaries ──────────────────────────────────────────
+
+    def cmd_add_structure_group(self, payload: dict) -> str:
+        self.structure_groups[payload.get("name", "")] = {
+            "node_ids": list(payload.get("node_ids") or []),
+            "element_ids": list(payload.get("element_ids") or []),
+        }
+        return ""
+
+    def cmd_add_structure_to_group(self, payload: dict) -> str:
+        group = self.structure_groups.setdefault(payload.get("name", ""), {"node_ids": [], "element_ids": []})
+        group["node_ids"].extend(payload.get("node_ids") or [])
+        group["element_ids"].extend(payload.get("element_ids") or [])
+        return ""
+
+    def cmd_update_structure_group_name(self, payload: dict) -> str:
+        if payload.get("name") in self.structure_groups:
+            self.structure_groups[payload["new_name"]] = self.structure_groups.pop(payload["name"])
+        return ""
+
+    def cmd_remove_structure_group(self, payload: dict) -> str:
+        name = payload.get("name", "")
+        if name:
+            self.structure_groups.pop(name, None)
+        else:
+            self.structure_groups.clear()
+        return ""
+
+    def cmd_get_structure_group_names(self, payload: dict) -> list[str]:
+        return list(self.structure_groups)
+
+    def cmd_get_structure_group(self, payload: dict) -> dict:
+        return self.structure_groups.get(payload.get("group_name", ""), {"node_ids": [], "element_ids": []})
+
+    def cmd_get_group_nodes(self, payload: dict) -> list[int]:
+        return self.cmd_get_structure_group(payload)["node_ids"]
+
+    def cmd_get_group_elements(self, payload: dict) -> list[int]:
+        return self.cmd_get_structure_group(payload)["element_ids"]
+
+    def cmd_add_boundary_group(self, payload: dict) -> str:
+        if payload.get("name") not in self.boundary_groups:
+            self.boundary_groups.append(payload.get("name", ""))
+        return ""
+
+    def cmd_get_boundary_group_names(self, payload: dict) -> list[str]:
+        return list(self.boundary_groups)
+
+    def cmd_add_general_support(self, payload: dict) -> str:
+        for node_id in payload.get("node_id") or []:
+            self.supports.append({
+                "node_id": node_id,
+                "boundary_info": payload.get("boundary_info"),
+                "group_name": payload.get("group_name", ""),
+            })
+        self._changed()
+        return ""
+
+    def cmd_get_general_support_data(self, payload: dict) -> list[dict]:
+        return list(self.supports)
+
+    # ── Loads and stages ───────────────────────────────────────────────
+
+    def cmd_add_load_group(self, payload: dict) -> str:
+        self.load_groups.append(payload.get("name", ""))
+        return ""
+
+    def cmd_add_load_case(self, payload: dict) -> str:
+        self.load_cases.append({"name": payload.get("name", ""), "case_type": payload.get("case_type", "")})
+        return ""
+
+    def cmd_get_load_case_names(self, payload: dict) -> list[str]:
+        return [c["name"] for c in self.load_cases]
+
+    def cmd_add_construction_stage(self, payload: dict) -> str:
+        self.stages.append({"name": payload.get("name", ""), "duration": payload.get("duration", 0)})
+        self._changed()
+        return ""
+
+    def cmd_get_stage_names(self, payload: dict) -> list[str]:
+        return [s["name"] for s in self.stages]
+
+    # ── Results (synthetic) ────────────────────────────────────────────
+
+    def _result_ids(self, payload: dict, table: dict) -> list[int]:
+        if not self.solved:
+            raise CommandError("模型未计算，请先执行分析")
+        ids = payload.get("ids")
+        return [i for i in (expand_ids(ids) if ids else table) if i in table]
+
+    @staticmethod
+    def _wave(i: int, stage: int, k: int) -> float:
+        return round(math.sin(0.37 * i + 0.11 * stage + k) * 1e-3 * (k + 1), 9)
+
+    def cmd_get_deformation(self, payload: dict) -> list[dict]:
+        stage = int(payload.get("stage_id", 1))
+        return [
+            {"node_id": i, "displacement": [self._wave(i, stage, k) for k in range(6)]}
+            for i in self._result_ids(payload, self.nodes)
+        ]
+
+    def cmd_get_reaction(self, payload: dict) -> list[dict]:
+        stage = int(payload.get("stage_id", 1))
+        return [
+            {"node_id": i, "force": [1e3 * self._wave(i, stage, k) for k in range(6)]}
+            for i in self._result_ids(payload, self.nodes)
+        ]
+
+    def cmd_get_element_force(self, payload: dict) -> list[dict]:
+        stage = int(payload.get("stage_id", 1))
+        return [
+            {
+                "element_id": i,
+                "force_i": [1e3 * self._wave(i, stage, k) for k in range(6)],
+                "force_j": [1e3 * self._wave(i + 1, stage, k) for k in range(6)],
+            }
+            for i in self._result_ids(payload, self.elements)
+        ]
+
+    def cmd_get_element_stress(self, payload: dict) -> list[dict]:
+        stage = int(payload.get("stage_id", 1))
+        return [
+            {
+                "element_id": i,
+                "stress_i": [1e4 * self._wave(i, stage, k) for k in range(4)],
+                "stress_j": [1e4 * self._wave(i + 1, stage, k) for k in range(4)],
+            }
+            for i in self._result_ids(payload, self.elements)
+        ]
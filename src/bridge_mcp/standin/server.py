@@ -0,0 +1,216 @@
+"""
+HTTP front end of the QtServer stand-in.
+桥通服务端替身 HTTP 服务
+
+Speaks the QtServer wire protocol: every command is a POST whose
+Content-Type is the command header (e.g. "ADD-NODES") and whose body is
+the JSON payload (or a bare string for OPEN-FILE). Replies are 200 with
+JSON text, or 400 with an error message.
+
+Latency and payload size can be injected to mimic a real workstation:
+    latency_ms        fixed delay added to every command
+    latency_ms_per_kb extra delay per KB of reply
+    solve_seconds     duration of DO-SOLVE
+    pad_bytes         whitespace appended to every reply
+    reply_format      "json" (default) or "python" — analysis results are
+                      sent as Python repr, as some QiaoTong endpoints do
+
+GET /stats returns per-command call counts and bytes.
+"""
+
+import argparse
+import json
+import logging
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from bridge_mcp.standin.model import CommandError, StandInModel
+
+logger = logging.getLogger("bridge-mcp.standin")
+
+# Commands whose replies qtmodel hands back undecoded (the rest are parsed
+# by qtmodel itself and must stay JSON).
+RESULT_COMMANDS = {"GET-DEFORMATION", "GET-REACTION", "GET-ELEMENT-FORCE", "GET-ELEMENT-STRESS"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StandInServer"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; without this, delayed
+        # ACKs add ~40 ms to every keep-alive round trip.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        header = self.headers.get("Content-Type", "")
+        status, reply = self.server.dispatch(header, body)
+        self._send(status, reply)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send(200, json.dumps(self.server.stats()).encode("utf-8"))
+        else:
+            self._send(404, b"not found")
+
+    def _send(self, status: int, reply: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    QtServer stand-in with an in-memory model.
+
+    Example:
+        server = StandInServer(port=55125, latency_ms=2).start()
+        ...                           # run the provider / MCP tools as usual
+        server.stop()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 55125,
+        latency_ms: float = 0.0,
+        latency_ms_per_kb: float = 0.0,
+        solve_seconds: float = 0.0,
+        pad_bytes: int = 0,
+        reply_format: str = "json",
+    ):
+        super().__init__((host, port), _Handler)
+        self.model = StandInModel()
+        self.latency_ms = latency_ms
+        self.latency_ms_per_kb = latency_ms_per_kb
+        self.solve_seconds = solve_seconds
+        self.pad_bytes = pad_bytes
+        self.reply_format = reply_format
+        # The real server drives one GUI model; commands never overlap.
+        self._model_lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+        self._thread: threading.Thread | None = None
+        self._connections: set[socket.socket] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/pythonForQt/"
+
+    def start(self) -> "StandInServer":
+        """Serve on a background thread and return self."""
+        self._thread = threading.Thread(target=self.serve_forever, name="qt-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and drop open keep-alive connections, as a closing GUI would."""
+        self.shutdown()
+        self.server_close()
+        for conn in list(self._connections):
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def get_request(self):
+        conn, addr = super().get_request()
+        self._connections.add(conn)
+        return conn, addr
+
+    def shutdown_request(self, request):
+        self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def dispatch(self, header: str, body: str) -> tuple[int, bytes]:
+        """Execute one command and return (HTTP status, reply bytes)."""
+        payload: Any = None
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                payload = {"value": body}
+        with self._model_lock:
+            try:
+                result = self.model.handle(header, payload if isinstance(payload, dict) else None)
+                status, reply = 200, self._encode(header, result)
+            except CommandError as e:
+                status, reply = 400, str(e).encode("utf-8")
+            except Exception as e:
+                status, reply = 500, f"{type(e).__name__}: {e}".encode("utf-8")
+            delay = self.latency_ms + self.latency_ms_per_kb * len(reply) / 1024
+            if header == "DO-SOLVE":
+                delay += self.solve_seconds * 1000
+            if delay:
+                time.sleep(delay / 1000)
+        self._record(header, len(body.encode("utf-8")), len(reply))
+        return status, reply
+
+    def _encode(self, header: str, result: Any) -> bytes:
+        if result is None or result == "":
+            text = ""
+        elif self.reply_format == "python" and header in RESULT_COMMANDS:
+            text = repr(result)
+        else:
+            text = json.dumps(result, ensure_ascii=False)
+        return (text + " " * self.pad_bytes).encode("utf-8")
+
+    def _record(self, header: str, received: int, sent: int) -> None:
+        entry = self._stats.setdefault(header, {"calls": 0, "bytes_in": 0, "bytes_out": 0})
+        entry["calls"] += 1
+        entry["bytes_in"] += received
+        entry["bytes_out"] += sent
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": sum(s["calls"] for s in self._stats.values()),
+            "by_command": {k: dict(v) for k, v in self._stats.items()},
+            "model": {"nodes": len(self.model.nodes), "elements": len(self.model.elements)},
+        }
+
+    def reset_stats(self) -> None:
+        self._stats.clear()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the stand-in in the foreground: python -m bridge_mcp.standin"""
+    parser = argparse.ArgumentParser(description="QiaoTong QtServer stand-in (桥通服务端替身)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=55125)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-ms-per-kb", type=float, default=0.0)
+    parser.add_argument("--solve-seconds", type=float, default=0.0)
+    parser.add_argument("--pad-bytes", type=int, default=0)
+    parser.add_argument("--reply-format", choices=("json", "python"), default="json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        latency_ms_per_kb=args.latency_ms_per_kb,
+        solve_seconds=args.solve_seconds,
+        pad_bytes=args.pad_bytes,
+        reply_format=args.reply_format,
+    )
+    logger.info(f"QtServer stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -6,11 +6,40 @@ Provides tools for creating and managing model entities:
 nodes, elements, materials, sections, structure groups, etc.
 """
 
+import time
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from bridge_mcp.formatting import format_data
 from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.providers.connectivity import connectivity_issues
+
+
+# Tools report failures as text rather than raising. Besides "Error …" results
+# this covers refusals that leave the model untouched: unconfirmed destructive
+# calls ("Aborted: …", "Initialization aborted …") and a failed analysis pre-check.
+ERROR_PREFIXES = ("Error", "❌", "Aborted", "Initialization aborted", "Analysis not started")
+
+
+def is_error_reply(text: Any) -> bool:
+    """True for a tool result that reports a failure or a refusal."""
+    return str(text).lstrip().startswith(ERROR_PREFIXES)
+
+
+def analysis_precheck(provider: BridgeProvider) -> list[str]:
+    """Connectivity/support errors that would make a solve fail; a failing check reports none."""
+    try:
+        errors, _ = connectivity_issues(provider.check_connectivity())
+    except Exception:
+        return []  # A failing pre-check must not block the solve.
+    return errors
+
+
+def duration_text(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    return f"{int(seconds // 60)} min {seconds % 60:.0f} s"
 
 
 def register_modeling_tools(mcp: FastMCP, provider: BridgeProvider):
@@ -2320,18 +2349,88 @@ def register_modeling_tools(mcp: FastMCP, provider: BridgeProvider):
             return f"Error configuring analysis (配置分析失败): {e}"
 
     @mcp.tool()
-    def run_analysis() -> str:
+    def run_analysis(skip_check: bool = False, force: bool = False) -> str:
         """
         Run the structural analysis calculation (执行结构分析计算).
 
         Use this tool after you have configured all loads, boundaries, and analysis settings.
         This will solve the model and make analysis results available.
+
+        A local connectivity pre-check runs first (well under a second); if it finds
+        missing supports, free rigid-body DOFs or undefined materials/sections the
+        solve is not started, since it would fail only after a long wait.
+
+        If neither the model nor the analysis settings changed since the last
+        successful solve, the solve is skipped and the existing results stay
+        valid. 模型与分析设置未变化时跳过重复计算。
+        GUI edits to nodes, elements, materials, sections, boundaries and loads
+        are detected; construction-stage and activation edits made in the GUI
+        are not — use force=True after changing stages there.
+        在界面中修改施工阶段或激活状态后需使用 force=True。
+        This call blocks until the solve ends; use submit_analysis for long
+        staged solves.
+
+        Args:
+            skip_check: Solve without the connectivity pre-check (跳过连通性预检查)
+            force: Solve even if nothing changed since the last solve (强制重新计算)
+        """
+        try:
+            if not skip_check:
+                errors = analysis_precheck(provider)
+                if errors:
+                    return (
+                        "Analysis not started — pre-check found problems (预检查未通过，未开始计算):\n"
+                        + "\n".join(f"  - {err}" for err in errors)
+                        + "\nFix them, or call run_analysis(skip_check=True) to solve anyway."
+                    )
+            result = provider.run_analysis(force=force)
+            if result["skipped"]:
+                last = result["last_solve"]
+                finished = time.strftime("%H:%M:%S", time.localtime(last["started_at"] + last["seconds"]))
+                return (
+                    f"Analysis skipped — model and analysis settings unchanged since the solve "
+                    f"finished at {finished} (took {duration_text(last['seconds'])}); its results are current. "
+                    f"Call run_analysis(force=True) to solve again (模型未变化，跳过重复计算)"
+                )
+            return (
+                f"Analysis successfully completed in {duration_text(result['seconds'])} "
+                f"(结构分析计算完成)"
+            )
+        except Exception as e:
+            return f"Error running analysis (结构分析失败): {e}"
+
+    @mcp.tool()
+    def get_analysis_history() -> str:
+        """
+        Show recent solves with their durations and why each one ran
+        (查看最近的计算记录、耗时及原因).
         """
         try:
-            provider.run_analysis()
-            return "Analysis successfully completed (结构分析计算完成)"
+            history = provider.get_analysis_history()
+            if not history["solves"]:
+                return "No analysis has been run in this session (本次会话尚未计算)."
+            rows = [
+                {
+                    "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(e["started_at"])),
+                    "duration": duration_text(e["seconds"]) if e["seconds"] is not None else "",
+                    "ok": e["ok"],
+                    "reason": "forced" if e["forced"] else "; ".join(e["reasons"]),
+                }
+                for e in history["solves"]
+            ]
+            seconds = [e["seconds"] for e in history["solves"] if e["ok"]]
+            lines = [f"{len(rows)} solves (计算记录)"]
+            if seconds:
+                lines[0] += f", mean {duration_text(sum(seconds) / len(seconds))}, last {duration_text(seconds[-1])}"
+            if history["last_solve"] is not None:
+                pending = history["model_writes_since"]
+                lines.append(
+                    f"Model writes since the last successful solve (上次计算后的修改): {pending}"
+                )
+            lines.append(format_data(rows, fmt="csv"))
+            return "\n".join(lines)
         except Exception as e:
-            return f"Error running analysis (结构分析失败): {e}"
+            return f"Error getting analysis history (获取计算记录失败): {e}"
 
     @mcp.tool()
     def validate_model() -> str:
@@ -2343,6 +2442,9 @@ def register_modeling_tools(mcp: FastMCP, provider: BridgeProvider):
         - Missing nodes/elements/materials (缺失的节点/单元/材料)
         - Overlapping nodes (重合节点)
         - Overlapping elements (重合单元)
+        - Disconnected parts and dangling nodes (不连通部分与孤立节点)
+        - Elements referencing undefined nodes/materials/sections (引用未定义对象的单元)
+        - Parts without supports or with free rigid-body DOFs (无支承或存在刚体位移的部分)
         """
         try:
             result = provider.validate_model()
@@ -2373,10 +2475,49 @@ def register_modeling_tools(mcp: FastMCP, provider: BridgeProvider):
                 for warn in result["warnings"]:
                     lines.append(f"  - {warn}")
 
+            for group in result.get("overlapping_nodes", []):
+                lines.append(f"    nodes {', '.join(map(str, group))}")
+            for group in result.get("overlapping_elements", []):
+                lines.append(f"    elements ({group['kind']}) {', '.join(map(str, group['ids']))}")
+
             return "\n".join(lines)
         except Exception as e:
             return f"Error validating model (模型验证失败): {e}"
 
+    @mcp.tool()
+    def get_connectivity_report() -> str:
+        """
+        Report connected parts, supports and free rigid-body DOFs, computed locally
+        (连通性与支承检查报告，本地计算).
+
+        Lists every disconnected part with its node/element count, number of
+        supports and the rigid-body DOFs its supports leave free, plus dangling
+        nodes and elements referencing undefined nodes, materials or sections.
+        """
+        try:
+            report = provider.check_connectivity()
+            errors, warnings = connectivity_issues(report)
+            lines = [
+                f"{report['node_count']} nodes, {report['element_count']} elements, "
+                f"{len(report['components'])} connected parts, checked in "
+                f"{report['seconds'] * 1000:.1f} ms (连通性检查)",
+                "Parts (连通部分): first_node | nodes | elements | supports | free DOFs",
+            ]
+            for c in report["components"]:
+                free = " ".join(c["free_dofs"]) or "-"
+                lines.append(f"  {c['first_node']} | {c['nodes']} | {c['elements']} | {c['supports']} | {free}")
+            if errors:
+                lines.append("Errors (错误):")
+                lines.extend(f"  - {err}" for err in errors)
+            if warnings:
+                lines.append("Warnings (警告):")
+                lines.extend(f"  - {warn}" for warn in warnings)
+            if not errors and not warnings:
+                lines.append("✅ Connected and fully restrained (连通且约束充分)")
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error checking connectivity (连通性检查失败): {e}"
+
     @mcp.tool()
     def get_model_info() -> str:
         """
@@ -2438,6 +2579,6 @@ def register_modeling_tools(mcp: FastMCP, provider: BridgeProvider):
                     f"Unknown result_type '{result_type}'. "
                     "Available: deformation, force, stress, reaction"
                 )
-            return str(result)
+            return format_data(result, result=True)
         except Exception as e:
             return f"Error getting results (获取结果失败): {e}"
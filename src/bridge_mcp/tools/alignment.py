@@ -0,0 +1,326 @@
+"""
+MCP Tools for generating girder nodes along a road alignment.
+路线线形节点生成工具：平曲线、竖曲线、超高
+
+The horizontal alignment is a chain of tangents, circular arcs and
+clothoids; the vertical profile is a set of PVIs with symmetric parabolic
+curves; superelevation tilts a girder offset from the centreline. Stations
+are laid out per interval (variable spacing, key points kept exactly), all
+coordinates are evaluated with NumPy, and the nodes go to the backend in a
+single add_nodes call.
+
+Conventions: stations in m along the centreline; azimuth in degrees
+counter-clockwise from +X; radius > 0 turns left, < 0 turns right; grades
+and crossfall in %, crossfall > 0 raises the left side; offset > 0 is left
+of the centreline; Z is elevation.
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+from mcp.server.fastmcp import FastMCP
+
+from bridge_mcp.providers import BridgeProvider
+
+_SEGMENT_TYPES = {
+    "line": "line", "tangent": "line", "straight": "line", "直线": "line",
+    "arc": "arc", "circle": "arc", "curve": "arc", "圆曲线": "arc",
+    "spiral": "spiral", "clothoid": "spiral", "transition": "spiral", "缓和曲线": "spiral",
+}
+# Gauss-Legendre rule for integrating clothoid headings (|Δθ| of a spiral is well under 2 rad).
+_GL_X, _GL_W = np.polynomial.legendre.leggauss(24)
+
+
+def _curvature(radius: Any) -> float:
+    return 0.0 if not radius else 1.0 / float(radius)
+
+
+class HorizontalAlignment:
+    """Chain of line/arc/spiral segments, evaluated at arrays of stations."""
+
+    def __init__(self, segments: list[dict], x0: float = 0.0, y0: float = 0.0, azimuth_deg: float = 0.0):
+        if not segments:
+            raise ValueError("At least one horizontal segment is required (至少需要一个平曲线段)")
+        self.kinds: list[str] = []
+        k0, k1, lengths = [], [], []
+        for i, seg in enumerate(segments):
+            kind = _SEGMENT_TYPES.get(str(seg.get("type", "line")).lower())
+            if kind is None:
+                raise ValueError(f"Segment {i + 1}: unknown type '{seg.get('type')}' (line/arc/spiral)")
+            length = float(seg.get("length", 0))
+            if length <= 0:
+                raise ValueError(f"Segment {i + 1}: length must be > 0 (段长必须大于0)")
+            if kind == "line":
+                start = end = 0.0
+            elif kind == "arc":
+                if not seg.get("radius"):
+                    raise ValueError(f"Segment {i + 1}: arc needs a non-zero radius (圆曲线需要半径)")
+                start = end = _curvature(seg["radius"])
+            else:
+                start, end = _curvature(seg.get("start_radius")), _curvature(seg.get("end_radius"))
+            self.kinds.append(kind)
+            k0.append(start)
+            k1.append(end)
+            lengths.append(length)
+        self.k0 = np.array(k0)
+        self.k1 = np.array(k1)
+        self.lengths = np.array(lengths)
+        self.starts = np.concatenate(([0.0], np.cumsum(self.lengths)[:-1]))
+        self.total = float(self.lengths.sum())
+
+        # Start state of every segment, chained from the end of the previous one.
+        n = len(segments)
+        self.x = np.empty(n)
+        self.y = np.empty(n)
+        self.theta = np.empty(n)
+        x, y, theta = float(x0), float(y0), math.radians(azimuth_deg)
+        for i in range(n):
+            self.x[i], self.y[i], self.theta[i] = x, y, theta
+            ex, ey, et = self._local(np.full(1, i), np.array([self.lengths[i]]))
+            x, y, theta = float(ex[0]), float(ey[0]), float(et[0])
+        self.end = (x, y, theta)
+
+    def _local(self, seg: np.ndarray, u: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Position and heading at distance u into segment seg (both arrays)."""
+        k0, k1, length = self.k0[seg], self.k1[seg], self.lengths[seg]
+        x0, y0, t0 = self.x[seg], self.y[seg], self.theta[seg]
+        dk = (k1 - k0) / length
+        theta = t0 + k0 * u + 0.5 * dk * u ** 2
+        x = np.empty_like(u)
+        y = np.empty_like(u)
+
+        straight = (k0 == 0) & (k1 == 0)
+        x[straight] = x0[straight] + u[straight] * np.cos(t0[straight])
+        y[straight] = y0[straight] + u[straight] * np.sin(t0[straight])
+
+        arc = ~straight & (dk == 0)
+        r = 1.0 / k0[arc]
+        x[arc] = x0[arc] + r * (np.sin(theta[arc]) - np.sin(t0[arc]))
+        y[arc] = y0[arc] - r * (np.cos(theta[arc]) - np.cos(t0[arc]))
+
+        spiral = ~straight & (dk != 0)
+        if spiral.any():
+            # ∫0^u (cos θ(t), sin θ(t)) dt by Gauss-Legendre, vectorised over stations.
+            us = u[spiral][:, None]
+            t = 0.5 * us * (_GL_X[None, :] + 1.0)
+            th = t0[spiral][:, None] + k0[spiral][:, None] * t + 0.5 * dk[spiral][:, None] * t ** 2
+            half = 0.5 * us[:, 0]
+            x[spiral] = x0[spiral] + half * (np.cos(th) @ _GL_W)
+            y[spiral] = y0[spiral] + half * (np.sin(th) @ _GL_W)
+        return x, y, theta
+
+    def evaluate(self, s: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(x, y, heading) at alignment distances s, 0 ≤ s ≤ total."""
+        seg = np.clip(np.searchsorted(self.starts, s, side="right") - 1, 0, len(self.lengths) - 1)
+        return self._local(seg, s - self.starts[seg])
+
+    def key_points(self) -> np.ndarray:
+        return np.append(self.starts, self.total)
+
+
+def profile_elevation(s: np.ndarray, pvis: list[list[float]] | None, start_z: float, grade: float,
+                      origin: float = 0.0) -> np.ndarray:
+    """
+    Elevation at stations s. Without PVIs: start_z + grade·(s − origin). With PVIs
+    [[station, elevation, curve_length], ...], grades run between PVIs
+    (extended past the ends) and each curve_length > 0 fits a symmetric
+    parabola centred on its PVI.
+    """
+    if not pvis:
+        return start_z + grade / 100.0 * (s - origin)
+    rows = sorted((float(p[0]), float(p[1]), float(p[2]) if len(p) > 2 else 0.0) for p in pvis)
+    st = np.array([r[0] for r in rows])
+    z = np.array([r[1] for r in rows])
+    if len(rows) == 1:
+        return z[0] + grade / 100.0 * (s - st[0])
+    grades = np.diff(z) / np.diff(st)
+    elevation = np.interp(s, st, z)
+    before, after = s < st[0], s > st[-1]
+    elevation[before] = z[0] + grades[0] * (s[before] - st[0])
+    elevation[after] = z[-1] + grades[-1] * (s[after] - st[-1])
+    # End PVIs carry no curve; interior curves must not overlap each other.
+    half = np.array([0.0] + [r[2] / 2 for r in rows[1:-1]] + [0.0])
+    for i in range(1, len(rows) - 1):
+        length = rows[i][2]
+        if length <= 0:
+            continue
+        if st[i] - half[i] < st[i - 1] + half[i - 1] - 1e-9 or st[i] + half[i] > st[i + 1] - half[i + 1] + 1e-9:
+            raise ValueError(f"Vertical curve at station {st[i]:g} overlaps its neighbours (竖曲线长度过大)")
+        x = s - (st[i] - length / 2)
+        inside = (x > 0) & (x < length)
+        change = grades[i] - grades[i - 1]
+        elevation[inside] += change * np.minimum(x[inside], length - x[inside]) ** 2 / (2 * length)
+    return elevation
+
+
+def station_grid(total: float, spacing: float, zones: list[list[float]] | None,
+                 key_points: np.ndarray) -> np.ndarray:
+    """
+    Stations 0..total: every key point is kept and each interval between
+    breakpoints is split evenly at no more than the spacing in force there
+    (a zone [from, to, spacing] overrides the default).
+    """
+    zones = [(float(a), float(b), float(h)) for a, b, h in (zones or [])]
+    if spacing <= 0 or any(h <= 0 for _, _, h in zones):
+        raise ValueError("Spacing must be > 0 (间距必须大于0)")
+    breaks = [0.0, total, *key_points.tolist()]
+    for a, b, _ in zones:
+        breaks += [a, b]
+    breaks = np.unique(np.clip(breaks, 0.0, total))
+    parts = []
+    for a, b in zip(breaks[:-1], breaks[1:]):
+        if b - a < 1e-9:
+            continue
+        mid = 0.5 * (a + b)
+        h = next((hz for za, zb, hz in reversed(zones) if za <= mid <= zb), spacing)
+        count = max(1, math.ceil((b - a) / h - 1e-9))
+        parts.append(a + (b - a) * np.arange(count) / count)
+    parts.append(np.array([total]))
+    return np.concatenate(parts)
+
+
+def alignment_points(
+    segments: list[dict],
+    spacing: float = 1.0,
+    spacing_zones: list[list[float]] | None = None,
+    stations: list[float] | None = None,
+    start_x: float = 0.0,
+    start_y: float = 0.0,
+    start_azimuth: float = 0.0,
+    start_station: float = 0.0,
+    start_z: float = 0.0,
+    grade: float = 0.0,
+    pvis: list[list[float]] | None = None,
+    offset: float = 0.0,
+    crossfall: list[list[float]] | None = None,
+) -> dict[str, Any]:
+    """
+    Girder node coordinates along an alignment.
+
+    Station-valued inputs (stations, spacing_zones, pvis, crossfall) are
+    chainages, i.e. start_station + distance along the alignment.
+    Returns {"station", "xyz", "heading", "alignment"}.
+    """
+    alignment = HorizontalAlignment(segments, start_x, start_y, start_azimuth)
+    if stations:
+        s = np.sort(np.asarray(stations, dtype=float)) - start_station
+        if s[0] < -1e-9 or s[-1] > alignment.total + 1e-9:
+            raise ValueError(
+                f"Stations must lie within {start_station:g}–{start_station + alignment.total:g} (桩号超出路线范围)"
+            )
+        s = np.clip(s, 0.0, alignment.total)
+    else:
+        zones = [[a - start_station, b - start_station, h] for a, b, h in (spacing_zones or [])]
+        s = station_grid(alignment.total, spacing, zones, alignment.key_points())
+    chainage = s + start_station
+
+    x, y, heading = alignment.evaluate(s)
+    z = profile_elevation(chainage, pvis, start_z, grade, origin=start_station)
+    if offset:
+        # Left normal of the heading; superelevation raises/lowers the offset girder.
+        x = x - offset * np.sin(heading)
+        y = y + offset * np.cos(heading)
+        if crossfall:
+            table = sorted((float(a), float(b)) for a, b in crossfall)
+            slope = np.interp(chainage, [t[0] for t in table], [t[1] for t in table])
+            z = z + offset * slope / 100.0
+    return {
+        "station": chainage,
+        "xyz": np.column_stack([x, y, z]),
+        "heading": heading,
+        "alignment": alignment,
+    }
+
+
+def _segment_summary(kinds: list[str]) -> str:
+    counts = {k: kinds.count(k) for k in ("line", "spiral", "arc") if k in kinds}
+    return ", ".join(f"{n} {k}" for k, n in counts.items())
+
+
+def register_alignment_tools(mcp: FastMCP, provider: BridgeProvider):
+    """Register alignment geometry MCP tools."""
+
+    @mcp.tool()
+    def create_nodes_on_alignment(
+        segments: list[dict],
+        spacing: float = 1.0,
+        spacing_zones: list[list[float]] | None = None,
+        stations: list[float] | None = None,
+        start_x: float = 0.0,
+        start_y: float = 0.0,
+        start_azimuth: float = 0.0,
+        start_station: float = 0.0,
+        start_z: float = 0.0,
+        grade: float = 0.0,
+        pvis: list[list[float]] | None = None,
+        offset: float = 0.0,
+        crossfall: list[list[float]] | None = None,
+        start_id: int = 1,
+    ) -> str:
+        """
+        Create girder nodes along a curved road alignment in one batch
+        (沿路线线形批量生成主梁节点：平曲线+竖曲线+超高).
+
+        Use this instead of create_nodes_linear for curved viaducts.
+
+        Args:
+            segments: Horizontal alignment, in order (平曲线段). Each item:
+                {"type": "line", "length": L} |
+                {"type": "arc", "length": L, "radius": R} |
+                {"type": "spiral", "length": L, "start_radius": R1, "end_radius": R2}
+                R > 0 turns left, R < 0 right; 0/omitted radius = straight (R=0表示直线)
+            spacing: Default node spacing, m (默认节点间距)
+            spacing_zones: Finer/coarser spacing between stations, [[from, to, spacing], ...] (分区间距)
+            stations: Explicit node stations; overrides spacing (指定节点桩号)
+            start_x, start_y: Plan coordinates of the alignment start (起点平面坐标)
+            start_azimuth: Start heading, degrees CCW from +X (起点方位角，度)
+            start_station: Chainage of the alignment start (起点桩号)
+            start_z: Start elevation when no PVIs are given (起点高程)
+            grade: Constant grade in % when no PVIs are given (纵坡，%)
+            pvis: Vertical profile [[station, elevation, curve_length], ...] (变坡点：桩号、高程、竖曲线长)
+            offset: Girder offset from the centreline, m, > 0 = left (主梁横向偏距，左正)
+            crossfall: Superelevation [[station, crossfall %], ...], > 0 raises the left side (超高横坡表)
+            start_id: ID of the first node (起始节点编号)
+
+        Example:
+            # 60 m tangent, 40 m clothoid into a 300 m left curve of 120 m, nodes every 2 m,
+            # 1 m spacing over the curve, 3 % grade, girder 3.5 m left with 4 % superelevation:
+            create_nodes_on_alignment(
+                segments=[{"type": "line", "length": 60},
+                          {"type": "spiral", "length": 40, "end_radius": 300},
+                          {"type": "arc", "length": 120, "radius": 300}],
+                spacing=2.0, spacing_zones=[[100, 220, 1.0]], grade=3.0,
+                offset=3.5, crossfall=[[60, 0], [100, 4]])
+        """
+        try:
+            points = alignment_points(
+                segments, spacing, spacing_zones, stations, start_x, start_y, start_azimuth,
+                start_station, start_z, grade, pvis, offset, crossfall,
+            )
+            xyz = points["xyz"]
+            count = len(xyz)
+            node_data = [
+                [start_id + i, x, y, z] for i, (x, y, z) in enumerate(np.round(xyz, 6).tolist())
+            ]
+            provider.add_nodes(node_data=node_data, intersected=False, is_merged=False)
+
+            alignment = points["alignment"]
+            ex, ey, et = alignment.end
+            station = points["station"]
+            lines = [
+                f"Created {count} nodes (IDs {start_id}–{start_id + count - 1}) along "
+                f"{alignment.total:.3f} m of alignment ({_segment_summary(alignment.kinds)}) "
+                f"(沿路线生成 {count} 个节点)",
+                f"  Stations {station[0]:.3f}–{station[-1]:.3f}",
+                f"  First node ({xyz[0, 0]:.3f}, {xyz[0, 1]:.3f}, {xyz[0, 2]:.3f}), "
+                f"last node ({xyz[-1, 0]:.3f}, {xyz[-1, 1]:.3f}, {xyz[-1, 2]:.3f})",
+                f"  Centreline end ({ex:.3f}, {ey:.3f}), azimuth {math.degrees(et) % 360:.4f}°; "
+                f"Z {xyz[:, 2].min():.3f}–{xyz[:, 2].max():.3f}",
+            ]
+            if count > 1:
+                step = np.diff(station)
+                lines[1] += f", spacing {step.min():.3f}–{step.max():.3f} m"
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error creating alignment nodes (沿路线生成节点失败): {e}"
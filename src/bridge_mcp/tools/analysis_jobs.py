@@ -0,0 +1,158 @@
+"""
+MCP Tools for background analysis jobs.
+后台分析任务工具
+
+submit_analysis queues a solve and returns a job ID at once instead of
+blocking the conversation for the length of the solve. The job runs on the
+backend worker, so further solves queue behind it. These tools are async and
+never touch the backend themselves, so status and cancel calls answer
+immediately even while a solve is running.
+"""
+
+import time
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from bridge_mcp.formatting import format_data
+from bridge_mcp.jobs import AnalysisJob, AnalysisJobs
+from bridge_mcp.tools import duration_text
+
+
+def _job_text(jobs: AnalysisJobs, job: AnalysisJob) -> str:
+    lines = [f"Analysis job {job.id}: {job.state} — {job.phase} (分析任务状态)"]
+    if job.state == "queued":
+        waited = duration_text(time.time() - job.submitted_at)
+        lines.append(f"  Queue position (排队位置): {jobs.queue_position(job)}, waiting {waited}")
+    elif job.started_at is not None:
+        lines.append(f"  Elapsed (已用时间): {duration_text(job.elapsed())}")
+        estimate = jobs.estimate_seconds()
+        if job.state == "running" and estimate:
+            lines.append(f"  Typical solve (通常耗时): {duration_text(estimate)}")
+    if job.message:
+        lines.append(f"  {job.message}")
+    lines.extend(f"  - {err}" for err in job.errors)
+    return "\n".join(lines)
+
+
+def register_analysis_job_tools(mcp: FastMCP, jobs: AnalysisJobs):
+    """Register background analysis job MCP tools."""
+
+    @mcp.tool()
+    async def submit_analysis(
+        skip_check: bool = False, force: bool = False, wait_seconds: float = 0.0, ctx: Context = None,
+    ) -> str:
+        """
+        Queue the structural analysis as a background job and return its job ID
+        (以后台任务方式提交结构分析，返回任务编号).
+
+        Prefer this over run_analysis for staged models, whose solve can take
+        tens of minutes. Poll with get_analysis_job_status or wait with
+        wait_for_analysis_job; a second submission waits until the first ends.
+        Same pre-check and unchanged-model skip as run_analysis; construction
+        stages edited in the GUI are not detected, so pass force=True then.
+        The solve may run up to the solve_timeout setting (6 h by default).
+
+        Args:
+            skip_check: Solve without the connectivity pre-check (跳过连通性预检查)
+            force: Solve even if nothing changed since the last solve (强制重新计算)
+            wait_seconds: Wait this long for the result before returning (等待结果的秒数)
+        """
+        try:
+            job = jobs.submit(skip_check=skip_check, force=force)
+            if wait_seconds > 0:
+                await jobs.wait(job, wait_seconds, _progress_reporter(jobs, ctx))
+            return _job_text(jobs, job)
+        except Exception as e:
+            return f"Error submitting analysis (提交分析任务失败): {e}"
+
+    @mcp.tool()
+    async def get_analysis_job_status(job_id: str = "") -> str:
+        """
+        Get the state, phase and elapsed time of an analysis job
+        (查询分析任务的状态、阶段和已用时间).
+
+        Args:
+            job_id: Job ID from submit_analysis; empty for the most recent job,
+                    "all" for a table of every job (任务编号；"all" 列出全部任务)
+        """
+        try:
+            if job_id == "all":
+                rows = [
+                    {
+                        "id": j.id, "state": j.state, "phase": j.phase,
+                        "elapsed": duration_text(j.elapsed()), "message": j.message,
+                    }
+                    for j in jobs.jobs()
+                ]
+                return format_data(rows, fmt="csv") if rows else "No analysis jobs (没有分析任务)."
+            return _job_text(jobs, jobs.get(job_id))
+        except Exception as e:
+            return f"Error getting analysis job status (查询分析任务失败): {e}"
+
+    @mcp.tool()
+    async def wait_for_analysis_job(job_id: str = "", timeout_seconds: float = 300.0, ctx: Context = None) -> str:
+        """
+        Wait for an analysis job to finish, sending progress notifications meanwhile
+        (等待分析任务完成，期间发送进度通知).
+
+        Returns the current status when the timeout expires first; the job keeps running.
+
+        Args:
+            job_id: Job ID; empty for the most recent job (任务编号)
+            timeout_seconds: Longest time to wait (最长等待秒数)
+        """
+        try:
+            job = jobs.get(job_id)
+            finished = await jobs.wait(job, timeout_seconds, _progress_reporter(jobs, ctx))
+            text = _job_text(jobs, job)
+            if not finished:
+                text += f"\nNot finished after waiting {duration_text(timeout_seconds)}; the job continues (任务尚未完成)"
+            return text
+        except Exception as e:
+            return f"Error waiting for analysis job (等待分析任务失败): {e}"
+
+    @mcp.tool()
+    async def cancel_analysis_job(job_id: str) -> str:
+        """
+        Cancel an analysis job (取消分析任务).
+
+        Queued jobs are removed from the queue; a running job stops after its
+        current phase. A solve already in progress cannot be interrupted.
+
+        Args:
+            job_id: Job ID to cancel (任务编号)
+        """
+        try:
+            job = jobs.cancel(job_id)
+            if job.state == "cancelled":
+                return f"Analysis job {job.id} cancelled (分析任务已取消)"
+            if job.done:
+                return f"Analysis job {job.id} already {job.state}; nothing to cancel (任务已结束)"
+            if job.phase == "solving":
+                return (
+                    f"Analysis job {job.id} is solving and cannot be interrupted; "
+                    f"it will finish normally (计算进行中，无法中断)"
+                )
+            return f"Cancellation requested for job {job.id}; it stops after the {job.phase} phase (已请求取消)"
+        except Exception as e:
+            return f"Error cancelling analysis job (取消分析任务失败): {e}"
+
+
+def _progress_reporter(jobs: AnalysisJobs, ctx: Context | None):
+    """Progress callback sending MCP progress notifications (elapsed vs. typical solve time)."""
+    if ctx is None:
+        return None
+    estimate = jobs.estimate_seconds()
+
+    async def report(job: AnalysisJob) -> None:
+        elapsed = job.elapsed()
+        try:
+            await ctx.report_progress(
+                progress=round(elapsed, 1),
+                total=round(max(estimate, elapsed), 1) if estimate else None,
+                message=f"{job.id} {job.state}: {job.phase}, {duration_text(elapsed)}",
+            )
+        except Exception:
+            pass  # Progress is best effort; the client may not have asked for it.
+
+    return report
@@ -0,0 +1,150 @@
+"""
+MCP Tool for running many modeling operations in one call.
+批量执行工具：一次调用执行多个建模操作
+
+batch_execute takes an ordered list of {"tool": name, "args": {...}}
+operations. Every operation is looked up and its arguments validated
+against the tool's own schema before anything runs, so a typo in step 40
+does not leave the model half built. The operations then run back to back
+on the backend thread inside one edit session — a single model refresh at
+the end instead of one per write — and the result is one compact status
+table instead of hundreds of tool round trips.
+"""
+
+import time
+from typing import Any
+
+from pydantic import ValidationError
+
+from bridge_mcp.formatting import format_data
+from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.tools import is_error_reply
+from bridge_mcp.worker import WorkerMCP
+
+# Tools that cannot run inside a batch: the batch owns the edit session.
+_EXCLUDED = {"batch_execute", "begin_edit_session", "commit_edit_session", "abort_edit_session"}
+_MESSAGE_WIDTH = 120
+
+
+def _summary(text: Any) -> str:
+    """First line of a tool result, shortened for the status table."""
+    line = str(text).strip().splitlines()[0] if str(text).strip() else ""
+    return line if len(line) <= _MESSAGE_WIDTH else line[:_MESSAGE_WIDTH - 1] + "…"
+
+
+def _prepare(mcp: WorkerMCP, operations: list[dict]) -> tuple[list[tuple], list[dict]]:
+    """
+    Resolve and validate every operation without running it.
+    Returns (calls, errors): calls are (tool name, function, kwargs).
+    """
+    calls, errors = [], []
+    for index, op in enumerate(operations, 1):
+        if not isinstance(op, dict) or not isinstance(op.get("tool"), str):
+            errors.append({"#": index, "tool": "", "error": 'Expected {"tool": name, "args": {...}}'})
+            continue
+        name = op["tool"]
+        args = op.get("args", op.get("arguments")) or {}
+        # The original synchronous tools: the batch already runs on the backend
+        # thread. Async tools (analysis jobs) are not in this registry.
+        tool = mcp.backend_tools.get(name)
+        if tool is None:
+            errors.append({
+                "#": index, "tool": name,
+                "error": "Unknown tool or not allowed inside a batch (未知工具或不可在批量操作中使用)",
+            })
+            continue
+        if name in _EXCLUDED:
+            errors.append({"#": index, "tool": name, "error": "Not allowed inside a batch (不可在批量操作中使用)"})
+            continue
+        if not isinstance(args, dict):
+            errors.append({"#": index, "tool": name, "error": "args must be an object (参数必须为对象)"})
+            continue
+        try:
+            metadata = tool.fn_metadata
+            parsed = metadata.arg_model.model_validate(metadata.pre_parse_json(args))
+        except ValidationError as e:
+            problems = "; ".join(
+                f"{'.'.join(map(str, err['loc'])) or 'args'}: {err['msg']}" for err in e.errors()
+            )
+            errors.append({"#": index, "tool": name, "error": problems})
+            continue
+        except Exception as e:
+            errors.append({"#": index, "tool": name, "error": _summary(e)})
+            continue
+        calls.append((name, tool.fn, parsed.model_dump_one_level()))
+    return calls, errors
+
+
+def register_batch_tools(mcp: WorkerMCP, provider: BridgeProvider):
+    """Register the batch execution MCP tool."""
+
+    @mcp.tool()
+    def batch_execute(operations: list[dict[str, Any]], on_error: str = "stop") -> str:
+        """
+        Run an ordered list of tool calls in one request with a single model refresh
+        (批量执行多个工具调用，只刷新一次模型).
+
+        Use this for long modeling sequences — materials, sections, nodes,
+        elements, supports, loads, stages. All operations are validated
+        first; if any is invalid, nothing runs.
+        所有操作先统一校验，任一无效则全部不执行。
+
+        Example operations:
+            [{"tool": "create_material", "args": {"name": "C50", "mat_type": 1, "database": "C50"}},
+             {"tool": "create_nodes_linear", "args": {"count": 11, "spacing_x": 3.0}},
+             {"tool": "set_support", "args": {"node_id": 1}}]
+
+        Args:
+            operations: Ordered list of {"tool": tool name, "args": {...}} (操作列表)
+            on_error: "stop" to skip the remaining operations after a failure,
+                      "continue" to run them anyway (出错时停止或继续)
+        """
+        try:
+            if on_error not in ("stop", "continue"):
+                return f"Error: on_error must be 'stop' or 'continue', got '{on_error}' (on_error 参数无效)"
+            if not operations:
+                return "No operations given (没有操作)."
+            calls, errors = _prepare(mcp, operations)
+            if errors:
+                return (
+                    f"Batch rejected — {len(errors)} of {len(operations)} operations are invalid, "
+                    f"nothing was run (批量操作校验失败，未执行任何操作):\n{format_data(errors, fmt='csv')}"
+                )
+
+            rows: list[dict[str, Any]] = []
+            failed = 0
+            start = time.perf_counter()
+            with provider.edit_session(name="batch_execute") as opened:
+                for index, (name, fn, kwargs) in enumerate(calls, 1):
+                    if failed and on_error == "stop":
+                        rows.append({"#": index, "tool": name, "status": "skipped", "ms": 0, "message": ""})
+                        continue
+                    t0 = time.perf_counter()
+                    try:
+                        result = fn(**kwargs)
+                        ok = not is_error_reply(result)
+                    except Exception as e:
+                        result, ok = f"Error: {e}", False
+                    failed += not ok
+                    rows.append({
+                        "#": index,
+                        "tool": name,
+                        "status": "ok" if ok else "error",
+                        "ms": round((time.perf_counter() - t0) * 1000, 1),
+                        "message": _summary(result),
+                    })
+                status = provider.get_edit_session_status()
+                deferred = status["suppressed_refreshes"] - opened["suppressed_refreshes"]
+            elapsed = time.perf_counter() - start
+
+            done = sum(r["status"] == "ok" for r in rows)
+            skipped = sum(r["status"] == "skipped" for r in rows)
+            header = (
+                f"Batch finished: {done} ok, {failed} failed, {skipped} skipped of {len(rows)} "
+                f"in {elapsed:.2f}s; {deferred} model refreshes merged into "
+                + ("the open edit session's commit" if opened["depth"] > 1 else f"{min(deferred, 1)}")
+                + " (批量执行完成)"
+            )
+            return f"{header}\n{format_data(rows, fmt='csv')}"
+        except Exception as e:
+            return f"Error running batch (批量执行失败): {e}"
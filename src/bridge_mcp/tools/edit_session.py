@@ -0,0 +1,120 @@
+"""
+MCP Tools for deferred-refresh edit sessions.
+编辑会话工具：批量修改期间暂停模型刷新
+
+Every write to the model normally triggers a full GUI refresh in the backend.
+Inside an edit session those refreshes are suppressed and a single refresh
+is issued when the session is committed. A session left idle past the
+provider's timeout, or closed with abort_edit_session, refreshes the same way.
+"""
+
+from mcp.server.fastmcp import FastMCP
+
+from bridge_mcp.providers import BridgeProvider
+
+
+def register_edit_session_tools(mcp: FastMCP, provider: BridgeProvider):
+    """Register edit session MCP tools."""
+
+    @mcp.tool()
+    def begin_edit_session(name: str = "", idle_timeout: float | None = None) -> str:
+        """
+        Start an edit session — model refreshes are deferred until commit
+        (开始编辑会话，期间暂停每次修改后的模型刷新).
+
+        Use this before a long sequence of modeling calls (nodes, elements,
+        sections, supports, loads, stages). Always finish with commit_edit_session.
+        在大量建模操作之前调用，结束后务必调用 commit_edit_session。
+
+        Args:
+            name: Optional session label for the statistics (会话名称，可选)
+            idle_timeout: Seconds without writes before the session closes itself;
+                omit for the server default, 0 to disable (无操作自动关闭的秒数，0 为不限)
+        """
+        try:
+            status = provider.begin_edit_session(name=name, idle_timeout=idle_timeout)
+            if status["depth"] > 1:
+                return (
+                    f"Nested edit session opened (depth {status['depth']}); the outer session "
+                    f"will refresh the model (嵌套编辑会话已开启)"
+                )
+            return (
+                "Edit session started — model refreshes are deferred until commit_edit_session "
+                "(编辑会话已开始，模型刷新将在提交时统一执行)"
+            )
+        except Exception as e:
+            return f"Error starting edit session (开始编辑会话失败): {e}"
+
+    @mcp.tool()
+    def commit_edit_session() -> str:
+        """
+        Commit the current edit session and refresh the model once
+        (提交编辑会话，统一刷新一次模型).
+
+        Returns how many per-call refreshes were saved.
+        返回本次会话节省的刷新次数。
+        """
+        try:
+            stats = provider.commit_edit_session()
+            if stats.get("active"):
+                return (
+                    f"Nested edit session closed; outer session still open "
+                    f"({stats['suppressed_refreshes']} refreshes deferred so far) "
+                    f"(内层编辑会话已关闭)"
+                )
+            return (
+                f"Edit session committed: {stats['suppressed_refreshes']} refreshes suppressed, "
+                f"{stats['refreshes_issued']} issued, {stats['duration_s']}s "
+                f"(编辑会话已提交，节省 {stats['suppressed_refreshes']} 次模型刷新)"
+            )
+        except Exception as e:
+            return f"Error committing edit session (提交编辑会话失败): {e}"
+
+    @mcp.tool()
+    def abort_edit_session() -> str:
+        """
+        Force-close the edit session, including nested levels, and refresh the model
+        (强制关闭编辑会话并刷新模型).
+
+        Use when a session was left open (e.g. after an interrupted run).
+        Writes already made are kept; nothing is rolled back.
+        已执行的修改会保留，不会回滚。
+        """
+        try:
+            stats = provider.abort_edit_session()
+            return (
+                f"Edit session aborted: {stats['suppressed_refreshes']} deferred refreshes, "
+                f"{stats['refreshes_issued']} issued, {stats['duration_s']}s "
+                f"(编辑会话已强制关闭)"
+            )
+        except Exception as e:
+            return f"Error aborting edit session (强制关闭编辑会话失败): {e}"
+
+    @mcp.tool()
+    def get_edit_session_status() -> str:
+        """
+        Show whether an edit session is open and how many refreshes it has deferred
+        (查看编辑会话状态).
+        """
+        try:
+            status = provider.get_edit_session_status()
+            if not status["active"]:
+                last = status.get("last_session")
+                if last:
+                    return (
+                        f"No edit session open. Last session ({last['closed']}): "
+                        f"{last['suppressed_refreshes']} refreshes suppressed in "
+                        f"{last['duration_s']}s (当前无编辑会话)"
+                    )
+                return "No edit session open (当前无编辑会话)"
+            text = (
+                f"Edit session '{status['name']}' open (depth {status['depth']}): "
+                f"{status['suppressed_refreshes']} refreshes deferred, {status['elapsed_s']}s elapsed, "
+                f"{status['idle_s']}s since the last write "
+                f"(编辑会话进行中)"
+            )
+            if status["idle_expired"]:
+                text += "\nIdle past its timeout; the next write or commit closes it (会话已超时，下次写入或提交时关闭)"
+            return text
+        except Exception as e:
+            return f"Error getting edit session status (获取编辑会话状态失败): {e}"
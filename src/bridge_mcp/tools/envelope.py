@@ -0,0 +1,202 @@
+"""
+MCP Tools for construction-stage envelopes.
+施工阶段包络工具：本地向量化计算
+
+Results for every requested stage (and operation-stage case) are fetched
+once as NumPy columns, stacked into a [stage × id × component] array, and
+reduced locally: max/min envelope, the governing stage of each, and the
+largest stage-to-stage increment. Repeated calls are served from the
+provider's result cache.
+"""
+
+from typing import Any
+
+import numpy as np
+from mcp.server.fastmcp import FastMCP
+
+from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.providers.model_mirror import expand_ids
+
+
+def _split_columns(columns: dict[str, np.ndarray]) -> tuple[np.ndarray, list[str], np.ndarray]:
+    """Split result columns into (ids, component names, values[n, c])."""
+    id_key = next(
+        (k for k, c in columns.items() if c.ndim == 1 and c.dtype.kind == "i" and k.endswith("id")),
+        None,
+    ) or next((k for k, c in columns.items() if c.ndim == 1 and c.dtype.kind == "i"), None)
+    if id_key is None:
+        raise ValueError("Result has no ID column (结果中没有编号列)")
+    names: list[str] = []
+    values: list[np.ndarray] = []
+    for key, column in columns.items():
+        if key == id_key or column.dtype.kind not in "if":
+            continue
+        if column.ndim == 1:
+            names.append(key)
+            values.append(column.astype(np.float64)[:, None])
+        elif column.ndim == 2:
+            names.extend(f"{key}[{k}]" for k in range(column.shape[1]))
+            values.append(column.astype(np.float64))
+    n = len(columns[id_key])
+    return columns[id_key], names, np.hstack(values) if values else np.empty((n, 0))
+
+
+def stack_results(tables: list[dict[str, np.ndarray]]) -> tuple[np.ndarray, list[str], np.ndarray]:
+    """
+    Stack per-stage result columns into a [stage × id × component] array.
+    IDs missing from a stage (e.g. inactive elements) are NaN.
+    """
+    split = [_split_columns(t) for t in tables]
+    names = split[0][1]
+    for _, other, _ in split[1:]:
+        names = [n for n in names if n in other]
+    ids = np.unique(np.concatenate([s[0] for s in split]))
+    cube = np.full((len(split), len(ids), len(names)), np.nan)
+    for k, (stage_ids, stage_names, values) in enumerate(split):
+        cols = [stage_names.index(n) for n in names]
+        cube[k, np.searchsorted(ids, stage_ids), :] = values[:, cols]
+    return ids, names, cube
+
+
+def compute_envelope(cube: np.ndarray, increment_stages: int = 0) -> dict[str, np.ndarray]:
+    """
+    Reduce a [stage × id × component] array along the stage axis.
+
+    Returns max/min [id × component] with the stage index of each
+    (argmax/argmin), and — over the first `increment_stages` stages — the
+    largest stage-to-stage change (signed) and the stage at which it occurs.
+    """
+    missing = np.isnan(cube)
+    argmax = np.where(missing, -np.inf, cube).argmax(axis=0)
+    argmin = np.where(missing, np.inf, cube).argmin(axis=0)
+    result = {
+        "max": np.take_along_axis(cube, argmax[None], axis=0)[0],
+        "argmax": argmax,
+        "min": np.take_along_axis(cube, argmin[None], axis=0)[0],
+        "argmin": argmin,
+    }
+    if increment_stages >= 2:
+        # A stage where the ID is absent contributes no increment.
+        delta = np.nan_to_num(np.diff(cube[:increment_stages], axis=0), nan=0.0)
+        at = np.abs(delta).argmax(axis=0)
+        result["increment"] = np.take_along_axis(delta, at[None], axis=0)[0]
+        result["increment_at"] = at + 1
+    return result
+
+
+def _fmt(value: float) -> str:
+    return "-" if np.isnan(value) else f"{value:.6g}"
+
+
+def register_envelope_tools(mcp: FastMCP, provider: BridgeProvider):
+    """Register stage envelope MCP tools."""
+
+    @mcp.tool()
+    def get_stage_envelope(
+        result_type: str,
+        ids: int | list[int] | str,
+        stages: str = "",
+        case_names: str = "",
+        components: str = "",
+        per_id: bool = True,
+    ) -> str:
+        """
+        Envelope results across construction stages, computed locally
+        (跨施工阶段的包络结果，本地计算).
+
+        Fetches each stage once, then reports for every ID and component the
+        max/min value with its governing stage, and the largest stage-to-stage
+        increment. Use this instead of calling get_analysis_results per stage.
+
+        Args:
+            result_type: 'deformation' (变形), 'force' (内力), 'stress' (应力), 'reaction' (反力)
+            ids: Node/Element IDs, e.g. [1,2,3] or "1to20" (节点/单元编号)
+            stages: Construction stage numbers, e.g. "1to5 8"; empty = all stages (施工阶段号，留空为全部)
+            case_names: Operation-stage load cases to include, comma separated (运营阶段工况名，逗号分隔)
+            components: Only report these components, comma separated,
+                e.g. "force_i[2],force_i[4]"; empty = all (仅输出指定分量)
+            per_id: Include the per-ID table; False returns only the component summary (是否输出逐编号表)
+        """
+        try:
+            if stages.strip():
+                stage_ids = expand_ids(stages)
+                stage_names = provider.get_stage_names() or []
+            else:
+                stage_names = provider.get_stage_names() or []
+                stage_ids = list(range(1, len(stage_names) + 1))
+            labels = [
+                stage_names[s - 1] if 0 < s <= len(stage_names) else f"stage {s}" for s in stage_ids
+            ]
+            cases = [c.strip() for c in case_names.replace("，", ",").split(",") if c.strip()]
+            if not stage_ids and not cases:
+                return "No construction stages or load cases to envelope (没有可包络的施工阶段或工况)."
+
+            tables: list[dict[str, Any]] = []
+            used: list[str] = []
+            skipped: list[str] = []
+            for stage_id, label in zip(stage_ids, labels):
+                try:
+                    tables.append(provider.get_result_columns(result_type, ids, stage_id))
+                    used.append(label)
+                except Exception as e:
+                    skipped.append(f"{label}: {e}")
+            n_stages = len(tables)
+            for case in cases:
+                try:
+                    tables.append(provider.get_result_columns(result_type, ids, -1, case_name=case))
+                    used.append(f"case:{case}")
+                except Exception as e:
+                    skipped.append(f"case:{case}: {e}")
+            if not tables:
+                return "No results retrieved (未获取到结果):\n" + "\n".join(f"  {s}" for s in skipped)
+
+            id_values, names, cube = stack_results(tables)
+            if components.strip():
+                wanted = [c.strip() for c in components.split(",") if c.strip()]
+                unknown = [c for c in wanted if c not in names]
+                if unknown:
+                    return (
+                        f"Unknown components {unknown}. Available (可用分量): {', '.join(names)}"
+                    )
+                cube = cube[:, :, [names.index(c) for c in wanted]]
+                names = wanted
+            env = compute_envelope(cube, increment_stages=n_stages)
+            has_inc = "increment" in env
+
+            lines = [
+                f"{result_type} envelope over {len(used)} stages/cases, {len(id_values)} IDs, "
+                f"{len(names)} components (包络结果)"
+            ]
+            lines.append("Summary (各分量极值): component | max @id/stage | min @id/stage")
+            for c, name in enumerate(names):
+                col_max, col_min = env["max"][:, c], env["min"][:, c]
+                if np.isnan(col_max).all():
+                    lines.append(f"  {name} | - | -")
+                    continue
+                i_max, i_min = np.nanargmax(col_max), np.nanargmin(col_min)
+                lines.append(
+                    f"  {name} | {_fmt(col_max[i_max])} @{id_values[i_max]}/{used[env['argmax'][i_max, c]]}"
+                    f" | {_fmt(col_min[i_min])} @{id_values[i_min]}/{used[env['argmin'][i_min, c]]}"
+                )
+            if per_id:
+                header = "id,component,max,max_stage,min,min_stage"
+                if has_inc:
+                    header += ",max_increment,increment_stage"
+                lines.append(f"Per ID (逐编号):\n{header}")
+                for i, id_value in enumerate(id_values):
+                    for c, name in enumerate(names):
+                        if np.isnan(env["max"][i, c]):
+                            continue
+                        row = (
+                            f"{id_value},{name},{_fmt(env['max'][i, c])},{used[env['argmax'][i, c]]},"
+                            f"{_fmt(env['min'][i, c])},{used[env['argmin'][i, c]]}"
+                        )
+                        if has_inc:
+                            row += f",{_fmt(env['increment'][i, c])},{used[env['increment_at'][i, c]]}"
+                        lines.append(row)
+            if skipped:
+                lines.append("Skipped (已跳过):")
+                lines.extend(f"  {s}" for s in skipped)
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error computing stage envelope (计算施工阶段包络失败): {e}"
@@ -13,6 +13,7 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.providers.id_set import compress_ids
 
 
 def register_group_tools(mcp: FastMCP, provider: BridgeProvider):
@@ -135,6 +136,8 @@ def register_group_tools(mcp: FastMCP, provider: BridgeProvider):
                 if name not in groups:
                     return f"Structure group '{name}' not found (未找到结构组 '{name}')"
                 members = provider.get_structure_group_elements(name=name)
+                if isinstance(members, list) and all(isinstance(i, int) for i in members):
+                    members = f"{len(members)} — {compress_ids(members) or 'none'}"
                 return f"Structure group '{name}' elements (结构组成员): {members}"
             elif group_type == "boundary":
                 groups = provider.get_boundary_data()
@@ -41,7 +41,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             
         try:
             provider.initialize_model()
-            provider.update_model()
             return "New model successfully initialized. The software is now ready for a new project. (新模型初始化成功，当前模型已清空)"
         except Exception as e:
             return f"Error initializing model (初始化模型失败): {e}"
@@ -70,7 +69,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.open_model_file(file_path=file_path)
-            provider.update_model()
             return f"Successfully opened model from '{file_path}' (成功打开模型)"
         except Exception as e:
             return f"Error opening model file (打开模型文件失败): {e}"
@@ -118,7 +116,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             if z is not None:
                 kwargs["z"] = z
             provider.update_node(**kwargs)
-            provider.update_model()
             parts = []
             if new_id != -1:
                 parts.append(f"ID→{new_id}")
@@ -143,7 +140,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_node_id(node_id=node_id, new_id=new_id)
-            provider.update_model()
             return f"Successfully updated node ID from {node_id} to {new_id} (成功修改节点编号)"
         except Exception as e:
             return f"Error updating node ID (修改节点编号失败): {e}"
@@ -160,11 +156,42 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.renumber_nodes(ids=ids, new_ids=new_ids)
-            provider.update_model()
             return "Successfully renumbered nodes (成功重新编号节点)"
         except Exception as e:
             return f"Error renumbering nodes (重新编号失败): {e}"
 
+    @mcp.tool()
+    def renumber_nodes_rcm(dry_run: bool = False) -> str:
+        """
+        Renumber nodes to minimise stiffness-matrix bandwidth and profile
+        (按逆 Cuthill–McKee 算法重新编号节点，减小刚度矩阵带宽).
+
+        The ordering is computed locally from the element table and links and
+        reuses the existing node IDs; it is applied in a single renumber call,
+        and only if it improves the profile. Useful before a solve with the
+        variable-bandwidth solver after piecemeal editing.
+
+        Args:
+            dry_run: Only report bandwidth/profile before and after (仅报告，不修改模型)
+        """
+        try:
+            plan = provider.renumber_nodes_rcm(apply=not dry_run)
+            before, after = plan["before"], plan["after"]
+            lines = [
+                f"Bandwidth (带宽): {before['bandwidth']} → {after['bandwidth']}",
+                f"Profile (轮廓): {before['profile']} → {after['profile']}",
+                f"Nodes renumbered (改号节点): {plan['changed']} of {plan['nodes']}, {plan['seconds']:.2f}s",
+            ]
+            if plan["applied"]:
+                status = "RCM renumbering applied (节点重编号完成)"
+            elif dry_run:
+                status = "Dry run — model not changed (试算，未修改模型)"
+            else:
+                status = "Current numbering is already as good; nothing changed (当前编号已较优，未修改)"
+            return "\n".join([status, *lines])
+        except Exception as e:
+            return f"Error renumbering nodes (重新编号失败): {e}"
+
     @mcp.tool()
     def move_nodes(
         ids: Any,
@@ -189,7 +216,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             provider.move_nodes(
                 ids=ids, offset_x=offset_x, offset_y=offset_y, offset_z=offset_z
             )
-            provider.update_model()
             return (
                 f"Nodes {ids} moved by ({offset_x}, {offset_y}, {offset_z}) "
                 f"(节点 {ids} 平移成功)"
@@ -241,7 +267,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             if beta_angle is not None:
                 kwargs["beta_angle"] = beta_angle
             provider.update_element(**kwargs)
-            provider.update_model()
             return f"Element {old_id} updated successfully (单元 {old_id} 修改成功)"
         except Exception as e:
             return f"Error updating element (修改单元失败): {e}"
@@ -257,7 +282,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_element_id(old_id=old_id, new_id=new_id)
-            provider.update_model()
             return f"Successfully updated element ID from {old_id} to {new_id} (成功修改单元编号)"
         except Exception as e:
             return f"Error updating element ID (修改单元编号失败): {e}"
@@ -274,7 +298,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.renumber_elements(element_ids=element_ids, new_ids=new_ids)
-            provider.update_model()
             return "Successfully renumbered elements (成功重新编号单元)"
         except Exception as e:
             return f"Error renumbering elements (重新编号失败): {e}"
@@ -289,7 +312,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.revert_local_orientation(ids=ids)
-            provider.update_model()
             return f"Successfully reverted local orientation for element(s) {ids} (成功反转单元方向)"
         except Exception as e:
             return f"Error reverting local orientation (反转单元方向失败): {e}"
@@ -312,7 +334,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_element_material(ids=ids, mat_id=mat_id)
-            provider.update_model()
             return f"Material of element(s) {ids} changed to {mat_id} (单元材料修改成功)"
         except Exception as e:
             return f"Error updating element material (修改单元材料失败): {e}"
@@ -335,7 +356,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_frame_section(ids=ids, sec_id=sec_id)
-            provider.update_model()
             return f"Section of element(s) {ids} changed to {sec_id} (单元截面修改成功)"
         except Exception as e:
             return f"Error updating element section (修改单元截面失败): {e}"
@@ -361,7 +381,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_element_beta(ids=ids, beta=beta)
-            provider.update_model()
             return f"Beta angle of element(s) {ids} changed to {beta}° (贝塔角修改成功)"
         except Exception as e:
             return f"Error updating beta angle (修改贝塔角失败): {e}"
@@ -382,7 +401,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         """
         try:
             provider.update_element_node(element_id=element_id, node_ids=[node_i, node_j])
-            provider.update_model()
             return (
                 f"Element {element_id} nodes updated to [{node_i}, {node_j}] "
                 f"(单元 {element_id} 端节点修改成功)"
@@ -390,6 +408,64 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         except Exception as e:
             return f"Error updating element nodes (修改单元端节点失败): {e}"
 
+    @mcp.tool()
+    def subdivide_elements(ids: Any, segments: int = 2, ratio: float = 1.0) -> str:
+        """
+        Split beam/truss elements into equal or graded segments (单元细分).
+
+        Intermediate nodes and segment elements are generated in one batch.
+
+        Preserved: each segment keeps the material, section, beta angle and
+        structure groups of its element (so stages that activate those groups
+        still activate it), and the first segment keeps the element ID.
+        Not preserved, so such elements are left whole and listed: beam element
+        loads, beam end constraints, effective widths, pre-stress, initial
+        tension and deviation loads. Not checked: tapered section groups and
+        section connection stages — re-assign those after splitting.
+        带单元荷载、梁端约束、有效宽度等数据的单元不细分；变截面组与联合截面阶段需重新指定。
+
+        Every element is checked before the model changes; if a write fails
+        the original elements are restored.
+
+        Args:
+            ids: Element ID(s). Supports int, list, or range string '1to100'.
+                 (单元编号，支持整数、列表或范围字符串)
+            segments: Number of segments per element, ≥ 2 (每个单元的分段数)
+            ratio: Last/first segment length; 1 = equal segments, > 1 grows
+                   from node I to node J (末段与首段长度比，1 为等分)
+
+        Example:
+            subdivide_elements("1to40", segments=4)
+            subdivide_elements([12, 13], segments=6, ratio=0.25)  # finer towards node J
+        """
+        try:
+            result = provider.subdivide_elements(ids=ids, segments=segments, ratio=ratio)
+            refused = result["refused"]
+            if result["elements"]:
+                lines = [
+                    f"Subdivided {result['elements']} elements into {segments} segments: "
+                    f"{result['new_nodes']} nodes and {result['new_elements']} elements added "
+                    f"in {result['seconds']:.2f}s (单元细分完成)"
+                ]
+            else:
+                lines = ["No elements subdivided (未细分任何单元)"]
+            if refused:
+                lines.append(
+                    "  Left whole, their data would be lost (带有关联数据，未细分): "
+                    + "; ".join(f"{eid}: {', '.join(labels)}" for eid, labels in list(refused.items())[:20])
+                    + (f"; … (+{len(refused) - 20})" if len(refused) > 20 else "")
+                )
+            if result["groups"]:
+                lines.append(f"  Structure groups updated (结构组): {', '.join(result['groups'])}")
+            if result["skipped"]:
+                lines.append(
+                    f"  Skipped {len(result['skipped'])} non-beam/truss elements (跳过非梁/杆单元): "
+                    f"{result['skipped'][:20]}"
+                )
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error subdividing elements (单元细分失败): {e}"
+
     # ── 3. Structure group modifications ──────────────────────────────
 
     @mcp.tool()
@@ -488,7 +564,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
                 provider.remove_nodes(ids=ids)
             else:
                 provider.remove_nodes()
-            provider.update_model()
             target = ids if ids is not None else "ALL NODES"
             return f"Deleted node(s) {target} (节点 {target} 已删除)"
         except Exception as e:
@@ -523,7 +598,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
                 provider.remove_elements(ids=ids, remove_free=remove_free_nodes)
             else:
                 provider.remove_elements(remove_free=remove_free_nodes)
-            provider.update_model()
             target = ids if ids is not None else "ALL ELEMENTS"
             return f"Deleted element(s) {target} (单元 {target} 已删除)"
         except Exception as e:
@@ -553,7 +627,6 @@ def register_modification_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
                 provider.merge_nodes(ids=ids, tolerance=tolerance)
             else:
                 provider.merge_nodes(tolerance=tolerance)
-            provider.update_model()
             return f"Merge nodes completed (tolerance={tolerance}) (节点合并完成)"
         except Exception as e:
             return f"Error merging nodes (合并节点失败): {e}"
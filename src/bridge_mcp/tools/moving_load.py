@@ -8,6 +8,7 @@ and live load cases for highway and railway bridges.
 
 from mcp.server.fastmcp import FastMCP
 
+from bridge_mcp.formatting import format_data
 from bridge_mcp.providers import BridgeProvider
 
 
@@ -136,6 +137,6 @@ def register_moving_load_tools(mcp: FastMCP, provider: BridgeProvider):
                 result_type=result_type,
                 ids=element_ids,
             )
-            return str(result)
+            return format_data(result, result=True)
         except Exception as e:
             return f"Error getting live load results (获取移动荷载结果失败): {e}"
@@ -8,20 +8,47 @@ Provides tools to inspect current model state:
     tendon properties, taper section groups.
 """
 
-import json
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from bridge_mcp.formatting import format_data
 from bridge_mcp.providers import BridgeProvider
+from bridge_mcp.providers.id_set import compress_ids
 
 
 def _fmt(obj: Any) -> str:
-    """Pretty-print any object as compact JSON for MCP responses."""
-    try:
-        return json.dumps(obj, ensure_ascii=False, indent=2, default=str)
-    except Exception:
-        return str(obj)
+    """Serialise any object in the server-wide output format for MCP responses."""
+    return format_data(obj)
+
+
+def _is_id_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(i, int) for i in value)
+
+
+def _project(rows: list[dict], fields: str) -> tuple[list[str], list[dict]]:
+    """Keep only the comma-separated `fields` of each row (all fields when empty)."""
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    if not names:
+        return (list(rows[0]) if rows else []), rows
+    known = set(rows[0]) if rows else set(names)
+    unknown = [n for n in names if n not in known]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown}; available: {', '.join(rows[0])}")
+    return names, [{n: r[n] for n in names} for r in rows]
+
+
+def _page_text(label: str, page: dict, fields: str, compact: bool) -> str:
+    """Render one page from provider.get_table_page."""
+    names, rows = _project(page["rows"], fields)
+    first = page["offset"] + 1
+    head = f"{label} {first}–{page['offset'] + len(rows)} of {page['total']}"
+    if page["next_after"] is not None:
+        head += f" (next page: cursor={page['next_after']}, 下一页游标)"
+    else:
+        head += " (last page, 最后一页)"
+    body = format_data(rows, fmt="csv") if compact else _fmt(rows)
+    return f"{head}:\n{body}"
 
 
 def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
@@ -30,13 +57,29 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
     # ── 1. Nodes ──────────────────────────────────────────────────────
 
     @mcp.tool()
-    def get_nodes(ids: Any = None) -> str:
+    def get_nodes(
+        ids: Any = None,
+        offset: int = 0,
+        limit: int = 0,
+        cursor: int | None = None,
+        fields: str = "",
+        compact: bool = False,
+    ) -> str:
         """
         Get node coordinate data from the model (获取节点坐标数据).
 
+        For large models, walk the table in pages: pass limit (e.g. 1000) and
+        then the returned cursor on each following call.
+        大模型请分页读取：指定 limit，之后每次传入返回的 cursor。
+
         Args:
             ids: Node ID(s) to query. Supports int, list, or range string like '1to10 15 20'.
                  Leave empty to get ALL nodes (节点编号，留空返回全部节点).
+            offset: Skip this many nodes in ID order (跳过的节点数)
+            limit: Page size; 0 = no limit (每页数量，0为不限)
+            cursor: Continue after this node ID, as returned by the previous page (分页游标)
+            fields: Only return these fields, e.g. "id,x,z" (仅返回指定字段)
+            compact: One comma-separated line per node instead of JSON (紧凑行格式)
 
         Returns:
             JSON list of node dicts with keys: id, x, y, z
@@ -46,6 +89,11 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             [{"id": 1, "x": 0.0, "y": 0.0, "z": 0.0}, ...]
         """
         try:
+            if offset or limit or cursor is not None or fields or compact:
+                page = provider.get_table_page("nodes", ids=ids, offset=offset, limit=limit, after=cursor)
+                if not page["total"]:
+                    return "No nodes found (未找到节点). Model may be empty."
+                return _page_text("Nodes", page, fields, compact)
             data = provider.get_node_data(ids=ids)
             if not data:
                 return "No nodes found (未找到节点). Model may be empty."
@@ -56,21 +104,42 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
     # ── 2. Elements ───────────────────────────────────────────────────
 
     @mcp.tool()
-    def get_elements(ids: Any = None) -> str:
+    def get_elements(
+        ids: Any = None,
+        offset: int = 0,
+        limit: int = 0,
+        cursor: int | None = None,
+        fields: str = "",
+        compact: bool = False,
+    ) -> str:
         """
         Get element data from the model (获取单元数据).
 
+        For large models, walk the table in pages: pass limit (e.g. 1000) and
+        then the returned cursor on each following call.
+        大模型请分页读取：指定 limit，之后每次传入返回的 cursor。
+
         Args:
             ids: Element ID(s) to query. Supports int, list, or range string like '1to50'.
                  Leave empty to get ALL elements (单元编号，留空返回全部单元).
+            offset: Skip this many elements in ID order (跳过的单元数)
+            limit: Page size; 0 = no limit (每页数量，0为不限)
+            cursor: Continue after this element ID, as returned by the previous page (分页游标)
+            fields: Only return these fields, e.g. "id,node_ids" (仅返回指定字段)
+            compact: One comma-separated line per element instead of JSON (紧凑行格式)
 
         Returns:
             JSON list of element dicts.
-            Typical keys: id, type (1=beam,2=truss,3=cable,4=plate),
-                          material_id, section_id, node_i, node_j
+            Keys: id, type (1=beam,2=truss,3=cable,4=plate),
+                  material_id, section_id, beta_angle, node_ids
             (JSON单元列表，包含单元类型、材料、截面、节点等信息)
         """
         try:
+            if offset or limit or cursor is not None or fields or compact:
+                page = provider.get_table_page("elements", ids=ids, offset=offset, limit=limit, after=cursor)
+                if not page["total"]:
+                    return "No elements found (未找到单元). Model may be empty."
+                return _page_text("Elements", page, fields, compact)
             data = provider.get_element_data(ids=ids)
             if not data:
                 return "No elements found (未找到单元). Model may be empty."
@@ -157,8 +226,11 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
               - general_supports: nodal supports (一般支承)
               - elastic_links: elastic connection links (弹性连接)
               - elastic_supports: elastic supports (弹性支承)
+              - general_elastic_supports: 6x6 stiffness supports (一般弹性支承)
               - master_slave_links: rigid body constraints (主从约束)
               - beam_constraints: beam end releases (梁端约束)
+              - constraint_equations: constraint equations (约束方程)
+              - boundary_element_links: boundary element links (边界单元连接)
             (以JSON形式返回所有类型的边界条件)
         """
         try:
@@ -250,13 +322,17 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
             group_name: Name of the structure group (结构组名称)
 
         Returns:
-            JSON dict with element and node IDs in the group.
-            (JSON格式的结构组成员列表，含单元和节点编号)
+            Element and node IDs in the group as range strings, e.g. '1to100 105'.
+            (结构组成员编号，以区间字符串表示)
         """
         try:
             data = provider.get_structure_group_elements(name=group_name)
             if not data:
                 return f"Structure group '{group_name}' is empty or not found."
+            if _is_id_list(data):
+                return f"Structure group '{group_name}' elements ({len(data)}): {compress_ids(data)}"
+            if isinstance(data, dict):
+                data = {k: compress_ids(v) if _is_id_list(v) else v for k, v in data.items()}
             return f"Structure group '{group_name}':\n{_fmt(data)}"
         except Exception as e:
             return f"Error getting structure group members (获取结构组成员失败): {e}"
@@ -818,4 +894,65 @@ def register_query_tools(mcp: FastMCP, provider: BridgeProvider) -> None:
         except Exception as e:
             return f"Error in get_buckling_eigenvalue: {e}"
 
+    # ── Model mirror ──────────────────────────────────────────────────
+
+    @mcp.tool()
+    def resync_model_mirror(enable: bool = True) -> str:
+        """
+        Reload the local model mirror from the backend (重新同步本地模型镜像).
+
+        The mirror serves nodes, elements, materials, sections, structure groups
+        and boundaries to the query tools without a backend round-trip. Call this
+        after the user edits the model directly in the GUI, since those edits are
+        not visible to the mirror.
+        用户在软件界面中直接修改模型后，调用此工具刷新镜像。
+
+        Args:
+            enable: Turn the mirror on if it is off (若镜像未启用则启用)
+        """
+        try:
+            status = provider.resync_model_mirror(enable=enable)
+            if not status["enabled"]:
+                return "Model mirror is disabled; nothing to resync (模型镜像未启用)"
+            return f"Model mirror resynced (模型镜像已同步):\n{_fmt(status['tables'])}"
+        except Exception as e:
+            return f"Error resyncing model mirror (同步模型镜像失败): {e}"
+
+    # ── Model revision ────────────────────────────────────────────────
+
+    @mcp.tool()
+    def get_model_revision(verify: bool = False) -> str:
+        """
+        Get the model revision and content fingerprint (获取模型版本号与内容指纹).
+
+        The revision increases with every write made through this server.
+        The fingerprint hashes the node, element, material, section, boundary
+        and load tables; only tables written since the last call are re-read.
+        Use verify=True to re-read every table — this detects edits made
+        directly in the QiaoTong GUI and drops cached data for those tables.
+        若用户可能在软件界面中修改了模型，使用 verify=True。
+
+        Args:
+            verify: Re-read all tables to detect GUI edits (重新读取全部表以检测界面修改)
+        """
+        try:
+            result = provider.get_model_fingerprint(verify=verify)
+            lines = [
+                f"Model revision {result['revision']}, fingerprint {result['fingerprint']} "
+                f"({result['seconds'] * 1000:.1f} ms) (模型版本与指纹)",
+                f"Re-read tables (重新读取): {', '.join(result['rehashed']) or 'none'}",
+            ]
+            if result["external_changes"]:
+                lines.append(
+                    f"⚠️ Changed outside this server (模型在界面中被修改): {', '.join(result['external_changes'])}"
+                )
+            rows = [
+                {"table": t, "digest": info["digest"][:12], "bytes": info["bytes"], "ms": info["ms"]}
+                for t, info in result["tables"].items()
+            ]
+            lines.append(format_data(rows, fmt="csv"))
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error getting model revision (获取模型版本失败): {e}"
+
     # Note: get_tendon_info is registered in tools/tendon.py
@@ -0,0 +1,136 @@
+"""
+MCP Tools for geometric lookups on the local spatial index.
+空间查询工具：基于本地空间索引的几何查找
+
+Nearest node, nodes within a radius or box, and elements at a point are
+answered from a grid index of the node table kept by the provider, so
+repeated lookups (e.g. while wiring up piers and bearings) do not go to
+the backend. Duplicate detection hashes the same node arrays.
+"""
+
+from mcp.server.fastmcp import FastMCP
+
+from bridge_mcp.formatting import format_data
+from bridge_mcp.providers import BridgeProvider
+
+
+def _node_rows(hits: list[dict], with_distance: bool = True) -> list[dict]:
+    keys = ("id", "x", "y", "z", "distance") if with_distance else ("id", "x", "y", "z")
+    return [{k: (round(h[k], 9) if k != "id" else h[k]) for k in keys} for h in hits]
+
+
+def register_spatial_tools(mcp: FastMCP, provider: BridgeProvider):
+    """Register spatial query MCP tools."""
+
+    @mcp.tool()
+    def get_nearest_node(x: float, y: float, z: float = 0.0, count: int = 1) -> str:
+        """
+        Find the node(s) nearest to a point (查找距离某点最近的节点).
+
+        Args:
+            x, y, z: Point coordinates in m (点坐标)
+            count: Number of nearest nodes to return (返回的最近节点数)
+        """
+        try:
+            hits = provider.find_nearest_nodes(x, y, z, count=count)
+            if not hits:
+                return "No nodes in the model (模型中没有节点)."
+            if count == 1:
+                h = hits[0]
+                return (
+                    f"Nearest node {h['id']} at ({h['x']:g}, {h['y']:g}, {h['z']:g}), "
+                    f"distance {h['distance']:.6g} m (最近节点)"
+                )
+            return f"{len(hits)} nearest nodes (最近节点):\n{format_data(_node_rows(hits))}"
+        except Exception as e:
+            return f"Error finding nearest node (查找最近节点失败): {e}"
+
+    @mcp.tool()
+    def get_nodes_within_radius(x: float, y: float, z: float, radius: float) -> str:
+        """
+        Find all nodes within a radius of a point, nearest first (查找半径范围内的节点).
+
+        Args:
+            x, y, z: Center coordinates in m (圆心坐标)
+            radius: Search radius in m (搜索半径)
+        """
+        try:
+            hits = provider.find_nodes_within(x, y, z, radius)
+            if not hits:
+                return f"No nodes within {radius:g} m (半径范围内没有节点)."
+            return f"{len(hits)} nodes within {radius:g} m (半径范围内节点):\n{format_data(_node_rows(hits))}"
+        except Exception as e:
+            return f"Error finding nodes within radius (查找半径范围内节点失败): {e}"
+
+    @mcp.tool()
+    def get_nodes_in_box(
+        x_min: float, y_min: float, z_min: float,
+        x_max: float, y_max: float, z_max: float,
+    ) -> str:
+        """
+        Find all nodes inside an axis-aligned box (查找包围盒内的节点).
+
+        Args:
+            x_min, y_min, z_min: Lower corner in m (最小角点)
+            x_max, y_max, z_max: Upper corner in m (最大角点)
+        """
+        try:
+            hits = provider.find_nodes_in_box([x_min, y_min, z_min], [x_max, y_max, z_max])
+            if not hits:
+                return "No nodes inside the box (包围盒内没有节点)."
+            return f"{len(hits)} nodes in box (包围盒内节点):\n{format_data(_node_rows(hits, with_distance=False))}"
+        except Exception as e:
+            return f"Error finding nodes in box (查找包围盒内节点失败): {e}"
+
+    @mcp.tool()
+    def get_elements_at_point(x: float, y: float, z: float = 0.0, tolerance: float = 1e-3) -> str:
+        """
+        Find the elements passing through a point (查找经过某点的单元).
+
+        Line elements are matched by distance to their axis, plates by
+        distance to their surface.
+
+        Args:
+            x, y, z: Point coordinates in m (点坐标)
+            tolerance: Maximum distance from the element in m (容差)
+        """
+        try:
+            hits = provider.find_elements_at_point(x, y, z, tolerance=tolerance)
+            if not hits:
+                return f"No element within {tolerance:g} m of the point (该点附近没有单元)."
+            rows = [{**h, "distance": round(h["distance"], 9)} for h in hits]
+            return f"{len(hits)} elements at point (点所在单元):\n{format_data(rows)}"
+        except Exception as e:
+            return f"Error finding elements at point (查找点所在单元失败): {e}"
+
+    @mcp.tool()
+    def get_duplicates(tolerance: float = 1e-4, incremental: bool = False) -> str:
+        """
+        Find coincident nodes and duplicate/overlapping elements, computed locally
+        (查找重合节点与重复/重叠单元，本地计算).
+
+        Elements are "duplicate" when they connect the same (or coincident) nodes,
+        "overlap" when collinear line elements run along each other from a shared node.
+        Fix coincident nodes with merge_nodes.
+
+        Args:
+            tolerance: Distance below which nodes coincide, in m (重合容差)
+            incremental: Only check nodes/elements added since the previous check (仅检查新增对象)
+        """
+        try:
+            result = provider.find_duplicates(
+                tolerance=tolerance, incremental=incremental, update_baseline=True
+            )
+            nodes, elements = result["coincident_nodes"], result["overlapping_elements"]
+            scope = "new " if result["incremental"] else ""
+            lines = [
+                f"Checked {result['checked']['nodes']} {scope}nodes and {result['checked']['elements']} "
+                f"{scope}elements in {result['seconds'] * 1000:.1f} ms (重合检查)",
+                f"Coincident node groups (重合节点组): {len(nodes)}",
+            ]
+            lines.extend(f"  {', '.join(map(str, g))}" for g in nodes)
+            lines.append(f"Overlapping element groups (重叠单元组): {len(elements)}")
+            lines.extend(f"  {g['kind']}: {', '.join(map(str, g['ids']))}" for g in elements)
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error finding duplicates (重合检查失败): {e}"
@@ -11,6 +11,17 @@ from mcp.server.fastmcp import FastMCP
 from bridge_mcp.providers import BridgeProvider
 
 
+def _section_id(sections, section_name: str) -> int:
+    """Pick the section ID for `section_name` from get_section_names() output."""
+    if isinstance(sections, dict):
+        # {"3": "上横梁", ...} — match by name, else the first section
+        for sec_id, name in sections.items():
+            if name == section_name:
+                return int(sec_id)
+        return int(next(iter(sections), 1))
+    return sections[0] if sections else 1
+
+
 def register_workflow_tools(mcp: FastMCP, provider: BridgeProvider):
     """Register high-level workflow MCP tools."""
 
@@ -31,6 +42,9 @@ def register_workflow_tools(mcp: FastMCP, provider: BridgeProvider):
         a single step. The bridge lies along the X-axis.
         一键完成节点、梁单元、支承和自重工况的建立，桥梁沿X轴布置。
 
+        Supports: pin at node 1 (X, Y, Z, RX), roller at the last node (Y, Z, RX).
+        支承：1号节点为固定铰支座（X、Y、Z、RX），末节点为活动支座（Y、Z、RX）。
+
         Args:
             span: Span length in meters (跨径，单位m)
             num_elements: Number of beam elements (梁单元划分数量), min 2
@@ -43,75 +57,75 @@ def register_workflow_tools(mcp: FastMCP, provider: BridgeProvider):
         """
         try:
             log = []
+            with provider.edit_session("create_simple_beam_bridge"):
+                # 1. Create C50 concrete material if not present
+                try:
+                    provider.add_material(
+                        name=material_name, mat_type=1, standard=1, database=material_name
+                    )
+                    log.append(f"✓ Material '{material_name}' created")
+                except Exception:
+                    log.append(f"ℹ Material '{material_name}' already exists or skipped")
+
+                # 2. Create rectangular section if not present
+                try:
+                    provider.add_section(
+                        name=section_name,
+                        sec_type="矩形",
+                        sec_info=[section_width, section_height],
+                    )
+                    log.append(f"✓ Section '{section_name}' ({section_width}×{section_height}m) created")
+                except Exception:
+                    log.append(f"ℹ Section '{section_name}' already exists or skipped")
+
+                # 3. Create nodes along X-axis
+                n = num_elements + 1
+                dx = span / num_elements
+                # Create node array for simple beam
+                node_data = [[i * dx, 0.0, 0.0] for i in range(n)]
+                provider.add_nodes(node_data=node_data, is_merged=True)
+                log.append(f"✓ {n} nodes created (x=0 to {span}m)")
 
-            # 1. Create C50 concrete material if not present
-            try:
-                provider.add_material(
-                    name=material_name, mat_type=1, standard=1, database=material_name
+                # 4. Get material and section IDs from model
+                materials = provider.get_material_data()
+                mat_id = next(
+                    (m.get("id", 1) for m in materials if m.get("name") == material_name), 1
                 )
-                log.append(f"✓ Material '{material_name}' created")
-            except Exception:
-                log.append(f"ℹ Material '{material_name}' already exists or skipped")
-
-            # 2. Create rectangular section if not present
-            try:
-                provider.add_section(
-                    name=section_name,
-                    sec_type="矩形",
-                    sec_info=[section_width, section_height],
+                sec_id = _section_id(provider.get_section_names(), section_name)
+
+                # 5. Create beam elements
+                # Generate sequential beam element array: [id, type, matId, secId, beta, nodeI, nodeJ, initType, initVal]
+                ele_data = [
+                    [i + 1, 1, mat_id, sec_id, 0.0, i + 1, i + 2, 0, 0.0]
+                    for i in range(num_elements)
+                ]
+                provider.add_elements(ele_data=ele_data)
+                log.append(f"✓ {num_elements} beam elements created")
+
+                # 6. Set supports: pin at node 1, roller at last node; both
+                # restrain torsion (RX), or the girder is free to spin about its axis
+                provider.add_general_support(
+                    node_id=1, boundary_info=[True, True, True, True, False, False]
                 )
-                log.append(f"✓ Section '{section_name}' ({section_width}×{section_height}m) created")
-            except Exception:
-                log.append(f"ℹ Section '{section_name}' already exists or skipped")
-
-            # 3. Create nodes along X-axis
-            n = num_elements + 1
-            dx = span / num_elements
-            # Create node array for simple beam
-            node_data = [[i * dx, 0.0, 0.0] for i in range(n)]
-            provider.add_nodes(node_data=node_data, is_merged=True)
-            log.append(f"✓ {n} nodes created (x=0 to {span}m)")
-
-            # 4. Get material and section IDs from model
-            materials = provider.get_material_data()
-            mat_id = next(
-                (m.get("id", 1) for m in materials if m.get("name") == material_name), 1
-            )
-            sections = provider.get_section_names()
-            sec_id = sections[0] if sections else 1
-
-            # 5. Create beam elements
-            # Generate sequential beam element array: [id, type, matId, secId, beta, nodeI, nodeJ, initType, initVal]
-            ele_data = [
-                [i + 1, 1, mat_id, sec_id, 0.0, i + 1, i + 2, 0, 0.0]
-                for i in range(num_elements)
-            ]
-            provider.add_elements(ele_data=ele_data)
-            log.append(f"✓ {num_elements} beam elements created")
-
-            # 6. Set supports: pin at node 1, roller at last node
-            provider.add_general_support(
-                node_id=1, boundary_info=[True, True, True, False, False, False]
-            )
-            provider.add_general_support(
-                node_id=n, boundary_info=[False, True, True, False, False, False]
-            )
-            log.append(f"✓ Pin support at node 1, roller at node {n}")
+                provider.add_general_support(
+                    node_id=n, boundary_info=[False, True, True, True, False, False]
+                )
+                log.append(f"✓ Pin support at node 1, roller at node {n} (torsion restrained)")
 
-            # 7. Add self-weight (load group → load case → self-weight)
-            try:
+                # 7. Add self-weight (load group → load case → self-weight)
                 try:
-                    provider.add_load_group(name="默认荷载组")
-                except Exception:
-                    pass  # group likely already exists
-                try:
-                    provider.add_load_case(name=self_weight_case, case_type="施工阶段荷载")
-                except Exception:
-                    pass  # case likely already exists
-                provider.add_self_weight(case_name=self_weight_case)
-                log.append(f"✓ Load group, load case '{self_weight_case}' and system self-weight applied")
-            except Exception as e:
-                log.append(f"ℹ Self-weight setup failed (error: {e})")
+                    try:
+                        provider.add_load_group(name="默认荷载组")
+                    except Exception:
+                        pass  # group likely already exists
+                    try:
+                        provider.add_load_case(name=self_weight_case, case_type="施工阶段荷载")
+                    except Exception:
+                        pass  # case likely already exists
+                    provider.add_self_weight(case_name=self_weight_case)
+                    log.append(f"✓ Load group, load case '{self_weight_case}' and system self-weight applied")
+                except Exception as e:
+                    log.append(f"ℹ Self-weight setup failed (error: {e})")
 
             return (
                 f"✅ Simple beam bridge created successfully! (简支梁桥模型创建成功)\n"
@@ -138,6 +152,9 @@ def register_workflow_tools(mcp: FastMCP, provider: BridgeProvider):
         and appropriate end conditions.
         创建多跨连续梁桥，中间支座为固定支承，端部为活动支承。
 
+        Supports: piers restrain X, Y, Z; abutments are rollers (Y, Z, RX).
+        支承：桥墩约束 X、Y、Z；桥台为活动支座（Y、Z、RX）。
+
         Args:
             spans: List of span lengths in meters (各跨跨径列表，单位m),
                    e.g. [30.0, 50.0, 30.0] means 3-span (3跨均匀布置)
@@ -151,88 +168,88 @@ def register_workflow_tools(mcp: FastMCP, provider: BridgeProvider):
 
         try:
             log = []
-            total_spans = len(spans)
-            total_length = sum(spans)
+            with provider.edit_session("create_continuous_beam_bridge"):
+                total_spans = len(spans)
+                total_length = sum(spans)
 
-            # 1. Materials and sections (attempt creation, skip if existing)
-            try:
-                provider.add_material(
-                    name=material_name, mat_type=1, standard=1, database=material_name
+                # 1. Materials and sections (attempt creation, skip if existing)
+                try:
+                    provider.add_material(
+                        name=material_name, mat_type=1, standard=1, database=material_name
+                    )
+                    log.append(f"✓ Material '{material_name}' created")
+                except Exception:
+                    log.append(f"ℹ Material '{material_name}' skipped")
+
+                # 2. Create nodes
+                node_data = []
+                x = 0.0
+                for span_len in spans:
+                    dx = span_len / num_elements_per_span
+                    for j in range(num_elements_per_span):
+                        node_data.append([round(x, 6), 0.0, 0.0])
+                        x += dx
+                # Add final node
+                node_data.append([round(total_length, 6), 0.0, 0.0])
+                provider.add_nodes(node_data=node_data, is_merged=True)
+                total_nodes = len(node_data)
+                log.append(f"✓ {total_nodes} nodes created")
+
+                # 3. Create elements
+                materials = provider.get_material_data()
+                mat_id = next(
+                    (m.get("id", 1) for m in materials if m.get("name") == material_name), 1
                 )
-                log.append(f"✓ Material '{material_name}' created")
-            except Exception:
-                log.append(f"ℹ Material '{material_name}' skipped")
-
-            # 2. Create nodes
-            node_data = []
-            x = 0.0
-            for span_len in spans:
-                dx = span_len / num_elements_per_span
-                for j in range(num_elements_per_span):
-                    node_data.append([round(x, 6), 0.0, 0.0])
-                    x += dx
-            # Add final node
-            node_data.append([round(total_length, 6), 0.0, 0.0])
-            provider.add_nodes(node_data=node_data, is_merged=True)
-            total_nodes = len(node_data)
-            log.append(f"✓ {total_nodes} nodes created")
-
-            # 3. Create elements
-            materials = provider.get_material_data()
-            mat_id = next(
-                (m.get("id", 1) for m in materials if m.get("name") == material_name), 1
-            )
-            sections = provider.get_section_names()
-            sec_id = sections[0] if sections else 1
+                sec_id = _section_id(provider.get_section_names(), section_name)
 
-            total_elements = total_spans * num_elements_per_span
+                total_elements = total_spans * num_elements_per_span
             
-            # Generate sequential beam element array: [id, type, matId, secId, beta, nodeI, nodeJ, initType, initVal]
-            ele_data = [
-                [i + 1, 1, mat_id, sec_id, 0.0, i + 1, i + 2, 0, 0.0]
-                for i in range(total_elements)
-            ]
-            provider.add_elements(ele_data=ele_data)
-            log.append(f"✓ {total_elements} beam elements created")
-
-            # 4. Set supports at abutments and piers
-            # Start abutment: roller (free X)
-            provider.add_general_support(
-                node_id=1, boundary_info=[False, True, True, False, False, False]
-            )
-            log.append("✓ Left abutment: roller support at node 1")
+                # Generate sequential beam element array: [id, type, matId, secId, beta, nodeI, nodeJ, initType, initVal]
+                ele_data = [
+                    [i + 1, 1, mat_id, sec_id, 0.0, i + 1, i + 2, 0, 0.0]
+                    for i in range(total_elements)
+                ]
+                provider.add_elements(ele_data=ele_data)
+                log.append(f"✓ {total_elements} beam elements created")
 
-            # Pier nodes at span boundaries
-            node_at_pier = 1
-            for i, span_len in enumerate(spans[:-1]):
-                node_at_pier += num_elements_per_span
+                # 4. Set supports at abutments and piers
+                # Start abutment: roller (free X); abutments restrain torsion (RX)
                 provider.add_general_support(
-                    node_id=node_at_pier,
-                    boundary_info=[True, True, True, False, False, False]
+                    node_id=1, boundary_info=[False, True, True, True, False, False]
                 )
-                log.append(f"✓ Pier {i+1}: fixed support at node {node_at_pier}")
+                log.append("✓ Left abutment: roller support at node 1 (torsion restrained)")
 
-            # End abutment: roller
-            provider.add_general_support(
-                node_id=total_nodes,
-                boundary_info=[False, True, True, False, False, False]
-            )
-            log.append(f"✓ Right abutment: roller support at node {total_nodes}")
+                # Pier nodes at span boundaries
+                node_at_pier = 1
+                for i, span_len in enumerate(spans[:-1]):
+                    node_at_pier += num_elements_per_span
+                    provider.add_general_support(
+                        node_id=node_at_pier,
+                        boundary_info=[True, True, True, False, False, False]
+                    )
+                    log.append(f"✓ Pier {i+1}: fixed support at node {node_at_pier}")
 
-            # 5. Self-weight (load group → load case → self-weight)
-            try:
-                try:
-                    provider.add_load_group(name="默认荷载组")
-                except Exception:
-                    pass
+                # End abutment: roller
+                provider.add_general_support(
+                    node_id=total_nodes,
+                    boundary_info=[False, True, True, True, False, False]
+                )
+                log.append(f"✓ Right abutment: roller support at node {total_nodes} (torsion restrained)")
+
+                # 5. Self-weight (load group → load case → self-weight)
                 try:
-                    provider.add_load_case(name=self_weight_case, case_type="施工阶段荷载")
-                except Exception:
-                    pass
-                provider.add_self_weight(case_name=self_weight_case)
-                log.append(f"✓ Load group, load case '{self_weight_case}' and system self-weight applied")
-            except Exception as e:
-                log.append(f"ℹ Self-weight setup failed (error: {e})")
+                    try:
+                        provider.add_load_group(name="默认荷载组")
+                    except Exception:
+                        pass
+                    try:
+                        provider.add_load_case(name=self_weight_case, case_type="施工阶段荷载")
+                    except Exception:
+                        pass
+                    provider.add_self_weight(case_name=self_weight_case)
+                    log.append(f"✓ Load group, load case '{self_weight_case}' and system self-weight applied")
+                except Exception as e:
+                    log.append(f"ℹ Self-weight setup failed (error: {e})")
 
             spans_str = "+".join(f"{s:.0f}" for s in spans)
             return (
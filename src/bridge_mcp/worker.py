@@ -0,0 +1,178 @@
+"""
+Backend worker — keeps the MCP event loop free while the backend works.
+后端工作线程：避免长时间操作阻塞 MCP 事件循环
+
+The tool modules register plain synchronous functions that call the
+provider directly. `WorkerMCP` wraps each one at registration time as a
+coroutine that runs the original function on a single dedicated backend
+thread, so calls to the single-GUI backend stay strictly serialised while
+the server keeps answering list_tools, resource reads and other requests.
+
+While the backend thread is busy (e.g. run_analysis), requests for the tools
+in READ_ONLY_TOOLS and for resources are not queued behind it: they run on a
+reader thread in the provider's cache-only mode and succeed when the answer
+is held locally (model mirror, summary cache), or report that the backend is
+busy. Both threads go through provider.exclusive(), which the backend thread
+gives up only while it waits for the server, so a reader never sees the
+provider's caches in the middle of an update.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.tools import Tool
+
+from bridge_mcp.metrics import Metrics
+from bridge_mcp.providers import BridgeProvider
+
+# Tools that only read the model, results or server state. While the backend
+# is busy they are answered from local caches instead of waiting; a tool not
+# listed here always queues on the backend thread.
+READ_ONLY_TOOLS = frozenset({
+    "get_all_concurrent_reaction", "get_analysis_history", "get_analysis_results",
+    "get_beam_element_load_data", "get_boundaries", "get_buckling_eigenvalue",
+    "get_buckling_modal_results", "get_cable_element_length", "get_cable_length_load_data",
+    "get_concurrent_force", "get_connectivity_report", "get_constrain_equation_force",
+    "get_constraint_equation_data", "get_construction_stages", "get_deviation_load_data",
+    "get_deviation_parameters", "get_duplicates", "get_edit_session_status",
+    "get_effective_width_data", "get_elastic_link_force", "get_element_type",
+    "get_element_weight", "get_elements", "get_elements_at_point",
+    "get_elements_by_material", "get_elements_by_point", "get_elements_by_section",
+    "get_elements_of_stage", "get_group_nodes", "get_groups_of_stage",
+    "get_initial_tension_load_data", "get_live_load_results", "get_load_cases",
+    "get_materials", "get_model_info", "get_model_revision", "get_nearest_node",
+    "get_nodal_displacement_load_data", "get_nodal_force_load_data", "get_node_id",
+    "get_node_local_axis_data", "get_node_mass_data", "get_nodes", "get_nodes_in_box",
+    "get_nodes_of_stage", "get_nodes_within_radius", "get_period_and_vibration_results",
+    "get_plate_element_load_data", "get_pre_stress_load_data", "get_reinforcement_data",
+    "get_section_detail", "get_section_list", "get_section_property",
+    "get_section_property_by_lines", "get_section_property_by_loops", "get_section_shape",
+    "get_self_concurrent_reaction", "get_span_elements", "get_span_supports",
+    "get_stage_envelope", "get_structure_group_members", "get_structure_groups",
+    "get_tendon_info", "get_tendon_length_result", "get_tendon_loss_results",
+    "get_tendon_position_result", "get_tendon_property_data", "get_thickness_data",
+    "get_vibration_modal_results", "list_group_members",
+})
+
+
+class BackendWorker:
+    """Single backend thread plus a small reader pool for cache-only requests."""
+
+    def __init__(self, provider: BridgeProvider, readers: int = 2, metrics: Metrics | None = None):
+        self.provider = provider
+        self.metrics = metrics
+        self._backend = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bridge-backend")
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="bridge-reader")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._current: dict[str, Any] | None = None
+
+    @property
+    def busy(self) -> bool:
+        return self._pending > 0
+
+    def status(self) -> dict[str, Any]:
+        current = self._current
+        return {
+            "busy": self.busy,
+            "queued": max(self._pending - 1, 0) if current else self._pending,
+            "running": current["name"] if current else None,
+            "running_for_s": round(time.time() - current["started_at"], 3) if current else 0.0,
+        }
+
+    async def submit(self, name: str, fn: Callable, kwargs: dict, read_only: bool = False) -> Any:
+        if self.metrics is None or not self.metrics.enabled:
+            return await self._submit(name, fn, kwargs, read_only)
+        start = time.perf_counter()
+        try:
+            result = await self._submit(name, fn, kwargs, read_only)
+        except Exception:
+            self.metrics.record_tool(name, time.perf_counter() - start, error=True)
+            raise
+        # Tools report failures as "Error ..." strings rather than raising.
+        text = result if isinstance(result, str) else ""
+        self.metrics.record_tool(
+            name, time.perf_counter() - start,
+            error=text.startswith(("Error", "❌")), bytes_out=len(text),
+        )
+        return result
+
+    async def _submit(self, name: str, fn: Callable, kwargs: dict, read_only: bool) -> Any:
+        loop = asyncio.get_running_loop()
+        if read_only and self.busy:
+            return await loop.run_in_executor(self._readers, self._run_cache_only, fn, kwargs)
+        with self._lock:
+            self._pending += 1
+        try:
+            return await loop.run_in_executor(self._backend, self._run, name, fn, kwargs)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _run(self, name: str, fn: Callable, kwargs: dict) -> Any:
+        self._current = {"name": name, "started_at": time.time()}
+        try:
+            with self.provider.exclusive():
+                return fn(**kwargs)
+        finally:
+            self._current = None
+
+    def _run_cache_only(self, fn: Callable, kwargs: dict) -> Any:
+        with self.provider.cache_only():
+            return fn(**kwargs)
+
+    def wrap(self, name: str, fn: Callable, read_only: bool = False) -> Callable:
+        """Return an async wrapper that runs `fn` through the worker."""
+
+        @functools.wraps(fn)
+        async def run(**kwargs):
+            return await self.submit(name, fn, kwargs, read_only=read_only)
+
+        return run
+
+    def shutdown(self) -> None:
+        self._backend.shutdown(wait=False, cancel_futures=True)
+        self._readers.shutdown(wait=False, cancel_futures=True)
+
+
+class WorkerMCP(FastMCP):
+    """
+    FastMCP server whose synchronous tools and resources run on a BackendWorker.
+
+    Wrapping happens as each function is registered. The original synchronous
+    tools stay available in `backend_tools` for callers already on the backend
+    thread (batch_execute). Without a worker, functions are registered as is.
+    """
+
+    def __init__(self, *args: Any, worker: BackendWorker | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.worker = worker
+        # Tool name → Tool built from the original synchronous function.
+        self.backend_tools: dict[str, Tool] = {}
+
+    def add_tool(self, fn: Callable, name: str | None = None, **kwargs: Any) -> None:
+        if inspect.iscoroutinefunction(fn):
+            return super().add_tool(fn, name=name, **kwargs)
+        tool = Tool.from_function(fn, name=name)
+        # The first registration wins, as in FastMCP's own tool manager.
+        self.backend_tools.setdefault(tool.name, tool)
+        if self.worker is not None:
+            fn = self.worker.wrap(tool.name, fn, read_only=tool.name in READ_ONLY_TOOLS)
+        super().add_tool(fn, name=name, **kwargs)
+
+    def resource(self, uri: str, **kwargs: Any) -> Callable[[Callable], Callable]:
+        register = super().resource(uri, **kwargs)
+
+        def decorator(fn: Callable) -> Callable:
+            if self.worker is None or inspect.iscoroutinefunction(fn):
+                return register(fn)
+            register(self.worker.wrap(uri, fn, read_only=True))
+            return fn
+
+        return decorator
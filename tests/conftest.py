@@ -0,0 +1,18 @@
+import pytest
+
+from bridge_mcp.providers.qtmodel_provider import QtModelProvider
+from bridge_mcp.standin.server import StandInServer
+
+
+@pytest.fixture
+def standin():
+    server = StandInServer(port=0).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def provider(standin):
+    """A provider with the model mirror on, talking to an empty stand-in model."""
+    return QtModelProvider({"server_url": standin.url, "model_mirror": True})
+
@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+import pytest
+
+from bridge_mcp.tools.alignment import (
+    HorizontalAlignment,
+    alignment_points,
+    profile_elevation,
+    station_grid,
+)
+
+
+def test_tangent():
+    line = HorizontalAlignment([{"type": "line", "length": 100}], x0=10, y0=5, azimuth_deg=30)
+    x, y, heading = line.evaluate(np.array([0.0, 40.0, 100.0]))
+    assert np.allclose(x, 10 + np.array([0, 40, 100]) * math.cos(math.radians(30)))
+    assert np.allclose(y, 5 + np.array([0, 40, 100]) * math.sin(math.radians(30)))
+    assert np.allclose(heading, math.radians(30))
+
+
+@pytest.mark.parametrize("radius", [250.0, -250.0])
+def test_circular_arc(radius):
+    arc = HorizontalAlignment([{"type": "arc", "radius": radius, "length": 150}])
+    s = np.array([0.0, 75.0, 150.0])
+    x, y, heading = arc.evaluate(s)
+    # Turning left (R > 0) the centre is at (0, R); right (R < 0) at (0, -|R|).
+    assert np.allclose(x, abs(radius) * np.sin(s / abs(radius)))
+    assert np.allclose(y, radius * (1 - np.cos(s / radius)))
+    assert np.allclose(heading, s / radius)
+    assert np.allclose(np.hypot(x, y - radius), abs(radius))
+
+
+def test_clothoid_matches_series_expansion():
+    radius, length = 300.0, 100.0
+    spiral = HorizontalAlignment([{"type": "spiral", "start_radius": 0, "end_radius": radius, "length": length}])
+    s = np.array([25.0, 50.0, 100.0])
+    x, y, heading = spiral.evaluate(s)
+    a2 = radius * length  # clothoid parameter A²
+    expected_x = s - s ** 5 / (40 * a2 ** 2) + s ** 9 / (3456 * a2 ** 4)
+    expected_y = s ** 3 / (6 * a2) - s ** 7 / (336 * a2 ** 3) + s ** 11 / (42240 * a2 ** 5)
+    assert np.allclose(x, expected_x, atol=1e-9)
+    assert np.allclose(y, expected_y, atol=1e-9)
+    assert np.allclose(heading, s ** 2 / (2 * a2))
+
+
+def test_spiral_arc_spiral_is_continuous_and_symmetric():
+    segments = [
+        {"type": "line", "length": 50},
+        {"type": "spiral", "start_radius": 0, "end_radius": 400, "length": 80},
+        {"type": "arc", "radius": 400, "length": 120},
+        {"type": "spiral", "start_radius": 400, "end_radius": 0, "length": 80},
+        {"type": "line", "length": 50},
+    ]
+    alignment = HorizontalAlignment(segments)
+    eps = 1e-7
+    for boundary in alignment.starts[1:]:
+        x, y, heading = alignment.evaluate(np.array([boundary - eps, boundary]))
+        assert abs(x[1] - x[0]) < 1e-5 and abs(y[1] - y[0]) < 1e-5 and abs(heading[1] - heading[0]) < 1e-6
+    # Total deflection: two spirals of L/(2R) each plus the arc's L/R.
+    assert alignment.end[2] == pytest.approx(80 / 800 * 2 + 120 / 400)
+    # The curve is symmetric about the bisector of its two tangents.
+    _, _, mid_heading = alignment.evaluate(np.array([alignment.total / 2]))
+    assert mid_heading[0] == pytest.approx(alignment.end[2] / 2)
+
+
+def test_vertical_curve_elevations():
+    pvis = [[0, 100, 0], [200, 104, 100], [400, 100, 0]]
+    s = np.array([0.0, 100.0, 150.0, 175.0, 200.0, 225.0, 250.0, 400.0, 450.0])
+    z = profile_elevation(s, pvis, start_z=0.0, grade=0.0)
+    # +2 % into a -2 % grade over a 100 m curve: e = A·L/8 = 0.5 m at the PVI.
+    expected = [100.0, 102.0, 103.0, 103.375, 103.5, 103.375, 103.0, 100.0, 99.0]
+    assert np.allclose(z, expected)
+
+
+def test_constant_grade_and_overlapping_curves():
+    assert np.allclose(profile_elevation(np.array([10.0, 20.0]), None, 5.0, 2.0, origin=10.0), [5.0, 5.2])
+    with pytest.raises(ValueError):
+        profile_elevation(np.array([0.0]), [[0, 0, 0], [100, 2, 150], [200, 0, 150], [300, 1, 0]], 0.0, 0.0)
+
+
+def test_station_grid_keeps_key_points_and_spacing():
+    grid = station_grid(100.0, 7.0, [[40.0, 60.0, 2.0]], np.array([0.0, 33.0, 100.0]))
+    assert {0.0, 33.0, 40.0, 60.0, 100.0} <= set(np.round(grid, 9).tolist())
+    steps = np.diff(grid)
+    assert steps.max() <= 7.0 + 1e-9
+    inside = (grid[:-1] >= 40.0) & (grid[1:] <= 60.0)
+    assert np.all(steps[inside] <= 2.0 + 1e-9)
+
+
+def test_offset_girder_with_crossfall():
+    result = alignment_points(
+        [{"type": "arc", "radius": 200, "length": 100}],
+        stations=[1000.0, 1050.0], start_station=1000.0, start_z=10.0,
+        offset=3.0, crossfall=[[1000.0, 2.0], [1100.0, 2.0]],
+    )
+    xyz = result["xyz"]
+    # A girder 3 m left of a left-turning arc sits on radius R − 3.
+    assert np.allclose(np.hypot(xyz[:, 0], xyz[:, 1] - 200), 197.0)
+    assert np.allclose(xyz[:, 2], 10.0 + 3.0 * 0.02)
+    assert result["station"].tolist() == [1000.0, 1050.0]
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from bridge_mcp.tools import register_modeling_tools
+from bridge_mcp.tools.batch import register_batch_tools
+from bridge_mcp.tools.modifications import register_modification_tools
+from bridge_mcp.worker import WorkerMCP
+
+
+@pytest.fixture
+def batch(provider):
+    mcp = WorkerMCP("batch-test")
+    register_modeling_tools(mcp, provider)
+    register_modification_tools(mcp, provider)
+    register_batch_tools(mcp, provider)
+
+    def run(operations, on_error="stop"):
+        _, result = asyncio.run(mcp.call_tool("batch_execute", {"operations": operations, "on_error": on_error}))
+        return result["result"]
+
+    return run
+
+
+def _status(report: str) -> list[str]:
+    return [line.split(",")[2] for line in report.splitlines()[2:]]
+
+
+def test_refused_calls_count_as_failures(batch):
+    report = batch([
+        {"tool": "create_nodes", "args": {"node_data": [[1, 0, 0, 0]], "is_merged": False}},
+        {"tool": "remove_nodes", "args": {}},
+        {"tool": "remove_elements", "args": {}},
+    ], on_error="continue")
+    assert report.startswith("Batch finished: 1 ok, 2 failed")
+    assert _status(report) == ["ok", "error", "error"]
+
+
+def test_stop_skips_after_a_refusal(batch):
+    report = batch([
+        {"tool": "remove_nodes", "args": {}},
+        {"tool": "create_nodes", "args": {"node_data": [[1, 0, 0, 0]], "is_merged": False}},
+    ])
+    assert _status(report) == ["error", "skipped"]
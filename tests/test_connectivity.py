@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from bridge_mcp.providers.connectivity import check_connectivity, component_labels, connectivity_issues
+from bridge_mcp.tools import analysis_precheck
+
+PIN = [True, True, True, True, False, False]
+ROLLER = [False, True, True, True, False, False]
+
+
+def beam(n: int, first_id: int = 1, y: float = 0.0):
+    """Node IDs, coordinates and elements of a straight girder along X."""
+    ids = np.arange(first_id, first_id + n, dtype=np.int64)
+    xyz = np.column_stack([np.arange(n, dtype=float), np.full(n, y), np.zeros(n)])
+    elements = [
+        {"id": int(i), "type": 1, "material_id": 1, "section_id": 1, "node_ids": [int(i), int(i) + 1]}
+        for i in ids[:-1]
+    ]
+    return ids, xyz, elements
+
+
+def supports(*pairs):
+    return {"general_supports": [{"node_id": node, "boundary_info": info} for node, info in pairs]}
+
+
+def test_component_labels():
+    labels = component_labels(6, np.array([[0, 1], [4, 5], [1, 2]]))
+    assert labels.tolist() == [0, 0, 0, 3, 4, 4]
+
+
+def test_supported_beam_has_no_issues():
+    ids, xyz, elements = beam(5)
+    report = check_connectivity(ids, xyz, elements, supports((1, PIN), (5, ROLLER)), {1}, {1})
+    assert report["mechanisms"] == 0 and report["unsupported_components"] == 0
+    assert report["components"][0]["nodes"] == 5 and report["components"][0]["elements"] == 4
+    assert connectivity_issues(report) == ([], [])
+
+
+def test_free_torsion_is_a_mechanism():
+    ids, xyz, elements = beam(5)
+    free_rx = [False, True, True, False, False, False]
+    report = check_connectivity(ids, xyz, elements, supports((1, PIN[:3] + [False] * 3), (5, free_rx)))
+    assert report["mechanisms"] == 1
+    assert report["components"][0]["free_dofs"] == ["RX"]
+    errors, _ = connectivity_issues(report)
+    assert len(errors) == 1 and "RX" in errors[0]
+
+
+def test_parts_dangling_nodes_and_missing_references():
+    ids, xyz, elements = beam(4)
+    other_ids, other_xyz, other_elements = beam(3, first_id=10, y=5.0)
+    ids = np.concatenate([ids, other_ids, [20]])
+    xyz = np.vstack([xyz, other_xyz, [[0.0, 9.0, 0.0]]])
+    elements = elements + other_elements + [
+        {"id": 30, "type": 1, "material_id": 2, "section_id": 1, "node_ids": [1, 99]},
+    ]
+    report = check_connectivity(ids, xyz, elements, supports((1, PIN), (4, ROLLER)), {1}, {1})
+    assert len(report["components"]) == 2
+    assert report["unsupported_components"] == 1
+    assert report["dangling_nodes"] == [20]
+    assert report["missing_nodes"] == {30: [99]}
+    assert report["missing_materials"] == {2: [30]}
+    errors, warnings = connectivity_issues(report)
+    assert len(errors) == 3  # missing node, missing material, unsupported part
+    assert any("disconnected" in w for w in warnings) and any("not connected" in w for w in warnings)
+
+
+def test_unreadable_boundaries_only_warn():
+    ids, xyz, elements = beam(3)
+    report = check_connectivity(ids, xyz, elements, {}, unreadable=["elastic_supports"])
+    errors, warnings = connectivity_issues(report)
+    assert errors == [] and any("no supports" in w for w in warnings)
+
+
+@pytest.mark.parametrize("rx, blocked", [(False, True), (True, False)])
+def test_precheck_blocks_an_unrestrained_model(provider, rx, blocked):
+    provider.add_nodes([[i, float(i), 0.0, 0.0] for i in range(1, 6)])
+    provider.add_elements([[i, 1, 1, 1, 0, i, i + 1] for i in range(1, 5)])
+    provider.add_general_support(node_id=1, boundary_info=[True, True, True, rx, False, False])
+    provider.add_general_support(node_id=5, boundary_info=[False, True, True, rx, False, False])
+    assert bool(analysis_precheck(provider)) is blocked
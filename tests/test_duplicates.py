@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from bridge_mcp.providers.duplicates import (
+    coincident_node_groups,
+    coincident_pairs,
+    overlapping_element_groups,
+)
+
+
+def _brute_pairs(xyz: np.ndarray, tolerance: float, rows=None) -> set[tuple[int, int]]:
+    d = np.linalg.norm(xyz[:, None, :] - xyz[None, :, :], axis=2)
+    i, j = np.nonzero(np.triu(d <= tolerance, 1))
+    pairs = set(zip(i.tolist(), j.tolist()))
+    if rows is not None:
+        wanted = set(np.asarray(rows).tolist())
+        pairs = {p for p in pairs if wanted.intersection(p)}
+    return pairs
+
+
+def _cloud(seed: int, tolerance: float) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0, 20, size=(300, 3))
+    # Near-copies of some points, jittered both inside and just outside the tolerance,
+    # plus points on cell faces where the neighbour-cell probes matter.
+    jitter = rng.normal(size=(80, 3))
+    jitter *= (rng.uniform(0.2, 1.5, size=(80, 1)) * tolerance) / np.linalg.norm(jitter, axis=1, keepdims=True)
+    copies = base[:80] + jitter
+    faces = np.round(base[:40] / (4 * tolerance)) * (4 * tolerance)
+    return np.concatenate([base, copies, faces, faces + [tolerance * 0.5, 0, 0]])
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("tolerance", [1e-3, 0.05])
+def test_coincident_pairs_match_brute_force(seed, tolerance):
+    xyz = _cloud(seed, tolerance)
+    pairs = coincident_pairs(xyz, tolerance)
+    assert set(map(tuple, pairs.tolist())) == _brute_pairs(xyz, tolerance)
+
+
+def test_coincident_pairs_restricted_to_rows():
+    tolerance = 0.05
+    xyz = _cloud(4, tolerance)
+    rows = np.arange(300, len(xyz), 3)
+    pairs = coincident_pairs(xyz, tolerance, rows)
+    assert set(map(tuple, pairs.tolist())) == _brute_pairs(xyz, tolerance, rows)
+
+
+def test_coincident_node_groups_chain_pairs():
+    ids = np.array([10, 20, 30, 40])
+    xyz = np.array([[0, 0, 0], [0.6e-4, 0, 0], [1.2e-4, 0, 0], [5, 0, 0]], dtype=float)
+    assert coincident_node_groups(ids, xyz, 1e-4) == [[10, 20, 30]]
+
+
+def _frame(ids, xyz, elements):
+    records = [{"id": e, "node_ids": list(n)} for e, n in elements]
+    return records, np.array(ids), np.array(xyz, dtype=float)
+
+
+def test_duplicate_and_overlapping_elements():
+    elements, ids, xyz = _frame(
+        [1, 2, 3, 4, 5, 6],
+        [[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0], [1, 0, 0], [0, 5, 0]],
+        [
+            (1, (1, 2)), (2, (2, 1)),  # same nodes, reversed
+            (3, (5, 3)),               # node 5 coincides with node 2, so 3 duplicates 4
+            (4, (2, 3)),
+            (5, (1, 3)),               # collinear with 1 and 4, spans both
+            (6, (3, 4)),               # end to end with 4: touches, no overlap
+            (7, (1, 6)),
+        ],
+    )
+    groups = overlapping_element_groups(elements, ids, xyz, 1e-4)
+    assert {"ids": [1, 2], "kind": "duplicate"} in groups
+    assert {"ids": [3, 4], "kind": "duplicate"} in groups
+    overlap = [g["ids"] for g in groups if g["kind"] == "overlap"]
+    assert len(overlap) == 1 and 5 in overlap[0] and 6 not in overlap[0] and 7 not in overlap[0]
+
+
+def test_new_elements_filter():
+    elements, ids, xyz = _frame(
+        [1, 2, 3], [[0, 0, 0], [1, 0, 0], [2, 0, 0]],
+        [(1, (1, 2)), (2, (2, 1)), (3, (2, 3)), (4, (3, 2))],
+    )
+    assert [g["ids"] for g in overlapping_element_groups(elements, ids, xyz, 1e-4, {4})] == [[3, 4]]
+    assert overlapping_element_groups(elements, ids, xyz, 1e-4, {99}) == []
+
+
+def test_provider_incremental_check(provider):
+    provider.add_nodes([[1, 0, 0, 0], [2, 1, 0, 0], [3, 1, 0, 0], [4, 2, 0, 0]])
+    provider.add_elements([[1, 1, 1, 1, 0, 1, 2], [2, 1, 1, 1, 0, 2, 4]])
+    full = provider.find_duplicates(update_baseline=True)
+    assert full["coincident_nodes"] == [[2, 3]] and not full["incremental"]
+
+    provider.add_nodes([[5, 2, 0, 0]])
+    provider.add_elements([[3, 1, 1, 1, 0, 4, 2]])
+    again = provider.find_duplicates(incremental=True)
+    assert again["incremental"] and again["checked"] == {"nodes": 1, "elements": 1}
+    # Only groups involving the new node / element are reported.
+    assert again["coincident_nodes"] == [[4, 5]]
+    assert again["overlapping_elements"] == [{"ids": [2, 3], "kind": "duplicate"}]
+
+
+def test_validate_model_keeps_the_incremental_baseline(provider):
+    provider.add_nodes([[1, 0, 0, 0], [2, 1, 0, 0]])
+    provider.find_duplicates(update_baseline=True)
+    provider.add_nodes([[3, 1, 0, 0]])
+    provider.validate_model()
+    again = provider.find_duplicates(incremental=True)
+    assert again["checked"]["nodes"] == 1
+    assert again["coincident_nodes"] == [[2, 3]]
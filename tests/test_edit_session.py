@@ -0,0 +1,91 @@
+import time
+
+import pytest
+
+from bridge_mcp.providers.transport import BackendBusyError
+
+
+def _updates(standin) -> int:
+    return standin.stats()["by_command"].get("UPDATE", {}).get("calls", 0)
+
+
+def test_session_defers_tool_writes_to_one_refresh(provider, standin):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0], [2, 1.0, 0.0, 0.0]])
+    before = _updates(standin)
+    provider.begin_edit_session("edits", idle_timeout=0)
+    provider.update_node(1, x=0.5)
+    provider.move_nodes([2], offset_x=1.0)
+    provider.remove_nodes([1])
+    assert _updates(standin) == before
+    stats = provider.commit_edit_session()
+    assert stats["suppressed_refreshes"] == 3 and stats["closed"] == "committed"
+    assert _updates(standin) == before + 1
+
+
+def test_update_model_refreshes_inside_a_session(provider, standin):
+    provider.get_model_summary()
+    with provider.edit_session("outer"):
+        before = _updates(standin)
+        provider.update_model()
+        assert _updates(standin) == before + 1
+
+
+def test_abort_closes_every_level(provider):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0]])
+    provider.begin_edit_session("outer", idle_timeout=0)
+    provider.begin_edit_session("inner")
+    provider.update_node(1, x=2.0)
+    stats = provider.abort_edit_session()
+    assert stats["closed"] == "aborted" and stats["refreshes_issued"] == 1
+    assert not provider.get_edit_session_status()["active"]
+    with pytest.raises(RuntimeError):
+        provider.commit_edit_session()
+
+
+def test_idle_session_is_closed(provider):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0]])
+    provider.begin_edit_session("forgotten", idle_timeout=0.05)
+    provider.update_node(1, x=2.0)
+    time.sleep(0.1)
+    # The status read reports the idle session without closing it.
+    assert provider.get_edit_session_status()["idle_expired"]
+    with pytest.raises(RuntimeError, match="without writes"):
+        provider.commit_edit_session()
+    assert provider.get_edit_session_status()["last_session"]["closed"] == "idle timeout"
+
+
+def test_status_read_during_a_solve_keeps_the_session(provider, standin):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0]])
+    provider.begin_edit_session("forgotten", idle_timeout=0.05)
+    provider.update_node(1, x=2.0)
+    time.sleep(0.1)
+    with provider.cache_only():
+        status = provider.get_edit_session_status()
+    assert status["active"] and status["suppressed_refreshes"] == 1
+    # The deferred refresh is not lost: the next commit issues it.
+    before = _updates(standin)
+    with pytest.raises(RuntimeError, match="without writes"):
+        provider.commit_edit_session()
+    assert _updates(standin) == before + 1
+
+
+def test_failed_refresh_keeps_the_session_open(provider, standin):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0]])
+    provider.begin_edit_session("edits", idle_timeout=0)
+    provider.update_node(1, x=2.0)
+    with provider.cache_only():
+        with pytest.raises(BackendBusyError):
+            provider.commit_edit_session()
+    assert provider.get_edit_session_status()["active"]
+    before = _updates(standin)
+    assert provider.commit_edit_session()["refreshes_issued"] == 1
+    assert _updates(standin) == before + 1
+
+
+def test_context_manager_sessions_never_expire(provider):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0]])
+    provider._session_idle_timeout = 0.01
+    with provider.edit_session("workflow"):
+        time.sleep(0.05)
+        provider.update_node(1, x=2.0)
+        assert provider.get_edit_session_status()["active"]
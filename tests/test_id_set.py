@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from bridge_mcp.providers.id_set import IdSet, compress_ids, id_array
+from bridge_mcp.providers.qtmodel_provider import QtModelProvider
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1to5", [1, 2, 3, 4, 5]),
+    ("1to10by3", [1, 4, 7, 10]),
+    ("1to9by3", [1, 4, 7]),
+    ("1-3, 7；9", [1, 2, 3, 7, 9]),
+    ("20to30by2 4 4", [20, 22, 24, 26, 28, 30, 4, 4]),
+    ("3to3", [3]),
+    ("", []),
+])
+def test_id_array_parses_range_strings(text, expected):
+    assert id_array(text).tolist() == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (7, [7]),
+    (7.0, [7]),
+    ([3, 1, 2], [3, 1, 2]),
+    (np.array([5, 6], dtype=np.int32), [5, 6]),
+    ([1.0, 2.0], [1, 2]),
+    (None, []),
+])
+def test_id_array_accepts_scalars_and_sequences(value, expected):
+    assert id_array(value).tolist() == expected
+
+
+@pytest.mark.parametrize("bad", ["5to1", "1to5by0", "1to5by-2", "1 x 3", "1to5byx", 2.5, [1, 2.5], ["a"]])
+def test_id_array_rejects_invalid_input(bad):
+    with pytest.raises(ValueError):
+        id_array(bad)
+
+
+def test_parse_sorts_deduplicates_and_validates():
+    assert IdSet.parse("1to5 3 9") == IdSet.parse([9, 1, 2, 3, 4, 5])
+    assert str(IdSet.parse([9, 1, 2, 3, 4, 5])) == "1to5 9"
+    with pytest.raises(ValueError):
+        IdSet.parse([0, 1])
+
+
+@pytest.mark.parametrize("ids", [
+    [1],
+    [1, 2],
+    [1, 2, 3, 10, 20, 30, 40, 41, 43],
+    list(range(1, 100001)),
+    list(range(5, 500, 7)) + [1000, 1001, 1003],
+])
+def test_string_round_trip(ids):
+    ids_set = IdSet.parse(ids)
+    assert IdSet.parse(ids_set.to_string()) == ids_set
+    assert IdSet.parse(ids_set.encode()) == ids_set
+
+
+def test_random_round_trip():
+    rng = np.random.default_rng(3)
+    for _ in range(50):
+        values = np.unique(rng.integers(1, 300, size=rng.integers(1, 120)))
+        ids_set = IdSet.parse(values)
+        assert IdSet.parse(str(ids_set)).tolist() == values.tolist()
+        assert IdSet.parse(ids_set.encode()).tolist() == values.tolist()
+
+
+def test_encode_picks_the_compact_form():
+    assert IdSet.parse([4]).encode() == 4
+    assert IdSet.parse(range(1, 101)).encode() == "1to100"
+    assert IdSet.parse([1, 5, 12, 40]).encode() == [1, 5, 12, 40]
+    assert compress_ids([3, 1, 2, 7]) == "1to3 7"
+
+
+def test_membership():
+    ids_set = IdSet.parse("10to20by5")
+    assert 15 in ids_set and 16 not in ids_set and 25 not in ids_set
+
+
+@pytest.mark.parametrize("mirror", [True, False])
+def test_reads_keep_the_callers_order(standin, mirror):
+    provider = QtModelProvider({"server_url": standin.url, "model_mirror": mirror})
+    provider.add_nodes([[i, float(i), 0.0, 0.0] for i in range(1, 7)])
+    provider.add_elements([[i, 1, 1, 1, 0, i, i + 1] for i in range(1, 6)])
+    assert [n["id"] for n in provider.get_node_data([5, 1, 3])] == [5, 1, 3]
+    assert [e["id"] for e in provider.get_element_data("4 2")] == [4, 2]
+    assert [n["id"] for n in provider.get_node_data("2to4")] == [2, 3, 4]
+
+
+@pytest.mark.parametrize("mirror", [True, False])
+@pytest.mark.parametrize("ids", ["5to1", "1to5by0", ",,"])
+def test_removals_without_ids_leave_the_model_untouched(standin, mirror, ids):
+    provider = QtModelProvider({"server_url": standin.url, "model_mirror": mirror})
+    provider.add_nodes([[i, float(i), 0.0, 0.0] for i in range(1, 7)])
+    provider.add_elements([[i, 1, 1, 1, 0, i, i + 1] for i in range(1, 6)])
+    with pytest.raises(ValueError):
+        provider.remove_nodes(ids)
+    with pytest.raises(ValueError):
+        provider.remove_elements(ids)
+    assert len(provider.get_node_data()) == 6
+    assert len(provider.get_element_data()) == 5
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from bridge_mcp.jobs import AnalysisJobs
+from bridge_mcp.providers.qtmodel_provider import QtModelProvider
+from bridge_mcp.worker import BackendWorker
+
+
+@pytest.fixture
+def jobs(standin):
+    """Jobs on a provider whose read timeout is shorter than the stand-in solve."""
+    provider = QtModelProvider({"server_url": standin.url, "read_timeout": 0.3})
+    standin.solve_seconds = 1.0
+    worker = BackendWorker(provider)
+    yield AnalysisJobs(worker, provider)
+    worker.shutdown()
+
+
+def test_job_outlives_the_read_timeout(jobs):
+    async def scenario():
+        first = jobs.submit(skip_check=True, force=True)
+        second = jobs.submit(skip_check=True, force=True)
+        await asyncio.sleep(0.6)
+        # Past the read timeout the first solve still holds the backend slot.
+        held = (first.state, second.state, jobs.worker.busy)
+        assert await jobs.wait(second, 30.0, interval=0.1)
+        return first, second, held
+
+    first, second, held = asyncio.run(scenario())
+    assert held == ("running", "queued", True)
+    assert first.state == "completed", first.message
+    assert second.state == "completed", second.message
+    assert second.started_at >= first.started_at + 1.0
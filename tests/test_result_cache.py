@@ -0,0 +1,32 @@
+import json
+
+import qtmodel
+
+from bridge_mcp.providers.result_parser import from_columns, to_columns
+
+# Ragged records: a key missing from one row, ints and floats in one
+# column, and an empty nested dict.
+RAGGED = [
+    {"id": 1, "ux": 1, "extra": {"note": "a"}, "empty": {}},
+    {"id": 2, "ux": 2.5},
+]
+
+
+def test_columns_round_trip_is_stable():
+    once = from_columns(to_columns(RAGGED))
+    assert from_columns(to_columns(once)) == once
+
+
+def test_cache_hit_matches_the_first_call(provider, monkeypatch):
+    provider.add_nodes([[1, 0.0, 0.0, 0.0], [2, 1.0, 0.0, 0.0]])
+    calls = []
+
+    def get_deformation(**kwargs):
+        calls.append(kwargs)
+        return json.dumps(RAGGED)
+
+    monkeypatch.setattr(qtmodel.odb, "get_deformation", get_deformation)
+    first = provider.get_deformation([1, 2], stage_id=1)
+    second = provider.get_deformation([1, 2], stage_id=1)
+    assert len(calls) == 1
+    assert first == second == from_columns(to_columns(RAGGED))
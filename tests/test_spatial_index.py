@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from bridge_mcp.providers.spatial_index import SpatialIndex
+
+
+def _random_index(n: int = 400, seed: int = 7) -> SpatialIndex:
+    rng = np.random.default_rng(seed)
+    xyz = rng.uniform(-50, 50, size=(n, 3)) * [1.0, 0.2, 0.05]
+    index = SpatialIndex()
+    index.load_nodes([{"id": 10 + 3 * k, "x": x, "y": y, "z": z} for k, (x, y, z) in enumerate(xyz.tolist())])
+    return index
+
+
+def _distances(index: SpatialIndex, point: list[float]) -> np.ndarray:
+    return np.linalg.norm(index.xyz - np.asarray(point), axis=1)
+
+
+POINTS = [[0.0, 0.0, 0.0], [12.5, -3.0, 1.0], [49.0, 9.0, 2.0], [300.0, 0.0, -40.0]]
+
+
+@pytest.mark.parametrize("point", POINTS)
+@pytest.mark.parametrize("count", [1, 5, 40])
+def test_nearest_matches_brute_force(point, count):
+    index = _random_index()
+    d = _distances(index, point)
+    expected = np.sort(d)[:count]
+    hits = index.nearest(point, count)
+    assert len(hits) == count
+    assert np.allclose([h["distance"] for h in hits], expected)
+
+
+@pytest.mark.parametrize("point", POINTS)
+@pytest.mark.parametrize("radius", [0.5, 4.0, 25.0])
+def test_within_matches_brute_force(point, radius):
+    index = _random_index()
+    d = _distances(index, point)
+    expected = set(index.ids[d <= radius].tolist())
+    hits = index.within(point, radius)
+    assert {h["id"] for h in hits} == expected
+    assert [h["distance"] for h in hits] == sorted(h["distance"] for h in hits)
+
+
+def test_in_box_matches_brute_force():
+    index = _random_index()
+    lo, hi = [-10.0, -2.0, -1.0], [20.0, 5.0, 1.0]
+    inside = ((index.xyz >= lo) & (index.xyz <= hi)).all(axis=1)
+    assert [h["id"] for h in index.in_box(hi, lo)] == sorted(index.ids[inside].tolist())
+
+
+def test_node_edits_keep_grid_in_sync():
+    index = _random_index(50)
+    index.upsert([1000], [[500.0, 0.0, 0.0]])
+    index.move([1000], 1.0, 0.0, 0.0)
+    assert index.nearest([501.0, 0.0, 0.0])[0]["id"] == 1000
+    index.remove([1000])
+    assert 1000 not in {h["id"] for h in index.within([501.0, 0.0, 0.0], 100.0)}
+
+
+def _add_line(provider, count: int) -> None:
+    provider.add_nodes([[i + 1, float(i), 0.0, 0.0] for i in range(count + 1)])
+    provider.add_elements([[i + 1, 1, 1, 1, 0.0, i + 1, i + 2] for i in range(count)])
+
+
+def _element_ids_at(provider, x: float) -> list[int]:
+    return sorted(h["id"] for h in provider.find_elements_at_point(x, 0.0, 0.0, tolerance=1e-6))
+
+
+def test_find_elements_at_point_follows_element_writes(provider):
+    _add_line(provider, 4)
+    assert _element_ids_at(provider, 1.5) == [2]
+
+    # Explicit-ID add: a second element over the same span.
+    provider.add_elements([[10, 1, 1, 1, 0.0, 2, 3]])
+    assert _element_ids_at(provider, 1.5) == [2, 10]
+
+    provider.remove_elements([2])
+    assert _element_ids_at(provider, 1.5) == [10]
+
+    provider.update_element_node(10, [4, 5])
+    assert _element_ids_at(provider, 1.5) == []
+    assert _element_ids_at(provider, 3.5) == [4, 10]
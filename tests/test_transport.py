@@ -0,0 +1,33 @@
+import pytest
+
+from bridge_mcp.providers.qtmodel_provider import QtModelProvider
+from bridge_mcp.providers.transport import QtTransport
+
+
+def test_configured_read_timeout_applies(standin):
+    provider = QtModelProvider({"server_url": standin.url, "read_timeout": 0.3})
+    provider.get_model_summary()
+    standin.latency_ms = 800
+    with pytest.raises(Exception, match="0.3"):
+        provider.get_node_data()
+
+
+def test_solve_waits_for_solve_timeout(standin):
+    provider = QtModelProvider({"server_url": standin.url, "read_timeout": 0.3})
+    standin.solve_seconds = 1.0
+    result = provider.run_analysis(force=True)
+    assert not result["skipped"] and provider.get_analysis_history()["solves"][-1]["ok"]
+
+
+def test_solve_timeout_applies(standin):
+    provider = QtModelProvider({"server_url": standin.url, "solve_timeout": 0.3})
+    standin.solve_seconds = 1.0
+    with pytest.raises(Exception, match="0.3"):
+        provider.run_analysis(force=True)
+
+
+def test_explicit_read_timeout_overrides_the_configured_one(standin):
+    transport = QtTransport({"server_url": standin.url, "read_timeout": 30})
+    standin.latency_ms = 800
+    with pytest.raises(Exception, match="0.3"):
+        transport.send_dict("GET-NODE-DATA", read_timeout=0.3)
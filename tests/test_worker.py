@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from bridge_mcp.worker import READ_ONLY_TOOLS, BackendWorker, WorkerMCP
+
+
+@pytest.fixture
+def served(provider):
+    """A WorkerMCP whose get_nodes tool reads the mirror and solve tool runs an analysis."""
+    worker = BackendWorker(provider)
+    mcp = WorkerMCP("worker-test", worker=worker)
+    threads = {}
+
+    @mcp.tool()
+    def get_nodes() -> str:
+        threads["get_nodes"] = threading.current_thread().name
+        return str(len(provider.get_node_data()))
+
+    @mcp.tool()
+    def solve() -> str:
+        provider.run_analysis(force=True)
+        return "solved"
+
+    @mcp.tool()
+    def crunch(seconds: float) -> str:
+        # Local work between backend calls keeps the provider state locked.
+        time.sleep(seconds)
+        return "done"
+
+    provider.add_nodes([[1, 0.0, 0.0, 0.0], [2, 1.0, 0.0, 0.0]])
+    provider.get_node_data()
+    yield mcp, threads
+    worker.shutdown()
+
+
+async def _call(mcp, name, args=None):
+    start = time.perf_counter()
+    _, result = await mcp.call_tool(name, args or {})
+    return result["result"], time.perf_counter() - start
+
+
+def test_tools_are_wrapped_at_registration(served):
+    mcp, threads = served
+    assert "get_nodes" in READ_ONLY_TOOLS and "solve" not in READ_ONLY_TOOLS
+    assert not asyncio.iscoroutinefunction(mcp.backend_tools["get_nodes"].fn)
+    assert asyncio.run(_call(mcp, "get_nodes"))[0] == "2"
+    assert threads["get_nodes"].startswith("bridge-backend")
+
+
+def test_reads_answered_from_cache_during_a_solve(served, standin):
+    mcp, threads = served
+    standin.solve_seconds = 0.5
+
+    async def scenario():
+        solve = asyncio.create_task(_call(mcp, "solve"))
+        await asyncio.sleep(0.15)
+        read = await _call(mcp, "get_nodes")
+        return read, await solve
+
+    (count, read_s), (solved, solve_s) = asyncio.run(scenario())
+    assert (count, solved) == ("2", "solved")
+    assert threads["get_nodes"].startswith("bridge-reader")
+    assert read_s < 0.3 < solve_s
+
+
+def test_reader_waits_while_the_backend_thread_updates_state(served):
+    mcp, threads = served
+
+    async def scenario():
+        busy = asyncio.create_task(_call(mcp, "crunch", {"seconds": 0.3}))
+        await asyncio.sleep(0.05)
+        read = await _call(mcp, "get_nodes")
+        return read, await busy
+
+    (count, read_s), _ = asyncio.run(scenario())
+    assert count == "2" and threads["get_nodes"].startswith("bridge-reader")
+    assert read_s >= 0.2
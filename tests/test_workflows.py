@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from bridge_mcp.tools import register_modeling_tools
+from bridge_mcp.tools.workflows import register_workflow_tools
+from bridge_mcp.worker import WorkerMCP
+
+
+@pytest.fixture
+def call(provider):
+    mcp = WorkerMCP("workflow-test")
+    register_modeling_tools(mcp, provider)
+    register_workflow_tools(mcp, provider)
+
+    def run(name, **args):
+        _, result = asyncio.run(mcp.call_tool(name, args))
+        return result["result"]
+
+    return run
+
+
+@pytest.mark.parametrize("workflow, args", [
+    ("create_simple_beam_bridge", {"span": 30, "num_elements": 10}),
+    ("create_continuous_beam_bridge", {"spans": [30, 40, 30], "num_elements_per_span": 6}),
+])
+def test_workflow_model_passes_the_precheck_and_solves(call, workflow, args):
+    built = call(workflow, **args)
+    assert not built.startswith("Error"), built
+    solved = call("run_analysis")
+    assert solved.startswith("Analysis successfully completed"), solved